@@ -0,0 +1,381 @@
+"""Typed season high records, one at a time or as a columnar batch."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+__all__ = ["Achievement", "AchievementBatch", "as_achievement"]
+
+
+class Achievement(NamedTuple):
+    """
+    One season high: a player's single-game total of a statistic.
+
+    The fields are named like the columns of the season high table, and
+    ``achievement["Player"]`` works like ``achievement.Player`` for callers
+    written against the dictionaries this type replaced.
+
+    Attributes
+    ----------
+    Statistic : str
+        Name of the statistic, as in the table (upper case)
+    Value : Any
+        The total, usually a number
+    Player : str
+        Player name
+    Opponent : str
+        Opponent with the game date, e.g. 'Team A (3/15/2024)'
+    Date : datetime.date, optional
+        Game date, None when the opponent has none
+    """
+
+    Statistic: str
+    Value: Any
+    Player: str
+    Opponent: str
+    Date: Optional[datetime.date] = None
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+
+def as_achievement(high: Achievement | Mapping[str, Any]) -> Achievement:
+    """
+    Get an Achievement from an Achievement or a dictionary with the same keys.
+
+    Parameters
+    ----------
+    high : Achievement | Mapping[str, Any]
+        Record with Statistic, Value, Player and Opponent, optionally Date
+
+    Returns
+    -------
+    Achievement
+        The record itself if it already is one
+    """
+    if isinstance(high, Achievement):
+        return high
+    return Achievement(
+        high["Statistic"], high["Value"], high["Player"], high["Opponent"], high.get("Date")
+    )
+
+
+class AchievementBatch:
+    """
+    Many achievements stored column by column.
+
+    Statistic, Player and Opponent are categorical: an integer code per row
+    into a sorted tuple of distinct names, so a season (or many) costs a few
+    bytes per achievement and grouping works on the codes without hashing
+    any strings. Rows become `Achievement` tuples only when iterated.
+
+    Attributes
+    ----------
+    statistics, players, opponents : tuple[str, ...]
+        Sorted distinct names the codes point into
+    statistic_codes, player_codes, opponent_codes : np.ndarray
+        Per row, the index of its name
+    values : np.ndarray
+        Per row, the total
+    dates : np.ndarray
+        Per row, the game date as datetime64[D] (NaT when unknown)
+    """
+
+    __slots__ = [
+        "statistics",
+        "players",
+        "opponents",
+        "statistic_codes",
+        "player_codes",
+        "opponent_codes",
+        "values",
+        "dates",
+    ]
+
+    def __init__(
+        self,
+        statistics: tuple[str, ...],
+        players: tuple[str, ...],
+        opponents: tuple[str, ...],
+        statistic_codes: np.ndarray,
+        player_codes: np.ndarray,
+        opponent_codes: np.ndarray,
+        values: np.ndarray,
+        dates: np.ndarray,
+    ) -> None:
+        self.statistics = statistics
+        self.players = players
+        self.opponents = opponents
+        self.statistic_codes = statistic_codes
+        self.player_codes = player_codes
+        self.opponent_codes = opponent_codes
+        self.values = values
+        self.dates = dates
+
+    @classmethod
+    def from_frame(cls, long: pd.DataFrame) -> AchievementBatch:
+        """
+        Build a batch from a long season high frame.
+
+        Parameters
+        ----------
+        long : pd.DataFrame
+            Columns Statistic, Value, Player, Opponent and Date, as
+            `Sport._season_highs_long` returns them
+
+        Returns
+        -------
+        AchievementBatch
+            One row per frame row, in frame order
+        """
+        import pandas as pd
+
+        dates = long["Date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        columns = {}
+        for name in ("Statistic", "Player", "Opponent"):
+            cat = pd.Categorical(long[name].astype(str))
+            columns[name] = (tuple(cat.categories), cat.codes.copy())
+        return cls(
+            columns["Statistic"][0],
+            columns["Player"][0],
+            columns["Opponent"][0],
+            columns["Statistic"][1],
+            columns["Player"][1],
+            columns["Opponent"][1],
+            long["Value"].to_numpy(),
+            dates.to_numpy().astype("datetime64[D]"),
+        )
+
+    @classmethod
+    def from_achievements(
+        cls, highs: Iterable[Achievement | Mapping[str, Any]]
+    ) -> AchievementBatch:
+        """
+        Build a batch from single achievements.
+
+        Parameters
+        ----------
+        highs : Iterable[Achievement | Mapping[str, Any]]
+            Achievements, or dictionaries with the same keys
+
+        Returns
+        -------
+        AchievementBatch
+            One row per achievement, in order
+        """
+        import pandas as pd
+
+        rows = [as_achievement(high) for high in highs]
+        frame = pd.DataFrame(rows, columns=list(Achievement._fields))
+        return cls.from_frame(frame)
+
+    @classmethod
+    def concat(cls, batches: Iterable[AchievementBatch]) -> AchievementBatch:
+        """
+        Join batches, e.g. several seasons, into one.
+
+        Parameters
+        ----------
+        batches : Iterable[AchievementBatch]
+            Batches in the order their rows should appear
+
+        Returns
+        -------
+        AchievementBatch
+            Every row of every batch, recoded against the merged names
+        """
+        import numpy as np
+
+        batches = list(batches)
+        if not batches:
+            return cls.from_achievements([])
+
+        def merge(names_of, codes_of):
+            names = tuple(sorted(set().union(*(names_of(b) for b in batches))))
+            lookup = {name: i for i, name in enumerate(names)}
+            codes = np.concatenate(
+                [
+                    np.array([lookup[n] for n in names_of(b)], dtype=np.int32)[codes_of(b)]
+                    if len(codes_of(b))
+                    else np.empty(0, dtype=np.int32)
+                    for b in batches
+                ]
+            )
+            return names, codes
+
+        statistics, statistic_codes = merge(lambda b: b.statistics, lambda b: b.statistic_codes)
+        players, player_codes = merge(lambda b: b.players, lambda b: b.player_codes)
+        opponents, opponent_codes = merge(lambda b: b.opponents, lambda b: b.opponent_codes)
+        return cls(
+            statistics,
+            players,
+            opponents,
+            statistic_codes,
+            player_codes,
+            opponent_codes,
+            np.concatenate([b.values for b in batches]),
+            np.concatenate([b.dates for b in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.player_codes)
+
+    def __repr__(self) -> str:
+        return (
+            f"AchievementBatch({len(self)} achievements, {len(self.players)} players, "
+            f"{len(self.statistics)} statistics)"
+        )
+
+    def _row(self, i: int) -> Achievement:
+        date = self.dates[i]
+        return Achievement(
+            self.statistics[self.statistic_codes[i]],
+            self.values[i].item() if hasattr(self.values[i], "item") else self.values[i],
+            self.players[self.player_codes[i]],
+            self.opponents[self.opponent_codes[i]],
+            None if date != date else date.item(),  # NaT is not equal to itself
+        )
+
+    def __getitem__(self, i: int) -> Achievement:
+        return self._row(range(len(self))[i])
+
+    def __iter__(self) -> Iterator[Achievement]:
+        # tolist converts whole columns to Python objects at once, NaT to None
+        return map(
+            Achievement._make,
+            zip(
+                [self.statistics[c] for c in self.statistic_codes.tolist()],
+                self.values.tolist(),
+                [self.players[c] for c in self.player_codes.tolist()],
+                [self.opponents[c] for c in self.opponent_codes.tolist()],
+                self.dates.tolist(),
+            ),
+        )
+
+    def take(self, rows: np.ndarray) -> AchievementBatch:
+        """
+        Select rows by position or boolean mask.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Integer positions or a boolean mask
+
+        Returns
+        -------
+        AchievementBatch
+            The selected rows, sharing the name tuples
+        """
+        return AchievementBatch(
+            self.statistics,
+            self.players,
+            self.opponents,
+            self.statistic_codes[rows],
+            self.player_codes[rows],
+            self.opponent_codes[rows],
+            self.values[rows],
+            self.dates[rows],
+        )
+
+    def is_statistic_in(self, statistics: Iterable[str]) -> np.ndarray:
+        """
+        Mask the rows whose statistic, upper cased, is one of the given names.
+
+        Parameters
+        ----------
+        statistics : Iterable[str]
+            Upper case statistic names
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, one check per distinct statistic instead of per row
+        """
+        import numpy as np
+
+        wanted = set(statistics)
+        hits = np.array([name.upper() in wanted for name in self.statistics], dtype=bool)
+        return hits[self.statistic_codes] if len(self.statistics) else np.zeros(0, bool)
+
+    def on(self, date: datetime.date) -> AchievementBatch:
+        """
+        Select the achievements of one game date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The game date
+
+        Returns
+        -------
+        AchievementBatch
+            The rows with that date, in order
+        """
+        import numpy as np
+
+        return self.take(self.dates == np.datetime64(date, "D"))
+
+    def by_date(self) -> dict[datetime.date, list[Achievement]]:
+        """
+        Index the dated achievements by game date.
+
+        Returns
+        -------
+        dict[datetime.date, list[Achievement]]
+            Game date to its achievements, in order
+        """
+        index: dict[datetime.date, list[Achievement]] = {}
+        for high in self:
+            if high.Date is not None:
+                index.setdefault(high.Date, []).append(high)
+        return index
+
+    def group_by_player(self) -> list[AchievementBatch]:
+        """
+        Split the batch into one batch per player.
+
+        Works on the player codes: one stable sort, then a cut wherever the
+        code changes.
+
+        Returns
+        -------
+        list[AchievementBatch]
+            One batch per player, sorted by player name, rows in their
+            original order within each player
+        """
+        import numpy as np
+
+        if not len(self):
+            return []
+        order = np.argsort(self.player_codes, kind="stable")
+        codes = self.player_codes[order]
+        cuts = np.flatnonzero(np.diff(codes)) + 1
+        return [self.take(rows) for rows in np.split(order, cuts)]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes held by the per-row arrays, the name tuples excluded.
+        """
+        return sum(
+            a.nbytes
+            for a in (
+                self.statistic_codes,
+                self.player_codes,
+                self.opponent_codes,
+                self.values,
+                self.dates,
+            )
+        )
@@ -0,0 +1,267 @@
+"""Multi-season SQLite archive of season high tables in long format."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .sports import Sport
+
+__all__ = ["Archive"]
+
+
+# sqlite file used unless LOUIESBURNER_ARCHIVE says otherwise
+DEFAULT_ARCHIVE_PATH: str = ".cache/archive.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    sport TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (sport, year)
+);
+CREATE TABLE IF NOT EXISTS highs (
+    sport TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    statistic TEXT NOT NULL,
+    value REAL,
+    value_text TEXT NOT NULL,
+    player TEXT NOT NULL,
+    opponent TEXT NOT NULL,
+    date TEXT,
+    PRIMARY KEY (sport, year, statistic, player, opponent, value_text)
+);
+CREATE INDEX IF NOT EXISTS highs_by_statistic ON highs (sport, statistic, value, year);
+"""
+
+
+def _as_number(value: Any) -> Optional[float]:
+    # innings pitched like '7.1' sort fine as floats, '-' and blanks are NULL
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Archive:
+    """
+    SQLite archive of every season's season high tables.
+
+    Achievements are stored one row per (statistic, player, opponent, value),
+    as `Sport._season_highs_long` produces them, and queried through an index
+    on (sport, statistic, value). Seasons are ingested incrementally: a past
+    season is fetched once and never again, and nothing is written when the
+    current season's table is unchanged. When it did change, the season's
+    rows are replaced, so a corrected or superseded high is not kept.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        Location of the sqlite database
+    """
+
+    def __init__(self, path: Optional[str | os.PathLike] = None) -> None:
+        """
+        Initialize an Archive, creating the database if needed.
+
+        Parameters
+        ----------
+        path : str | os.PathLike, optional
+            Database file, by default ``$LOUIESBURNER_ARCHIVE`` or ``.cache/archive.sqlite3``
+        """
+        if path is None:
+            path = os.environ.get("LOUIESBURNER_ARCHIVE", DEFAULT_ARCHIVE_PATH)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def seasons(self, sport: str) -> list[int]:
+        """
+        Get the archived seasons of a sport.
+
+        Parameters
+        ----------
+        sport : str
+            The sport to look up
+
+        Returns
+        -------
+        list[int]
+            Season years, ascending
+        """
+        rows = self._conn.execute(
+            "SELECT year FROM seasons WHERE sport = ? ORDER BY year", (sport,)
+        )
+        return [year for (year,) in rows]
+
+    def ingest(self, sport_obj: Sport) -> int:
+        """
+        Add the season high table of a loaded season.
+
+        Parameters
+        ----------
+        sport_obj : Sport
+            The season to archive, its table is fetched if not loaded yet
+
+        Returns
+        -------
+        int
+            Number of achievements that were not archived before
+        """
+        long = sport_obj._season_highs_long()
+        content_hash = hashlib.sha256(
+            long[["Statistic", "Value", "Player", "Opponent"]]
+            .astype(str)
+            .to_csv(index=False)
+            .encode()
+        ).hexdigest()
+
+        key = (sport_obj.sport, sport_obj.year)
+        row = self._conn.execute(
+            "SELECT content_hash FROM seasons WHERE sport = ? AND year = ?", key
+        ).fetchone()
+        if row is not None and row[0] == content_hash:
+            return 0
+
+        dates = [
+            d if isinstance(d, str) else None
+            for d in long["Date"].dt.strftime("%Y-%m-%d").tolist()
+        ]
+        rows = [
+            (*key, str(stat).upper(), _as_number(value), str(value), player, opp, date)
+            for stat, value, player, opp, date in zip(
+                long["Statistic"], long["Value"], long["Player"], long["Opponent"], dates
+            )
+        ]
+        with self._conn:
+            archived = set(
+                self._conn.execute(
+                    "SELECT statistic, player, opponent, value_text FROM highs "
+                    "WHERE sport = ? AND year = ?",
+                    key,
+                )
+            )
+            self._conn.execute("DELETE FROM highs WHERE sport = ? AND year = ?", key)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO highs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            added = len({(row[2], row[5], row[6], row[4]) for row in rows} - archived)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?)",
+                (*key, content_hash, _now()),
+            )
+        return added
+
+    def ingest_seasons(
+        self,
+        sport: str,
+        years: Iterable[int],
+        today: Optional[datetime.date] = None,
+    ) -> dict[int, int | Exception]:
+        """
+        Archive several seasons of a sport, skipping the ones already closed.
+
+        A season before the current year that is already archived is final
+        and is not fetched again. The others are loaded in parallel, see
+        `SeasonCollection`, and a season failing to load does not stop the
+        others from being archived.
+
+        Parameters
+        ----------
+        sport : str
+            Name of the sport, a key of SPORTS
+        years : Iterable[int]
+            Seasons to archive
+        today : datetime.date, optional
+            Reference date deciding which season is current, by default today
+
+        Returns
+        -------
+        dict[int, int | Exception]
+            Per fetched season, the number of new achievements or the
+            exception that made loading it fail
+        """
+        from .seasons import SeasonCollection
+
+        current = (today or datetime.date.today()).year
+        archived = set(self.seasons(sport))
+        years = [year for year in years if year >= current or year not in archived]
+        if not years:
+            return {}
+        collection = SeasonCollection(sport, years).load()
+        added: dict[int, int | Exception] = {
+            season.year: self.ingest(season) for season in collection
+        }
+        added.update(collection.errors)
+        return dict(sorted(added.items()))
+
+    def best(
+        self,
+        sport: str,
+        statistic: str,
+        since: Optional[int] = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the highest single-game totals of a statistic across seasons.
+
+        Parameters
+        ----------
+        sport : str
+            The sport to look up
+        statistic : str
+            Statistic as named in the season high tables, case insensitive
+        since : int, optional
+            First season to consider, by default every archived season
+        limit : int, optional
+            Number of achievements to return, by default 10
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Achievements with the keys Year, Statistic (upper case), Value, Player,
+            Opponent and Date (a datetime.date or None), best first
+        """
+        # walk highs_by_statistic backwards instead of sorting the season range
+        rows = self._conn.execute(
+            """
+            SELECT year, statistic, value_text, player, opponent, date FROM highs
+            WHERE sport = ? AND statistic = ? AND +year >= ? AND value IS NOT NULL
+            ORDER BY value DESC, year DESC LIMIT ?
+            """,
+            (sport, statistic.upper(), since if since is not None else 0, limit),
+        )
+        return [
+            {
+                "Year": year,
+                "Statistic": stat,
+                "Value": value,
+                "Player": player,
+                "Opponent": opponent,
+                "Date": datetime.date.fromisoformat(date) if date else None,
+            }
+            for year, stat, value, player, opponent, date in rows
+        ]
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
@@ -0,0 +1,289 @@
+"""On-disk page cache with conditional GET revalidation."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .session import fetch
+from .utils import ROOT_URL
+
+__all__ = ["PageCache", "fetch_page", "get_default_cache"]
+
+
+# where cached pages live unless LOUIESBURNER_CACHE_DIR says otherwise
+DEFAULT_CACHE_DIR: str = ".cache/pages"
+
+# pages younger than this are served straight from disk without a request
+DEFAULT_TTL: int = 15 * 60
+
+# total size of cached page bodies before the least recently used get evicted
+DEFAULT_MAX_BYTES: int = 50 * 1024 * 1024
+
+
+class PageCache:
+    """
+    Persistent cache of gvsulakers pages keyed by (sport, year, page).
+
+    Entries younger than ``ttl`` seconds are served from disk. Older entries
+    are revalidated with ``If-None-Match`` / ``If-Modified-Since`` and a
+    ``304 Not Modified`` response is served from disk as well. Once the
+    cached bodies grow past ``max_bytes`` the least recently used entries are
+    evicted.
+
+    Attributes
+    ----------
+    root : pathlib.Path
+        Directory holding the cached bodies and their metadata
+    ttl : float
+        Seconds an entry is considered fresh without revalidation
+    max_bytes : int
+        Upper bound on the combined size of cached bodies
+    """
+
+    def __init__(
+        self,
+        root: Optional[str | os.PathLike] = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize a PageCache.
+
+        Parameters
+        ----------
+        root : str | os.PathLike, optional
+            Cache directory, by default ``$LOUIESBURNER_CACHE_DIR`` or ``.cache/pages``
+        ttl : float, optional
+            Freshness lifetime of an entry in seconds, by default 15 minutes
+        max_bytes : int, optional
+            Size bound for all cached bodies, by default 50 MiB
+        """
+        if root is None:
+            root = os.environ.get("LOUIESBURNER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(sport: str, year: int, page: str) -> str:
+        """
+        Build the file stem used for a (sport, year, page) entry.
+
+        Parameters
+        ----------
+        sport : str
+            Sport identifier used in the gvsulakers URL
+        year : int
+            Season year
+        page : str
+            Page name, e.g. "stats" or "schedule"
+
+        Returns
+        -------
+        str
+            Filesystem-safe key for the entry
+        """
+        raw = f"{sport}-{year}-{page}"
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in raw)
+        if safe == raw:
+            return safe
+        return f"{safe}-{hashlib.sha1(raw.encode()).hexdigest()[:8]}"
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.html", self.root / f"{key}.json"
+
+    def load(self, key: str) -> tuple[Optional[str], dict]:
+        """
+        Read a cached body and its metadata.
+
+        Parameters
+        ----------
+        key : str
+            Entry key as returned by `key`
+
+        Returns
+        -------
+        tuple[Optional[str], dict]
+            The cached body (None when missing) and its metadata
+        """
+        body_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None, {}
+        return body, meta
+
+    def store(self, key: str, body: str, meta: dict) -> None:
+        """
+        Write a body and its metadata, then enforce the size bound.
+
+        Parameters
+        ----------
+        key : str
+            Entry key as returned by `key`
+        body : str
+            Page body to cache
+        meta : dict
+            Metadata such as url, etag, last_modified and fetched_at
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(key)
+        body_path.write_text(body, encoding="utf-8")
+        meta_path.write_text(json.dumps(meta))
+        self.evict()
+
+    def _touch(self, key: str, meta: dict) -> None:
+        body_path, meta_path = self._paths(key)
+        meta_path.write_text(json.dumps(meta))
+        os.utime(body_path)
+
+    def evict(self) -> None:
+        """
+        Delete least recently used entries until the cache fits in `max_bytes`.
+        """
+        if not self.root.is_dir():
+            return
+        bodies = []
+        for path in self.root.glob("*.html"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            bodies.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in bodies)
+        for _, size, path in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+
+    def get(
+        self,
+        url: str,
+        sport: str,
+        year: int,
+        page: str = "stats",
+        max_age: Optional[float] = None,
+    ) -> str:
+        """
+        Return the body of a page, using the cache whenever possible.
+
+        Parameters
+        ----------
+        url : str
+            URL to fetch when the entry is missing or stale
+        sport : str
+            Sport identifier used in the cache key
+        year : int
+            Season year used in the cache key
+        page : str, optional
+            Page name used in the cache key, by default "stats"
+        max_age : float, optional
+            Seconds a cached entry may be served without revalidation, by
+            default ``ttl``; 0 always sends a conditional request
+
+        Returns
+        -------
+        str
+            The page body
+
+        Raises
+        ------
+        requests.HTTPError
+            If the server responds with an error status
+        """
+        key = self.key(sport, year, page)
+        body, meta = self.load(key)
+        now = time.time()
+        ttl = self.ttl if max_age is None else max_age
+
+        if body is not None and meta.get("url") == url:
+            if now - meta.get("fetched_at", 0) < ttl:
+                os.utime(self._paths(key)[0])
+                return body
+
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        else:
+            body, meta, headers = None, {}, {}
+
+        resp = fetch(url, headers=headers)
+        if resp.status_code == 304 and body is not None:
+            meta["fetched_at"] = now
+            self._touch(key, meta)
+            return body
+
+        resp.raise_for_status()
+        body = resp.text
+        self.store(
+            key,
+            body,
+            {
+                "url": url,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": now,
+            },
+        )
+        return body
+
+
+_default_cache: Optional[PageCache] = None
+
+
+def get_default_cache() -> PageCache:
+    """
+    Get the process-wide PageCache, creating it on first use.
+
+    Returns
+    -------
+    PageCache
+        The shared cache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PageCache()
+    return _default_cache
+
+
+def fetch_page(
+    sport: str,
+    year: int,
+    page: str = "stats",
+    url: str = "",
+    max_age: Optional[float] = None,
+) -> str:
+    """
+    Fetch a gvsulakers page through the shared on-disk cache.
+
+    Parameters
+    ----------
+    sport : str
+        Sport identifier used in the gvsulakers URL
+    year : int
+        Season year
+    page : str, optional
+        Page name, by default "stats"
+    url : str, optional
+        Explicit URL, by default built from ``{ROOT_URL}/{page}/{year}``
+    max_age : float, optional
+        Seconds a cached copy may be served without revalidation, by default
+        the cache's TTL; 0 always sends a conditional request
+
+    Returns
+    -------
+    str
+        The page body
+    """
+    if not url:
+        url = f"{ROOT_URL.format(sport=sport)}/{page}/{year}"
+    return get_default_cache().get(url, sport=sport, year=year, page=page, max_age=max_age)
@@ -0,0 +1,219 @@
+"""Long-running scheduler that checks every sport after its games."""
+
+import asyncio
+import datetime
+from bisect import bisect_left
+from functools import partial
+from typing import Callable, Iterable, Optional
+
+from .polling import TableWatch, poll_starts, poll_until_changed
+from .schedule import SCHEDULE_CSVS, Schedule, get_schedule
+from .snapshot import SnapshotStore
+from .timing import stage
+
+__all__ = ["CHECK_TIME", "check_times", "serve", "serve_sport"]
+
+
+# checks run the day after a game at this time, as the cron workflows did
+CHECK_TIME = datetime.time(12, 0, tzinfo=datetime.timezone.utc)
+
+# checks missed by at most this much (e.g. the daemon was restarted) still run
+CATCH_UP = datetime.timedelta(hours=6)
+
+# longest single sleep, so suspends and clock changes are noticed
+MAX_SLEEP: float = 3600.0
+
+# (sport, check date, force=False) -> None, blocking; the date's previous day
+# is checked, force=True checks it even if the ledger says it was handled
+Check = Callable[..., None]
+Clock = Callable[[], datetime.datetime]
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def check_times(
+    schedules: Iterable[Schedule], check_time: datetime.time = CHECK_TIME
+) -> list[datetime.datetime]:
+    """
+    Get when a sport has to be checked for new season highs.
+
+    Parameters
+    ----------
+    schedules : Iterable[Schedule]
+        Schedules of the sport, e.g. one per season
+    check_time : datetime.time, optional
+        Time of day of a check, timezone aware, by default 12:00 UTC
+
+    Returns
+    -------
+    list[datetime.datetime]
+        One check the day after every game day, sorted and distinct
+    """
+    days = {day for schedule in schedules for day in schedule.dates()}
+    return sorted(
+        datetime.datetime.combine(day + datetime.timedelta(days=1), check_time)
+        for day in days
+    )
+
+
+async def _sleep_until(
+    when: datetime.datetime,
+    clock: Clock,
+    sleep: Callable[[float], "asyncio.Future"],
+) -> None:
+    while (remaining := (when - clock()).total_seconds()) > 0:
+        await sleep(min(remaining, MAX_SLEEP))
+
+
+async def _run_check(
+    sport: str, when: datetime.datetime, check: Check, clock: Clock
+) -> None:
+    try:
+        with stage("check", sport=sport, date=when.date().isoformat()) as record:
+            record["late_seconds"] = round((clock() - when).total_seconds(), 3)
+            await asyncio.to_thread(check, sport, when.date())
+    except Exception as e:
+        print(f"{sport} check for {when.date()} failed: {e!r}")
+
+
+async def serve_sport(
+    sport: str,
+    times: list[datetime.datetime],
+    check: Check,
+    clock: Clock = _utcnow,
+    sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+    polls: Optional[dict[datetime.datetime, datetime.datetime]] = None,
+    watch: Optional[Callable[[datetime.date], TableWatch]] = None,
+) -> int:
+    """
+    Sleep until each check time of a sport and run its check.
+
+    The blocking check runs on a worker thread, so the sports sharing the
+    event loop keep their own timing. A failing check is reported and the
+    next one is still scheduled. With polling, the stats page is polled
+    from the end of the games until the check time, and the check runs as
+    soon as the season high tables change. The scheduled check still runs
+    as a safety net, forced past the date the early check marked handled so
+    late stats (e.g. the second game of a doubleheader) are posted; the
+    ledger keeps the highs posted early from going out twice.
+
+    Parameters
+    ----------
+    sport : str
+        Name of the sport, passed to the check
+    times : list[datetime.datetime]
+        Sorted, timezone aware check times, see `check_times`
+    check : Check
+        Blocking function loading and posting the highs of a sport and date
+    clock : Clock, optional
+        Current time, timezone aware, by default UTC now
+    sleep : Callable[[float], asyncio.Future], optional
+        Coroutine function sleeping some seconds, by default asyncio.sleep
+    polls : dict[datetime.datetime, datetime.datetime], optional
+        Check time to the time polling for it starts, by default no polling
+    watch : Callable[[datetime.date], TableWatch], optional
+        Builds the watch of the stats page for a check date, needed with polls
+
+    Returns
+    -------
+    int
+        Number of checks that ran, early ones included
+    """
+    ran = 0
+    for when in times[bisect_left(times, clock() - CATCH_UP) :]:
+        start = (polls or {}).get(when)
+        early = False
+        if start is not None and watch is not None and clock() < when:
+            await _sleep_until(start, clock, sleep)
+            if await poll_until_changed(watch(when.date()), when, clock, sleep):
+                await _run_check(sport, when, check, clock)
+                ran += 1
+                early = True
+        await _sleep_until(when, clock, sleep)
+        await _run_check(sport, when, partial(check, force=True) if early else check, clock)
+        ran += 1
+    return ran
+
+
+async def serve(
+    check: Check,
+    sports: Optional[list[str]] = None,
+    check_time: datetime.time = CHECK_TIME,
+    warm: Optional[Callable[[], object]] = None,
+    poll: bool = False,
+    snapshots: Optional[SnapshotStore] = None,
+    clock: Clock = _utcnow,
+    sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+) -> dict[str, int]:
+    """
+    Run the checks of several sports on one event loop until their seasons end.
+
+    Everything a check warms up (the HTTP session, the page cache, parsed
+    schedules, the X client) stays loaded between checks, so a check costs
+    only its fetch, parse and posts.
+
+    Parameters
+    ----------
+    check : Check
+        Blocking function loading and posting the highs of a sport and date
+    sports : list[str], optional
+        Sports to serve, by default every sport with an exported schedule
+    check_time : datetime.time, optional
+        Time of day of a check, timezone aware, by default 12:00 UTC
+    warm : Callable[[], object], optional
+        Called once on a worker thread before the first sleep, e.g. to
+        build the X client
+    poll : bool, optional
+        Poll the stats pages from the scheduled end of the games and check
+        as soon as their season high tables change, by default False
+    snapshots : SnapshotStore, optional
+        With polling, compare against the last committed snapshot instead
+        of the page as first polled
+    clock : Clock, optional
+        Current time, timezone aware, by default UTC now
+    sleep : Callable[[float], asyncio.Future], optional
+        Coroutine function sleeping some seconds, by default asyncio.sleep
+
+    Returns
+    -------
+    dict[str, int]
+        Per sport, the number of checks that ran
+    """
+    if sports is None:
+        sports = sorted({sport for sport, _ in SCHEDULE_CSVS})
+    schedules = {
+        sport: [get_schedule(sport, year) for s, year in SCHEDULE_CSVS if s == sport]
+        for sport in sports
+    }
+    times = {sport: check_times(schedules[sport], check_time) for sport in sports}
+    polls: dict[str, dict[datetime.datetime, datetime.datetime]] = {s: {} for s in sports}
+    for sport in sports if poll else ():
+        for day, start in poll_starts(schedules[sport]).items():
+            when = datetime.datetime.combine(day + datetime.timedelta(days=1), check_time)
+            if start < when:
+                polls[sport][when] = start
+
+    for sport, sport_times in times.items():
+        upcoming = [t for t in sport_times if t >= clock() - CATCH_UP]
+        first = upcoming[0].isoformat() if upcoming else "none"
+        print(f"Serving {sport}: {len(upcoming)} checks left, next {first}")
+
+    if warm is not None:
+        await asyncio.to_thread(warm)
+    ran = await asyncio.gather(
+        *(
+            serve_sport(
+                sport,
+                times[sport],
+                check,
+                clock,
+                sleep,
+                polls=polls[sport],
+                watch=lambda day, sport=sport: TableWatch(sport, day.year, snapshots),
+            )
+            for sport in sports
+        )
+    )
+    return dict(zip(sports, ran))
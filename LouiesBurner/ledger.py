@@ -0,0 +1,261 @@
+"""Persistent ledger of posted season highs and handled dates."""
+
+import datetime
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+from .achievements import Achievement
+
+__all__ = ["Ledger", "achievement_key"]
+
+
+# sqlite file used unless LOUIESBURNER_LEDGER says otherwise
+DEFAULT_LEDGER_PATH: str = ".cache/ledger.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posted (
+    sport TEXT NOT NULL,
+    date TEXT NOT NULL,
+    player TEXT NOT NULL,
+    statistic TEXT NOT NULL,
+    value TEXT NOT NULL,
+    posted_at TEXT NOT NULL,
+    PRIMARY KEY (sport, date, player, statistic, value)
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    sport TEXT NOT NULL,
+    date TEXT NOT NULL,
+    text TEXT NOT NULL,
+    posted_at TEXT NOT NULL,
+    PRIMARY KEY (sport, date, text)
+);
+CREATE TABLE IF NOT EXISTS handled (
+    sport TEXT NOT NULL,
+    date TEXT NOT NULL,
+    handled_at TEXT NOT NULL,
+    PRIMARY KEY (sport, date)
+);
+"""
+
+
+def achievement_key(
+    sport: str, high: Achievement | Mapping[str, Any]
+) -> tuple[str, str, str, str, str]:
+    """
+    Build the ledger key of a season high.
+
+    Parameters
+    ----------
+    sport : str
+        The sport the achievement belongs to
+    high : Achievement | Mapping[str, Any]
+        Achievement, or dictionary with Date, Player, Statistic and Value keys
+
+    Returns
+    -------
+    tuple[str, str, str, str, str]
+        (sport, date, player, statistic, value) with every part as text
+    """
+    return (
+        sport,
+        high["Date"].isoformat(),
+        str(high["Player"]),
+        str(high["Statistic"]),
+        str(high["Value"]),
+    )
+
+
+class Ledger:
+    """
+    SQLite record of what has already been posted.
+
+    Achievements are keyed by (sport, date, player, statistic, value) and
+    game summaries by (sport, game date, text) so a rerun never posts the
+    same tweet twice, and check dates are marked as
+    handled once all of their tweets went out so a rerun can stop before
+    fetching anything.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        Location of the sqlite database
+    """
+
+    def __init__(self, path: Optional[str | os.PathLike] = None) -> None:
+        """
+        Initialize a Ledger, creating the database if needed.
+
+        Parameters
+        ----------
+        path : str | os.PathLike, optional
+            Database file, by default ``$LOUIESBURNER_LEDGER`` or ``.cache/ledger.sqlite3``
+        """
+        if path is None:
+            path = os.environ.get("LOUIESBURNER_LEDGER", DEFAULT_LEDGER_PATH)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Ledger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def is_handled(self, sport: str, date: datetime.date) -> bool:
+        """
+        Check whether every high for a check date has been posted.
+
+        Parameters
+        ----------
+        sport : str
+            The sport to check
+        date : datetime.date
+            The check date, as passed to `get_season_highs_for_date`
+
+        Returns
+        -------
+        bool
+            True if the date was marked as handled
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM handled WHERE sport = ? AND date = ?",
+            (sport, date.isoformat()),
+        ).fetchone()
+        return row is not None
+
+    def mark_handled(self, sport: str, date: datetime.date) -> None:
+        """
+        Mark a check date as fully handled.
+
+        Parameters
+        ----------
+        sport : str
+            The sport that was handled
+        date : datetime.date
+            The check date, as passed to `get_season_highs_for_date`
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO handled VALUES (?, ?, ?)",
+                (sport, date.isoformat(), _now()),
+            )
+
+    def posted_keys(self, sport: str) -> set[tuple[str, str, str, str, str]]:
+        """
+        Get the keys of every achievement posted for a sport.
+
+        Parameters
+        ----------
+        sport : str
+            The sport to look up
+
+        Returns
+        -------
+        set[tuple[str, str, str, str, str]]
+            Keys as built by `achievement_key`
+        """
+        rows = self._conn.execute(
+            "SELECT sport, date, player, statistic, value FROM posted WHERE sport = ?",
+            (sport,),
+        )
+        return set(rows)
+
+    def filter_new(self, sport: str, highs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Drop achievements that were already posted.
+
+        Parameters
+        ----------
+        sport : str
+            The sport the achievements belong to
+        highs : list[dict[str, Any]]
+            Achievements as returned by `get_season_highs_for_date`
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The achievements not in the ledger, in their original order
+        """
+        seen = self.posted_keys(sport)
+        return [high for high in highs if achievement_key(sport, high) not in seen]
+
+    def record(self, sport: str, highs: Iterable[dict[str, Any]]) -> None:
+        """
+        Record achievements as posted.
+
+        Parameters
+        ----------
+        sport : str
+            The sport the achievements belong to
+        highs : Iterable[dict[str, Any]]
+            Achievements that were just posted
+        """
+        now = _now()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO posted VALUES (?, ?, ?, ?, ?, ?)",
+                [(*achievement_key(sport, high), now) for high in highs],
+            )
+
+    def filter_new_summaries(
+        self, sport: str, date: datetime.date, summaries: list[str]
+    ) -> list[str]:
+        """
+        Drop game summaries that were already posted.
+
+        Parameters
+        ----------
+        sport : str
+            The sport the summaries belong to
+        date : datetime.date
+            The day the games were played
+        summaries : list[str]
+            Summary tweets as returned by `get_game_summaries`
+
+        Returns
+        -------
+        list[str]
+            The summaries not in the ledger, in their original order
+        """
+        rows = self._conn.execute(
+            "SELECT text FROM summaries WHERE sport = ? AND date = ?",
+            (sport, date.isoformat()),
+        )
+        seen = {text for (text,) in rows}
+        return [summary for summary in summaries if summary not in seen]
+
+    def record_summaries(
+        self, sport: str, date: datetime.date, summaries: Iterable[str]
+    ) -> None:
+        """
+        Record game summaries as posted.
+
+        Parameters
+        ----------
+        sport : str
+            The sport the summaries belong to
+        date : datetime.date
+            The day the games were played
+        summaries : Iterable[str]
+            Summary tweets that were just posted
+        """
+        now = _now()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO summaries VALUES (?, ?, ?, ?)",
+                [(sport, date.isoformat(), summary, now) for summary in summaries],
+            )
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
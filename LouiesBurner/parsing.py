@@ -0,0 +1,217 @@
+"""Selective HTML table parsing for gvsulakers stats pages."""
+
+from __future__ import annotations
+
+import html as html_lib
+import io
+import json
+import re
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .cache import get_default_cache
+
+__all__ = [
+    "SEASON_HIGH_SIGNATURE",
+    "find_tables",
+    "read_season_high_tables",
+    "read_tables",
+    "split_tables",
+    "table_header",
+]
+
+
+# columns of an individual season high table, used to find them on the page
+SEASON_HIGH_SIGNATURE: tuple[str, ...] = ("Statistic", "High", "Player", "Opponent")
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_TABLE_RE = re.compile(r"<table\b.*?</table\s*>", re.S | re.I)
+_HEADER_ROW_RE = re.compile(r"<thead\b.*?</thead\s*>|<tr\b.*?</tr\s*>", re.S | re.I)
+_TH_RE = re.compile(r"<th\b[^>]*>(.*?)</th\s*>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# (sport, year) -> positions of the season high tables among all page tables
+_table_index: dict[str, list[int]] = {}
+_table_index_lock = threading.Lock()
+_INDEX_FILE = "table-index.json"
+
+
+def split_tables(page: str) -> list[str]:
+    """
+    Split a page into the raw HTML of each of its tables, in document order.
+
+    Parameters
+    ----------
+    page : str
+        Full page HTML
+
+    Returns
+    -------
+    list[str]
+        Raw ``<table>...</table>`` markup of every top level table
+
+    Notes
+    -----
+    Tables are located with a regular expression rather than a DOM, so no
+    tree is built for the rest of the page. gvsulakers stats pages do not
+    nest tables, so positions line up with ``pd.read_html``.
+    """
+    return _TABLE_RE.findall(page)
+
+
+def table_header(table: str) -> tuple[str, ...]:
+    """
+    Get the column labels of a table from its first header row.
+
+    Parameters
+    ----------
+    table : str
+        Raw markup of a single table
+
+    Returns
+    -------
+    tuple[str, ...]
+        Whitespace-normalized text of each ``<th>`` cell
+    """
+    header = _HEADER_ROW_RE.search(table)
+    if header is None:
+        return ()
+    return tuple(
+        _WS_RE.sub(" ", html_lib.unescape(_TAG_RE.sub("", cell))).strip()
+        for cell in _TH_RE.findall(header.group(0))
+    )
+
+
+def _matches(table: str, signature: tuple[str, ...]) -> bool:
+    return set(signature) <= set(table_header(table))
+
+
+def find_tables(
+    tables: list[str],
+    signature: tuple[str, ...] = SEASON_HIGH_SIGNATURE,
+    limit: Optional[int] = None,
+) -> list[int]:
+    """
+    Find the positions of the tables whose header contains a signature.
+
+    Parameters
+    ----------
+    tables : list[str]
+        Raw table markup as returned by `split_tables`
+    signature : tuple[str, ...], optional
+        Column labels every matching table must have
+    limit : int, optional
+        Stop after this many matches, by default all matches are returned
+
+    Returns
+    -------
+    list[int]
+        Positions of the matching tables in document order
+    """
+    idxs = []
+    for n, table in enumerate(tables):
+        if _matches(table, signature):
+            idxs.append(n)
+            if limit is not None and len(idxs) >= limit:
+                break
+    return idxs
+
+
+def _load_index() -> None:
+    if _table_index:
+        return
+    try:
+        path = get_default_cache().root / _INDEX_FILE
+        _table_index.update(json.loads(path.read_text()))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_index() -> None:
+    try:
+        root = get_default_cache().root
+        root.mkdir(parents=True, exist_ok=True)
+        (root / _INDEX_FILE).write_text(json.dumps(_table_index))
+    except OSError:
+        pass
+
+
+def read_tables(markup: str) -> list[pd.DataFrame]:
+    """
+    Parse the tables of some HTML into DataFrames.
+
+    A module level function, so it can be sent to a process pool.
+
+    Parameters
+    ----------
+    markup : str
+        HTML containing one or more tables
+
+    Returns
+    -------
+    list[pd.DataFrame]
+        One DataFrame per table, in document order
+    """
+    import pandas as pd
+
+    return pd.read_html(io.StringIO(markup))
+
+
+def read_season_high_tables(
+    page: str,
+    sport: str,
+    year: int,
+    limit: Optional[int] = None,
+    signature: tuple[str, ...] = SEASON_HIGH_SIGNATURE,
+    read_html: Callable[[str], list[pd.DataFrame]] = read_tables,
+) -> tuple[list[int], list[pd.DataFrame]]:
+    """
+    Parse only the season high tables of a stats page into DataFrames.
+
+    The positions found for a (sport, year) are kept in an index persisted
+    next to the page cache, so later runs only check the header of the
+    tables at those positions instead of every table on the page.
+
+    Parameters
+    ----------
+    page : str
+        Full stats page HTML
+    sport : str
+        Sport identifier, part of the index key
+    year : int
+        Season year, part of the index key
+    limit : int, optional
+        Maximum number of matching tables to parse, by default all of them
+    signature : tuple[str, ...], optional
+        Column labels identifying a season high table
+    read_html : Callable[[str], list[pd.DataFrame]], optional
+        Parses the markup of the matching tables, by default `read_tables`;
+        e.g. a function handing it to a process pool
+
+    Returns
+    -------
+    tuple[list[int], list[pd.DataFrame]]
+        Positions of the parsed tables and their DataFrames
+    """
+    tables = split_tables(page)
+    key = f"{sport}-{year}"
+
+    with _table_index_lock:
+        _load_index()
+        idxs = _table_index.get(key)
+    if not idxs or not all(
+        n < len(tables) and _matches(tables[n], signature) for n in idxs
+    ):
+        idxs = find_tables(tables, signature, limit=limit)
+        if idxs:
+            with _table_index_lock:
+                _table_index[key] = idxs
+                _save_index()
+
+    if not idxs:
+        return [], []
+
+    return idxs, read_html("".join(tables[n] for n in idxs))
@@ -0,0 +1,195 @@
+"""Adaptive post-game polling of stats pages with conditional requests."""
+
+import asyncio
+import datetime
+import hashlib
+from typing import Callable, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from .cache import fetch_page
+from .schedule import Game, Schedule
+from .snapshot import SnapshotStore, table_hash
+from .timing import stage
+
+__all__ = ["TableWatch", "poll_starts", "poll_until_changed"]
+
+
+# schedule times are local to Allendale, MI
+SCHEDULE_TZ = ZoneInfo("America/Detroit")
+
+# when a game without a scheduled end (start TBD) is assumed to be over
+TBD_END = datetime.time(18, 0)
+
+# first poll interval, growth per unchanged poll and the longest interval
+POLL_INTERVAL: float = 5 * 60.0
+POLL_BACKOFF: float = 1.5
+POLL_MAX_INTERVAL: float = 45 * 60.0
+
+# poll results
+UNCHANGED, PAGE_CHANGED, TABLE_CHANGED = "unchanged", "page", "table"
+
+
+def _game_end(game: Game) -> datetime.datetime:
+    if game.end is not None:
+        end = game.end
+    elif game.start.time() != datetime.time():
+        # start known but no end, a game takes about three hours
+        end = game.start + datetime.timedelta(hours=3)
+    else:
+        end = datetime.datetime.combine(game.start.date(), TBD_END)
+    return end.replace(tzinfo=SCHEDULE_TZ)
+
+
+def poll_starts(
+    schedules: Iterable[Schedule],
+) -> dict[datetime.date, datetime.datetime]:
+    """
+    Get when polling for the stats of each game day should start.
+
+    Parameters
+    ----------
+    schedules : Iterable[Schedule]
+        Schedules of the sport, e.g. one per season
+
+    Returns
+    -------
+    dict[datetime.date, datetime.datetime]
+        Per game day, the UTC end of its last game (the scheduled end from
+        the csv, or an estimate when the start is TBD)
+    """
+    starts: dict[datetime.date, datetime.datetime] = {}
+    for schedule in schedules:
+        for game in schedule:
+            end = _game_end(game).astimezone(datetime.timezone.utc)
+            day = game.start.date()
+            starts[day] = max(starts.get(day, end), end)
+    return starts
+
+
+def _revalidate_stats(sport: str, year: int) -> str:
+    # always a conditional request, the page cache answers a 304 from disk
+    return fetch_page(sport, year, "stats", max_age=0)
+
+
+class TableWatch:
+    """
+    Watches the season high tables of a stats page for changes.
+
+    Every poll is a conditional request through the page cache, so an
+    unchanged page costs a ``304``. Only the season high tables are hashed,
+    so page noise (timestamps, other tables) does not count as a change.
+
+    Attributes
+    ----------
+    sport : str
+        Sport identifier
+    year : int
+        Season year
+    baseline : str, optional
+        `table_hash` the tables are compared against
+    """
+
+    def __init__(
+        self,
+        sport: str,
+        year: int,
+        snapshots: Optional[SnapshotStore] = None,
+        fetch: Callable[[str, int], str] = _revalidate_stats,
+    ) -> None:
+        """
+        Initialize a TableWatch.
+
+        Parameters
+        ----------
+        sport : str
+            Sport identifier
+        year : int
+            Season year
+        snapshots : SnapshotStore, optional
+            Store whose last committed snapshot is the baseline, by default
+            the tables as first polled are
+        fetch : Callable[[str, int], str], optional
+            Returns the stats page of a sport and year, by default a
+            conditional request through the page cache
+        """
+        self.sport = sport
+        self.year = year
+        self._fetch = fetch
+        previous = snapshots.load(sport, year) if snapshots is not None else None
+        self.baseline: Optional[str] = previous.table_hash if previous else None
+        self._page_hash: Optional[str] = None
+
+    def poll(self) -> str:
+        """
+        Fetch the stats page and compare it with the last poll and the baseline.
+
+        Returns
+        -------
+        str
+            "table" when the season high tables differ from the baseline,
+            "page" when only the rest of the page changed since the last
+            poll, otherwise "unchanged"
+        """
+        page = self._fetch(self.sport, self.year)
+        page_hash = hashlib.sha256(page.encode()).hexdigest()
+        if page_hash == self._page_hash:
+            return UNCHANGED
+        first, self._page_hash = self._page_hash is None, page_hash
+
+        tables = table_hash(page)
+        if self.baseline is None:
+            self.baseline = tables
+        elif tables != self.baseline:
+            return TABLE_CHANGED
+        return UNCHANGED if first else PAGE_CHANGED
+
+
+async def poll_until_changed(
+    watch: TableWatch,
+    until: datetime.datetime,
+    clock: Callable[[], datetime.datetime],
+    sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+) -> bool:
+    """
+    Poll a stats page until its season high tables change or time runs out.
+
+    The interval starts at POLL_INTERVAL and grows by POLL_BACKOFF after
+    every poll that saw nothing new, up to POLL_MAX_INTERVAL. A page that
+    changed without its tables changing (stats being entered) resets it.
+
+    Parameters
+    ----------
+    watch : TableWatch
+        The watched stats page
+    until : datetime.datetime
+        Timezone aware time to give up at
+    clock : Callable[[], datetime.datetime]
+        Current time, timezone aware
+    sleep : Callable[[float], asyncio.Future], optional
+        Coroutine function sleeping some seconds, by default asyncio.sleep
+
+    Returns
+    -------
+    bool
+        True once the tables changed, False if `until` came first
+    """
+    interval = POLL_INTERVAL
+    with stage("poll", sport=watch.sport, year=watch.year) as record:
+        record["polls"] = 0
+        while clock() < until:
+            record["polls"] += 1
+            try:
+                result = await asyncio.to_thread(watch.poll)
+            except Exception as e:
+                print(f"{watch.sport} poll failed: {e!r}")
+                result = UNCHANGED
+            if result == TABLE_CHANGED:
+                record["changed"] = True
+                return True
+            delay = POLL_INTERVAL if result == PAGE_CHANGED else interval
+            interval = min(delay * POLL_BACKOFF, POLL_MAX_INTERVAL)
+            remaining = (until - clock()).total_seconds()
+            if remaining > 0:
+                await sleep(min(delay, remaining))
+        record["changed"] = False
+        return False
@@ -0,0 +1,93 @@
+"""Posting stage with per-tweet retries."""
+
+import random
+import time
+from typing import Any, Callable
+
+__all__ = ["backoff_delay", "post_tweets"]
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """
+    Get how long to wait before retrying a failed post.
+
+    Uses exponential backoff with full jitter: a random delay between zero
+    and ``base_delay * 2 ** attempt``, capped at ``max_delay``.
+
+    Parameters
+    ----------
+    attempt : int
+        Number of failed attempts so far, starting at 0
+    base_delay : float, optional
+        Upper bound of the first delay in seconds, by default 2
+    max_delay : float, optional
+        Cap on any single delay in seconds, by default 60
+    rng : Callable[[], float], optional
+        Source of uniform [0, 1) numbers, by default random.random
+
+    Returns
+    -------
+    float
+        Seconds to sleep before the next attempt
+    """
+    return rng() * min(max_delay, base_delay * 2**attempt)
+
+
+def post_tweets(
+    tweets: list[str],
+    post: Callable[[str], Any],
+    retries: int = 5,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0,
+    sleep: Callable[[float], Any] = time.sleep,
+) -> tuple[list[str], list[str]]:
+    """
+    Post already composed tweets, retrying each failed one on its own.
+
+    A failure never causes earlier tweets to be posted again or the stats
+    page to be fetched again; only the tweet that failed is retried, with
+    exponential backoff and jitter between attempts.
+
+    Parameters
+    ----------
+    tweets : list[str]
+        Tweet texts to post, in order
+    post : Callable[[str], Any]
+        Posts one tweet text, raising on failure
+    retries : int, optional
+        Attempts per tweet before giving up on it, by default 5
+    base_delay : float, optional
+        Upper bound of the first retry delay in seconds, by default 2
+    max_delay : float, optional
+        Cap on any single retry delay in seconds, by default 60
+    sleep : Callable[[float], Any], optional
+        Sleep function, by default time.sleep
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        The tweets that were posted and the tweets that gave up
+    """
+    posted, failed = [], []
+    for tweet in tweets:
+        for attempt in range(retries):
+            try:
+                post(tweet)
+            except Exception as e:
+                print(f"Error posting tweet (attempt {attempt + 1}/{retries}): {e}")
+                if attempt + 1 < retries:
+                    delay = backoff_delay(attempt, base_delay, max_delay)
+                    print(f"sleeping for {delay:.1f}s")
+                    sleep(delay)
+            else:
+                print("Tweet posted successfully!")
+                posted.append(tweet)
+                break
+        else:
+            failed.append(tweet)
+    return posted, failed
@@ -0,0 +1,270 @@
+"""Record fetched pages as fixtures and replay them without the network."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+from urllib.parse import urlsplit
+
+# requests is only imported once a recorder or replayer is built
+if TYPE_CHECKING:
+    import requests
+
+__all__ = ["FixtureStore", "install", "record", "replay"]
+
+
+# response headers worth keeping, the page cache revalidates with them
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class FixtureStore:
+    """
+    Directory of recorded responses, one body file per URL.
+
+    ``index.json`` maps every recorded URL to its body file, status code and
+    validators, so a fixture directory can be inspected and edited by hand.
+
+    Attributes
+    ----------
+    root : pathlib.Path
+        Directory holding the bodies and ``index.json``
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        """
+        Initialize a FixtureStore.
+
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Fixture directory, created on the first recording
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        try:
+            self._index: dict[str, dict] = json.loads(
+                (self.root / "index.json").read_text()
+            )
+        except (OSError, ValueError):
+            self._index = {}
+
+    @staticmethod
+    def filename(url: str) -> str:
+        """
+        Build the body file name of a URL.
+
+        Parameters
+        ----------
+        url : str
+            Recorded URL
+
+        Returns
+        -------
+        str
+            e.g. ``sports-baseball-stats-2024.html``
+        """
+        parts = urlsplit(url)
+        stem = re.sub(r"[^A-Za-z0-9]+", "-", f"{parts.path}-{parts.query}").strip("-")
+        return f"{stem or 'index'}.html"
+
+    def urls(self) -> list[str]:
+        """
+        Get every recorded URL.
+
+        Returns
+        -------
+        list[str]
+            Recorded URLs, sorted
+        """
+        with self._lock:
+            return sorted(self._index)
+
+    def load(self, url: str) -> Optional[tuple[bytes, dict]]:
+        """
+        Read a recorded response.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL
+
+        Returns
+        -------
+        Optional[tuple[bytes, dict]]
+            The body and its index entry, None if the URL was never recorded
+        """
+        with self._lock:
+            entry = self._index.get(url)
+        if entry is None:
+            return None
+        return (self.root / entry["file"]).read_bytes(), entry
+
+    def save(self, url: str, body: bytes, status: int, headers: dict) -> None:
+        """
+        Record a response, replacing any earlier recording of the URL.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL
+        body : bytes
+            Decoded response body
+        status : int
+            HTTP status code
+        headers : dict
+            Response headers, only the ones the pipeline uses are kept
+        """
+        entry = {
+            "file": self.filename(url),
+            "status": status,
+            "headers": {k: headers[k] for k in _KEPT_HEADERS if k in headers},
+        }
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / entry["file"]).write_bytes(body)
+            self._index[url] = entry
+            (self.root / "index.json").write_text(
+                json.dumps(self._index, indent=2, sort_keys=True)
+            )
+
+
+def _replay_adapter(store: FixtureStore) -> requests.adapters.BaseAdapter:
+    from requests import ConnectionError, Response
+    from requests.adapters import BaseAdapter
+    from requests.structures import CaseInsensitiveDict
+
+    class ReplayAdapter(BaseAdapter):
+        # answers from the fixture store, honoring If-None-Match like a server
+
+        def send(self, request, **kwargs):
+            recorded = store.load(request.url)
+            if recorded is None:
+                raise ConnectionError(
+                    f"no recorded response for {request.url} in {store.root}",
+                    request=request,
+                )
+            body, entry = recorded
+
+            resp = Response()
+            resp.request = request
+            resp.url = request.url
+            resp.headers = CaseInsensitiveDict(entry["headers"])
+            etag = entry["headers"].get("ETag")
+            if etag and request.headers.get("If-None-Match") == etag:
+                resp.status_code, resp.reason, body = 304, "Not Modified", b""
+            else:
+                resp.status_code, resp.reason = entry["status"], "Replayed"
+            resp.raw = io.BytesIO(body)
+            resp.encoding = "utf-8"
+            return resp
+
+        def close(self):
+            pass
+
+    return ReplayAdapter()
+
+
+def _recording_adapter(store: FixtureStore) -> requests.adapters.HTTPAdapter:
+    from requests.adapters import HTTPAdapter
+
+    from .session import POOL_SIZE
+
+    class RecordingAdapter(HTTPAdapter):
+        # a normal pooled adapter that also saves every 200 response
+
+        def send(self, request, **kwargs):
+            resp = super().send(request, **kwargs)
+            if resp.status_code == 200:
+                store.save(request.url, resp.content, resp.status_code, resp.headers)
+            return resp
+
+    return RecordingAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+
+
+def install(
+    session: requests.Session, mode: str, root: str | os.PathLike
+) -> FixtureStore:
+    """
+    Mount a recorder or replayer on a session for every http(s) URL.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to mount on, usually `session.get_session()`
+    mode : str
+        "record" to fetch live and save pages, "replay" to serve saved pages
+    root : str | os.PathLike
+        Fixture directory
+
+    Returns
+    -------
+    FixtureStore
+        The store the mounted adapter reads or writes
+    """
+    store = FixtureStore(root)
+    if mode == "record":
+        adapter = _recording_adapter(store)
+    elif mode == "replay":
+        adapter = _replay_adapter(store)
+    else:
+        raise ValueError(f"unknown mode {mode!r}, expected 'record' or 'replay'")
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return store
+
+
+@contextlib.contextmanager
+def _mounted(mode: str, root: str | os.PathLike) -> Iterator[FixtureStore]:
+    from .session import get_session
+
+    session = get_session()
+    previous = dict(session.adapters)
+    store = install(session, mode, root)
+    try:
+        yield store
+    finally:
+        session.adapters.clear()
+        session.adapters.update(previous)
+
+
+def record(root: str | os.PathLike) -> contextlib.AbstractContextManager[FixtureStore]:
+    """
+    Save every page the shared session fetches while the context is open.
+
+    Parameters
+    ----------
+    root : str | os.PathLike
+        Fixture directory
+
+    Returns
+    -------
+    contextlib.AbstractContextManager[FixtureStore]
+        Context yielding the fixture store
+    """
+    return _mounted("record", root)
+
+
+def replay(root: str | os.PathLike) -> contextlib.AbstractContextManager[FixtureStore]:
+    """
+    Serve recorded pages instead of the network while the context is open.
+
+    Requests for URLs that were never recorded raise
+    ``requests.ConnectionError``, like they would offline.
+
+    Parameters
+    ----------
+    root : str | os.PathLike
+        Fixture directory
+
+    Returns
+    -------
+    contextlib.AbstractContextManager[FixtureStore]
+        Context yielding the fixture store
+    """
+    return _mounted("replay", root)
@@ -1,6 +1,270 @@
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+import csv
+import os
+import re
+import threading
+from bisect import bisect_left
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .cache import fetch_page
+from .scraping import fetch_soup, parse_soup
+from .utils import ROOT_URL
+
+# the only rows of a schedule page get_womens_soccer_schedule reads
+SCHEDULE_STRAINER = SoupStrainer("tr", class_="sidearm-schedule-game")
+
+# exported schedules shipped with the repo, preferred over the schedule page
+SCHEDULES_DIR = Path(__file__).resolve().parent.parent / "schedules"
+SCHEDULE_CSVS: dict[tuple[str, int], Path] = {
+    ("baseball", 2025): SCHEDULES_DIR / "bsbl_25_schedule.csv",
+    ("softball", 2025): SCHEDULES_DIR / "softball_25_schedule.csv",
+}
+
+# 'Baseball vs Tiffin University (Ohio)', 'Softball at Western Michigan University'
+_EVENT_OPPONENT = re.compile(r"\s(?:vs\.?|at)\s+(.*)$")
+
+
+class Game(NamedTuple):
+    """
+    A scheduled game
+
+            Attributes:
+                    start (datetime): start time, midnight when it is TBD
+                    opponent (str): opponent name
+                    location (str): where the game is played, empty if unknown
+                    end (datetime | None): scheduled end time, None when unknown
+    """
+
+    start: datetime
+    opponent: str
+    location: str = ""
+    end: Optional[datetime] = None
+
+
+def _as_datetime(when: date | datetime) -> datetime:
+    # plain dates compare as midnight of that day
+    if isinstance(when, datetime):
+        return when
+    return datetime.combine(when, time())
+
+
+def _parse_time(text: str) -> Optional[time]:
+    try:
+        return datetime.strptime(text.replace(" ", "").upper(), "%I:%M%p").time()
+    except ValueError:  # TBD, TBA, ...
+        return None
+
+
+def _parse_end(row: dict, start: datetime, start_time: Optional[time]) -> Optional[datetime]:
+    # end times of TBD games are placeholders ('3:00 AM'), so only trust
+    # an end after a known start
+    end_time = _parse_time(row.get("End Time", ""))
+    if start_time is None or end_time is None:
+        return None
+    try:
+        end_day = datetime.strptime(row.get("End Date", ""), "%m/%d/%Y").date()
+    except ValueError:
+        end_day = start.date()
+    end = datetime.combine(end_day, end_time)
+    return end if end > start else None
+
+
+class Schedule:
+    """
+    Games of one season, sorted by start time and queried with bisect
+
+            Parameters:
+                    games (Iterable[Game]): games in any order
+    """
+
+    __slots__ = ["_games", "_starts"]
+
+    def __init__(self, games: Iterable[Game]) -> None:
+        self._games: tuple[Game, ...] = tuple(sorted(games, key=lambda g: g.start))
+        self._starts: list[datetime] = [game.start for game in self._games]
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __iter__(self) -> Iterator[Game]:
+        return iter(self._games)
+
+    def __repr__(self) -> str:
+        return f"Schedule({len(self)} games)"
+
+    @classmethod
+    def from_csv(cls, path: str | os.PathLike) -> "Schedule":
+        """
+        Returns the schedule in an exported calendar csv (see schedules/)
+
+                Parameters:
+                        path (str | os.PathLike): csv with Event, Start Date, Start Time, End Date, End Time and Location columns
+
+                Returns:
+                        schedule (Schedule): every row with a valid start date
+        """
+        games = []
+        with open(path, "r", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    day = datetime.strptime(row["Start Date"], "%m/%d/%Y").date()
+                except ValueError:
+                    continue
+                match = _EVENT_OPPONENT.search(row.get("Event", "").strip())
+                start_time = _parse_time(row.get("Start Time", ""))
+                start = datetime.combine(day, start_time or time())
+                games.append(
+                    Game(
+                        start=start,
+                        opponent=match.group(1).strip() if match else "",
+                        location=row.get("Location", "").strip(),
+                        end=_parse_end(row, start, start_time),
+                    )
+                )
+        return cls(games)
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> "Schedule":
+        """
+        Returns the schedule in the grid view of a schedule page
+
+                Parameters:
+                        soup (BeautifulSoup): parsed html, e.g. restricted by SCHEDULE_STRAINER
+
+                Returns:
+                        schedule (Schedule): one game per dated row
+        """
+        games = []
+        for row in soup.find_all("tr", class_="sidearm-schedule-game"):
+            cells = row.find_all("td")
+            if not cells:
+                continue
+            day = datetime.strptime(
+                cells[0].text.strip().split("(")[0].strip(), "%B %d, %Y"
+            )
+            opponent = cells[1].text.strip() if len(cells) > 1 else ""
+            games.append(Game(start=day, opponent=opponent))
+        return cls(games)
+
+    @property
+    def games(self) -> tuple[Game, ...]:
+        """
+        Returns every game, sorted by start time
+        """
+        return self._games
+
+    def dates(self) -> list[date]:
+        """
+        Returns the sorted, distinct days with at least one game
+
+                Returns:
+                        dates (list[date]): game days
+        """
+        return sorted({game.start.date() for game in self._games})
+
+    def previous_game(self, when: date | datetime) -> Optional[Game]:
+        """
+        Returns the last game that started before a moment
+
+                Parameters:
+                        when (date | datetime): reference moment, a date means midnight of that day
+
+                Returns:
+                        game (Game | None): the game, None if there is none
+        """
+        i = bisect_left(self._starts, _as_datetime(when))
+        return self._games[i - 1] if i else None
+
+    def next_game(self, when: date | datetime) -> Optional[Game]:
+        """
+        Returns the first game starting at or after a moment
+
+                Parameters:
+                        when (date | datetime): reference moment, a date means midnight of that day
+
+                Returns:
+                        game (Game | None): the game, None if there is none
+        """
+        i = bisect_left(self._starts, _as_datetime(when))
+        return self._games[i] if i < len(self._games) else None
+
+    def games_between(self, start: date | datetime, end: date | datetime) -> list[Game]:
+        """
+        Returns the games starting in [start, end)
+
+                Parameters:
+                        start (date | datetime): window start, inclusive
+                        end (date | datetime): window end, exclusive
+
+                Returns:
+                        games (list[Game]): games in the window, sorted by start time
+        """
+        lo = bisect_left(self._starts, _as_datetime(start))
+        hi = bisect_left(self._starts, _as_datetime(end), lo)
+        return list(self._games[lo:hi])
+
+
+_schedules: dict[tuple[str, int], Schedule] = {}
+_schedules_lock = threading.Lock()
+
+
+def get_schedule(sport: str, year: int, html: Optional[str] = None) -> Schedule:
+    """
+    Returns the schedule of a season, loaded once per process and shared
+
+    Seasons with an exported csv in SCHEDULE_CSVS load from it, every other
+    season from its schedule page (through the page cache). The page is
+    fetched and parsed outside the lock, so loads of other seasons never
+    wait on it; when two threads load the same season the first one wins.
+
+            Parameters:
+                    sport (str): sport name as used in gvsulakers urls
+                    year (int): season year
+                    html (str): already fetched schedule page, used instead of fetching it
+
+            Returns:
+                    schedule (Schedule): the season's games
+    """
+    key = (sport, year)
+    with _schedules_lock:
+        schedule = _schedules.get(key)
+    if schedule is not None:
+        return schedule
+
+    csv_path = SCHEDULE_CSVS.get(key)
+    if html is None and csv_path is not None and csv_path.exists():
+        schedule = Schedule.from_csv(csv_path)
+    else:
+        if html is None:
+            html = fetch_page(
+                sport,
+                year,
+                "schedule",
+                url=f"{ROOT_URL.format(sport=sport)}/schedule/{year}?grid=true",
+            )
+        schedule = Schedule.from_soup(parse_soup(html, SCHEDULE_STRAINER))
+    with _schedules_lock:
+        return _schedules.setdefault(key, schedule)
+
+
+def get_schedule_soup(sport: str, year: int) -> BeautifulSoup:
+    """
+    Returns the game rows of the grid view of a sport's schedule page
+
+            Parameters:
+                    sport (str): sport name as used in gvsulakers urls
+                    year (int): season year
+
+            Returns:
+                    soup (BeautifulSoup): parsed html
+    """
+    return fetch_soup(
+        f"{ROOT_URL.format(sport=sport)}/schedule/{year}?grid=true",
+        parse_only=SCHEDULE_STRAINER,
+    )
 
 
 def get_womens_soccer_schedule(soup: BeautifulSoup):
@@ -13,21 +277,7 @@ def get_womens_soccer_schedule(soup: BeautifulSoup):
             Returns:
                     dates_list (list): list of dates for all GVSU women's soccer games
     """
-    dates_list = []
-    rows = soup.find_all("tr", class_="sidearm-schedule-game")
-
-    for row in rows:
-        date_td = row.find("td")  # first <td> in the row
-        if date_td:
-            game_date = date_td.text.strip()
-            parsed_date = datetime.strptime(
-                game_date.split("(")[0].strip(), "%B %d, %Y"
-            )
-            formatted_date = parsed_date.strftime(
-                "%m/%d/%Y"
-            )  # Convert to MM/DD/YYYY format
-            dates_list.append(formatted_date)
-    return dates_list
+    return [game.start.strftime("%m/%d/%Y") for game in Schedule.from_soup(soup)]
 
 
 def find_most_recent_past_date(dates):
@@ -39,11 +289,14 @@ def find_most_recent_past_date(dates):
 
             Returns:
                     date (str): date of most recent game
+
+            Raises:
+                    ValueError: if none of the dates is in the past
     """
-    current_date = datetime.now()
-    past_dates = [
-        datetime.strptime(date, "%m/%d/%Y")
-        for date in dates
-        if datetime.strptime(date, "%m/%d/%Y") < current_date
-    ]
-    return max(past_dates).strftime("%m/%d/%Y")
+    schedule = Schedule(
+        Game(start=datetime.strptime(d, "%m/%d/%Y"), opponent="") for d in dates
+    )
+    game = schedule.previous_game(datetime.now())
+    if game is None:
+        raise ValueError("no past games on the schedule")
+    return game.start.strftime("%m/%d/%Y")
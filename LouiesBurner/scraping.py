@@ -1,5 +1,239 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+import unicodedata
+import weakref
+from typing import NamedTuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+from .session import fetch
+
+# sections of a stats page the functions below read, nothing else is built
+STATS_SECTIONS = [
+    "game-results",
+    "game-game-our-offensive",
+    "individual-overall-offensive",
+]
+STATS_STRAINER = SoupStrainer("section", id=STATS_SECTIONS)
+
+
+def parse_soup(html: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    Returns parsed html, built with lxml and optionally restricted to some elements
+
+            Parameters:
+                    html (str): page html
+                    parse_only (SoupStrainer): only build these elements, by default the whole page
+
+            Returns:
+                    soup (BeautifulSoup): parsed html
+    """
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+
+def fetch_soup(url: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    Returns the parsed html of a page fetched through the shared session
+
+            Parameters:
+                    url (str): page url
+                    parse_only (SoupStrainer): only build these elements, by default the whole page
+
+            Returns:
+                    soup (BeautifulSoup): parsed html
+    """
+    resp = fetch(url)
+    resp.raise_for_status()
+    return parse_soup(resp.text, parse_only=parse_only)
+
+
+def fetch_stats_soup(url: str) -> BeautifulSoup:
+    """
+    Returns a stats page parsed down to the sections this module reads
+
+            Parameters:
+                    url (str): stats page url
+
+            Returns:
+                    soup (BeautifulSoup): the game results, game offensive and
+                            individual offensive sections
+    """
+    return fetch_soup(url, parse_only=STATS_STRAINER)
+
+
+class GameRow(NamedTuple):
+    """
+    Text of one row of a game-by-game section, extracted when the section is indexed
+
+            Attributes:
+                    texts (tuple): stripped text of every cell, in page order
+                    strings (tuple): stripped strings of every cell, e.g. one per goal scorer
+                    links (tuple): stripped text of the first <a> of every cell, None without one
+                    labels (tuple): data-label of every cell, None without one
+    """
+
+    texts: tuple[str, ...]
+    strings: tuple[tuple[str, ...], ...]
+    links: tuple[str | None, ...]
+    labels: tuple[str | None, ...]
+
+    @classmethod
+    def from_cells(cls, cells: list[Tag]) -> "GameRow":
+        """returns the row of a list of <td> cells, keeping no reference to them"""
+        links = [cell.find("a") for cell in cells]
+        return cls(
+            texts=tuple(cell.text.strip() for cell in cells),
+            strings=tuple(tuple(cell.stripped_strings) for cell in cells),
+            links=tuple(link.text.strip() if link else None for link in links),
+            labels=tuple(cell.get("data-label") for cell in cells),
+        )
+
+
+class GameLog:
+    """
+    Date-keyed table of one game-by-game section of a stats page
+
+    The section is walked once: every row's cell text is extracted and
+    stored under its date (the text of its first cell), and every
+    data-label is mapped to its column index, so looking up a date and then
+    a stat is two dictionary hits instead of a walk over every <tr> and a
+    search per stat. No bs4 element is kept, so the soup can be freed.
+
+            Attributes:
+                    columns (dict): data-label -> column index
+                    rows (dict): date "MM/DD/YYYY" -> list of GameRow
+    """
+
+    __slots__ = ["columns", "rows"]
+
+    def __init__(self, section: Tag):
+        self.columns: dict[str, int] = {}
+        self.rows: dict[str, list[GameRow]] = {}
+
+        for tr in section.find_all("tr"):
+            cells = tr.find_all("td")
+            if not cells:
+                continue
+            row = GameRow.from_cells(cells)
+            if not self.columns:
+                self.columns = {
+                    label: n for n, label in enumerate(row.labels) if label is not None
+                }
+            self.rows.setdefault(row.texts[0], []).append(row)
+
+    @property
+    def dates(self) -> list[str]:
+        """dates with at least one row, in page order"""
+        return list(self.rows)
+
+    def index(self, row: GameRow, label: str) -> int | None:
+        """
+        Returns the position of the cell of a row for a data-label
+
+                Parameters:
+                        row (GameRow): one row of the section
+                        label (str): data-label of the column
+
+                Returns:
+                        n (int): index into the row's tuples, None if the row has no such cell
+        """
+        n = self.columns.get(label)
+        if n is not None and n < len(row.labels) and row.labels[n] == label:
+            return n
+        # rows with a different layout than the first one fall back to a search
+        return next((i for i, cell_label in enumerate(row.labels) if cell_label == label), None)
+
+    def text(self, row: GameRow, label: str) -> str:
+        """stripped text of the cell for a data-label"""
+        return row.texts[self.index(row, label)]
+
+
+# (id(soup), what was parsed) -> (weak reference to the soup, parsed value)
+_parsed: dict[tuple[int, str], tuple[weakref.ref, object]] = {}
+
+
+def _memoize_on_soup(soup: BeautifulSoup, key: str, build):
+    """returns build(), computed once per soup (by identity) and key"""
+    cache_key = (id(soup), key)
+    hit = _parsed.get(cache_key)
+    if hit is not None and hit[0]() is soup:
+        return hit[1]
+
+    value = build()
+    _parsed[cache_key] = (
+        weakref.ref(soup, lambda _, cache_key=cache_key: _parsed.pop(cache_key, None)),
+        value,
+    )
+    return value
+
+
+def get_game_log(soup: BeautifulSoup, section_id: str) -> GameLog | None:
+    """
+    Returns the GameLog of a section, parsing it only the first time
+
+            Parameters:
+                    soup (BeautifulSoup): parsed html
+                    section_id (str): id of the <section>, e.g. "game-results"
+
+            Returns:
+                    game_log (GameLog): indexed section, None if the page has no such section
+    """
+
+    def build():
+        section = soup.find("section", id=section_id)
+        return GameLog(section) if section is not None else None
+
+    return _memoize_on_soup(soup, f"game-log:{section_id}", build)
+
+
+def _game_data(game_log: GameLog, row: GameRow) -> dict:
+    game_data = {}
+    game_data["Opponent"] = row.links[1]  # opponent is the <a> of the second <td>
+    game_data["Outcome"] = row.texts[2]
+    game_data["Attendance"] = game_log.text(row, "Attend")
+    goals = game_log.index(row, "Goals Scored [Assist]")
+
+    if goals is not None:
+        scorers = []
+        for scorer in row.strings[goals]:  # individual goal scorers
+            scorers.append(
+                scorer.split(" (")[0]
+            )  # discludes the total number of goals and the assister
+        game_data["Goal Scorers"] = scorers  # list of goal scorers
+
+    game_data["Score"] = game_log.text(row, "Score")
+    game_data["Overall Record"] = game_log.text(row, "Overall").split(",")[0][1:]
+    game_data["Conference Record"] = game_log.text(row, "Conference")
+    return game_data
+
+
+def _offensive_stats(game_log: GameLog, row: GameRow) -> dict:
+    game_data = {}
+    game_data["Opponent"] = "".join(row.strings[1])
+    if game_data["Opponent"][0] == "a" and game_data["Opponent"][1] == "t":
+        game_data["Opponent"] = game_data["Opponent"].split("at")[
+            1
+        ]  # removes the 'at' at the start of the opponent text.
+    if game_data["Opponent"][0] == "v" and game_data["Opponent"][1] == "s":
+        game_data["Opponent"] = game_data["Opponent"].split("vs")[
+            1
+        ]  # removes the 'vs' at the start of the opponent text.
+    game_data["Score"] = game_log.text(row, "Score")
+    game_data["Goals"] = game_log.text(row, "G")
+    game_data["Assists"] = game_log.text(row, "A")
+    game_data["Points"] = game_log.text(row, "PTS")
+    game_data["Shots"] = game_log.text(row, "SH")
+    game_data["Shot%"] = round(float(game_log.text(row, "Shot%")) * 100, 1)
+    game_data["SOG"] = game_log.text(row, "SOG")
+    game_data["SOG%"] = game_log.text(row, "SOG%")
+    yc, rc = game_log.text(row, "YC-RC").split("-")[:2]
+    game_data["YC"] = yc
+    game_data["RC"] = rc
+    game_data["GW"] = game_log.text(row, "GW")
+    game_data["PK-ATT"] = game_log.text(row, "PK-ATT")
+    game_data["Minutes"] = row.texts[-1]
+    return game_data
+
 
 # Gets game-to-game data by date
 
@@ -15,51 +249,27 @@ def get_game_data_by_date(soup: BeautifulSoup, date: str = "MM/DD/YYYY"):
             Returns:
                     game_data (dict): dictionary of general game data
     """
-    game_data = {}  # results dict
-
-    game_results_section = soup.find("section", id="game-results")
-
-    if game_results_section:
-        rows = game_results_section.find_all("tr")
-
-        for row in rows:
-            date_cell = row.find("td")
-            if date_cell and date_cell.text.strip() == date:
-
-                game_data["Opponent"] = (
-                    row.find_all("td")[1].find("a").text.strip()
-                )  # opponent is in the second <td> matches <a>
-                game_data["Outcome"] = row.find_all("td")[2].text.strip()
-                game_data["Attendance"] = row.find(
-                    "td", {"data-label": "Attend"}
-                ).text.strip()
-                goals_cell = row.find("td", {"data-label": "Goals Scored [Assist]"})
-
-                if goals_cell:
-                    scorers = []
-                    for (
-                        scorer
-                    ) in goals_cell.stripped_strings:  # individual goal scorers
-                        scorers.append(
-                            scorer.split(" (")[0]
-                        )  # discludes the total number of goals and the assister
-                    game_data["Goal Scorers"] = scorers  # list of goal scorers
-
-                game_data["Score"] = row.find(
-                    "td", {"data-label": "Score"}
-                ).text.strip()
-                game_data["Overall Record"] = (
-                    row.find("td", {"data-label": "Overall"})
-                    .text.strip()
-                    .split(",")[0][1:]
-                )
-                game_data["Conference Record"] = row.find(
-                    "td", {"data-label": "Conference"}
-                ).text.strip()
-        return game_data
-
-    return {}
-    # return "No data found for this date."
+    game_log = get_game_log(soup, "game-results")
+    if game_log is None or date not in game_log.rows:
+        return {}
+    # with several games on one date, the last one on the page wins
+    return _game_data(game_log, game_log.rows[date][-1])
+
+
+def get_game_data_for_season(soup: BeautifulSoup):
+    """
+    Returns GVSU general game data for every date of the season
+
+            Parameters:
+                    soup (BeautifulSoup): parsed html
+
+            Returns:
+                    season_data (dict): date "MM/DD/YYYY" -> dictionary of general game data
+    """
+    game_log = get_game_log(soup, "game-results")
+    if game_log is None:
+        return {}
+    return {date: _game_data(game_log, rows[-1]) for date, rows in game_log.rows.items()}
 
 
 def get_offensive_stats_by_date(soup: BeautifulSoup, date: str = "MM/DD/YYYY"):
@@ -73,52 +283,151 @@ def get_offensive_stats_by_date(soup: BeautifulSoup, date: str = "MM/DD/YYYY"):
             Returns:
                     game_data (dict): dictionary of offensive game data
     """
-    game_data = {}  # results dict
-    game_off_results_section = soup.find("section", id="game-game-our-offensive")
-
-    if game_off_results_section:
-        rows = game_off_results_section.find_all("tr")
-
-        for row in rows:
-            date_cell = row.find("td")
-            if date_cell and date_cell.text.strip() == date:
-                opponent_cell = row.find_all("td")[1]
-                game_data["Opponent"] = opponent_cell.get_text(strip=True)
-                if game_data["Opponent"][0] == "a" and game_data["Opponent"][1] == "t":
-                    game_data["Opponent"] = game_data["Opponent"].split("at")[
-                        1
-                    ]  # removes the 'at' at the start of the opponent text.
-                if game_data["Opponent"][0] == "v" and game_data["Opponent"][1] == "s":
-                    game_data["Opponent"] = game_data["Opponent"].split("vs")[
-                        1
-                    ]  # removes the 'vs' at the start of the opponent text.
-                game_data["Score"] = row.find(
-                    "td", {"data-label": "Score"}
-                ).text.strip()
-                game_data["Goals"] = row.find("td", {"data-label": "G"}).text.strip()
-                game_data["Assists"] = row.find("td", {"data-label": "A"}).text.strip()
-                game_data["Points"] = row.find("td", {"data-label": "PTS"}).text.strip()
-                game_data["Shots"] = row.find("td", {"data-label": "SH"}).text.strip()
-                game_data["Shot%"] = round(
-                    float(row.find("td", {"data-label": "Shot%"}).text.strip()) * 100, 1
-                )
-                game_data["SOG"] = row.find("td", {"data-label": "SOG"}).text.strip()
-                game_data["SOG%"] = row.find("td", {"data-label": "SOG%"}).text.strip()
-                game_data["YC"] = (
-                    row.find("td", {"data-label": "YC-RC"}).text.strip().split("-")[0]
-                )
-                game_data["RC"] = (
-                    row.find("td", {"data-label": "YC-RC"}).text.strip().split("-")[1]
-                )
-                game_data["GW"] = row.find("td", {"data-label": "GW"}).text.strip()
-                game_data["PK-ATT"] = row.find(
-                    "td", {"data-label": "PK-ATT"}
-                ).text.strip()
-                game_data["Minutes"] = row.find_all("td")[-1].text.strip()
-
-                return game_data
-
-    return "No data found for this date."
+    game_log = get_game_log(soup, "game-game-our-offensive")
+    if game_log is None or date not in game_log.rows:
+        return "No data found for this date."
+    return _offensive_stats(game_log, game_log.rows[date][0])
+
+
+def get_offensive_stats_for_season(soup: BeautifulSoup):
+    """
+    Returns GVSU offensive team stats for every date of the season
+
+            Parameters:
+                    soup (BeautifulSoup): parsed html
+
+            Returns:
+                    season_stats (dict): date "MM/DD/YYYY" -> dictionary of offensive game data
+    """
+    game_log = get_game_log(soup, "game-game-our-offensive")
+    if game_log is None:
+        return {}
+    return {
+        date: _offensive_stats(game_log, rows[0]) for date, rows in game_log.rows.items()
+    }
+
+
+def normalize_player_name(name: str) -> str:
+    """
+    Returns a player name reduced to a form that ignores formatting differences
+
+    Accents, case, punctuation and name order are dropped, so
+    "Bearden, Kennedy", "kennedy bearden" and "Kennedy  Bearden" all match.
+
+            Parameters:
+                    name (str): player name in any format
+
+            Returns:
+                    normalized (str): sorted, lower case, accent free name parts
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    parts = re.findall(r"[a-z0-9']+", ascii_name.casefold())
+    return " ".join(sorted(parts))
+
+
+def _player_stats(row: Tag) -> dict:
+    def text(label):
+        return row.find("td", {"data-label": label}).text
+
+    return {
+        "GP": int(text("GP")),
+        "GS": int(text("GS")),
+        "MIN": int(text("MIN")),
+        "G": int(text("G")),
+        "A": int(text("A")),
+        "PTS": int(text("PTS")),
+        "SH": int(text("SH")),
+        "SH%": round(float(text("SH%")) * 100, 1),  # convert to percentage
+        "SOG": int(text("SOG")),
+        "SOG%": round(float(text("SOG%")) * 100, 1),  # convert to percentage
+        "YC": int(text("YC-RC").split("-")[0]),  # separate yellow card
+        "RC": int(text("YC-RC").split("-")[1]),  # separate red card
+        "GW": int(text("GW")),
+        "PG-PA": text("PG-PA"),
+    }
+
+
+class PlayerIndex:
+    """
+    Name-keyed player stats of the individual offensive section, parsed once
+
+            Attributes:
+                    names (list): player names in page order
+                    stats (dict): player name -> dictionary of typed player stats
+                    normalized (dict): normalize_player_name(name) -> player name
+    """
+
+    __slots__ = ["names", "stats", "normalized"]
+
+    def __init__(self, section: Tag | None):
+        self.names: list[str] = []
+        self.stats: dict[str, dict] = {}
+        self.normalized: dict[str, str] = {}
+        if section is None:
+            return
+
+        for row in section.find_all("tr"):
+            name_cell = row.find("a")
+            if not name_cell:
+                continue
+            name = name_cell.text.strip()
+            self.names.append(name)
+            try:
+                self.stats[name] = _player_stats(row)
+            except (AttributeError, IndexError, ValueError):
+                continue  # row without a full stat line, e.g. did not play
+            self.normalized.setdefault(normalize_player_name(name), name)
+
+    def lookup(self, player_name: str) -> str | None:
+        """
+        Returns the name a player is listed under
+
+        Tries an exact match, then a normalized match, then (like the
+        original row scan) the first listed name containing player_name.
+
+                Parameters:
+                        player_name (str): name to look up
+
+                Returns:
+                        name (str): the listed name, None if no player matches
+        """
+        if player_name in self.stats:
+            return player_name
+        name = self.normalized.get(normalize_player_name(player_name))
+        if name is not None:
+            return name
+        return next((n for n in self.stats if player_name in n), None)
+
+
+def get_player_index(soup: BeautifulSoup) -> PlayerIndex:
+    """
+    Returns the PlayerIndex of a stats page, parsing it only the first time
+
+            Parameters:
+                    soup (BeautifulSoup): parsed html
+
+            Returns:
+                    player_index (PlayerIndex): indexed individual offensive section
+    """
+    return _memoize_on_soup(
+        soup,
+        "players",
+        lambda: PlayerIndex(soup.find("section", id="individual-overall-offensive")),
+    )
+
+
+def get_all_player_stats(soup: BeautifulSoup):
+    """
+    Returns the season stats of every GVSU player
+
+            Parameters:
+                    soup (BeautifulSoup): parsed html
+
+            Returns:
+                    all_player_stats (dict): player name -> dictionary of player stats
+    """
+    return dict(get_player_index(soup).stats)
 
 
 def get_player_names(soup):
@@ -131,16 +440,7 @@ def get_player_names(soup):
             Returns:
                     player_names (list): list of player names
     """
-    player_names = []  # results container, will contain a list of names
-    offensive_section = soup.find("section", id="individual-overall-offensive")
-    rows = offensive_section.find_all("tr")
-
-    for row in rows:
-        name_cell = row.find("a")
-        if name_cell:
-            player_names.append(name_cell.text.strip())
-
-    return player_names
+    return list(get_player_index(soup).names)
 
 
 def get_player_stats_by_name(
@@ -151,43 +451,17 @@ def get_player_stats_by_name(
 
             Parameters:
                     soup (BeautifulSoup): parsed html
-                    player_name (str): player name
+                    player_name (str): player name, exact or in any case/order/accents
 
             Returns:
                     player_stats (dict): dictionary of player stats
     """
-    offensive_section = soup.find("section", id="individual-overall-offensive")
-
-    for row in offensive_section.find_all("tr"):
-        name_cell = row.find("a")
-        if name_cell and player_name in name_cell.text:
-            stats = {
-                "GP": int(row.find("td", {"data-label": "GP"}).text),
-                "GS": int(row.find("td", {"data-label": "GS"}).text),
-                "MIN": int(row.find("td", {"data-label": "MIN"}).text),
-                "G": int(row.find("td", {"data-label": "G"}).text),
-                "A": int(row.find("td", {"data-label": "A"}).text),
-                "PTS": int(row.find("td", {"data-label": "PTS"}).text),
-                "SH": int(row.find("td", {"data-label": "SH"}).text),
-                "SH%": round(
-                    float(row.find("td", {"data-label": "SH%"}).text) * 100, 1
-                ),  # convert to percentage
-                "SOG": int(row.find("td", {"data-label": "SOG"}).text),
-                "SOG%": round(
-                    float(row.find("td", {"data-label": "SOG%"}).text) * 100, 1
-                ),  # convert to percentage
-                "YC": int(
-                    row.find("td", {"data-label": "YC-RC"}).text.split("-")[0]
-                ),  # separate yellow card
-                "RC": int(
-                    row.find("td", {"data-label": "YC-RC"}).text.split("-")[1]
-                ),  # separate red card
-                "GW": int(row.find("td", {"data-label": "GW"}).text),
-                "PG-PA": row.find("td", {"data-label": "PG-PA"}).text,
-            }
-            player_stats = {player_name: stats}
-            return player_stats
-    return {}
+    player_index = get_player_index(soup)
+    name = player_index.lookup(player_name)
+    if name is None:
+        return {}
+    player_stats = {player_name: player_index.stats[name]}
+    return player_stats
 
 
 # Example usage of get_offensive_stats_by:
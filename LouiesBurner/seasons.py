@@ -0,0 +1,245 @@
+"""Many seasons of a sport, loaded in parallel and memoized per season."""
+
+from __future__ import annotations
+
+import datetime
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .achievements import AchievementBatch
+from .parsing import read_tables
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .sports import Sport
+
+__all__ = ["SEASON_CACHE_SIZE", "SeasonCollection"]
+
+
+# loaded seasons kept per process, least recently used ones are dropped first
+SEASON_CACHE_SIZE: int = 32
+
+# (sport, year) -> loaded season, shared by every collection
+_seasons: OrderedDict[tuple[str, int], Sport] = OrderedDict()
+_seasons_lock = threading.Lock()
+
+
+def _remember(season: Sport) -> None:
+    with _seasons_lock:
+        _seasons[(season.sport, season.year)] = season
+        _seasons.move_to_end((season.sport, season.year))
+        while len(_seasons) > SEASON_CACHE_SIZE:
+            _seasons.popitem(last=False)
+
+
+def _recall(sport: str, year: int) -> Optional[Sport]:
+    with _seasons_lock:
+        season = _seasons.get((sport, year))
+        if season is not None:
+            _seasons.move_to_end((sport, year))
+        return season
+
+
+def _start_worker() -> None:
+    # a no-op for forked workers, other start methods import pandas here
+    import pandas  # noqa: F401
+
+
+def _load_seasons(
+    seasons: list[Sport], max_workers: Optional[int], processes: int
+) -> dict[int, Exception]:
+    """
+    Fetch and parse seasons, the fetches on threads and the parsing in processes.
+
+    Parameters
+    ----------
+    seasons : list[Sport]
+        Seasons whose season high tables are loaded in place
+    max_workers : int, optional
+        Number of fetch threads, by default one per season
+    processes : int
+        Number of parsing processes, 0 or 1 parses on the fetch threads
+
+    Returns
+    -------
+    dict[int, Exception]
+        Per season that failed to load, the exception that made it fail
+    """
+    # imported before the workers start, so forked ones inherit it
+    import pandas  # noqa: F401
+
+    pool = ProcessPoolExecutor(processes) if processes > 1 else None
+    try:
+        if pool is not None:
+            # start the workers before any fetch thread exists, forking a
+            # process with running threads can deadlock the child
+            for _ in range(processes):
+                pool.submit(_start_worker)
+
+            def read_html(markup: str) -> list[pd.DataFrame]:
+                return pool.submit(read_tables, markup).result()
+
+        else:
+            read_html = read_tables
+
+        def load(season: Sport) -> Optional[Exception]:
+            try:
+                season._load_season_high_df(read_html)
+            except Exception as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(seasons)) as threads:
+            errors = dict(zip((season.year for season in seasons), threads.map(load, seasons)))
+        return {year: e for year, e in errors.items() if e is not None}
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+class SeasonCollection:
+    """
+    Several seasons of one sport, loaded together.
+
+    Seasons that are not loaded yet are fetched in parallel on threads and
+    their season high tables parsed in a process pool, so loading ten
+    seasons takes about as long as the slowest one. Loaded past seasons are
+    memoized per process in a bounded LRU shared by every collection; the
+    current season is still changing and is fetched again by every
+    collection. A season that fails to load is left out and its exception
+    kept in `errors`, the next `load` tries it again.
+
+    Attributes
+    ----------
+    sport : str
+        Name of the sport, a key of SPORTS
+    years : tuple[int, ...]
+        The seasons, ascending
+    errors : dict[int, Exception]
+        Per season that failed to load, the exception that made it fail
+    """
+
+    def __init__(
+        self,
+        sport: str,
+        years: Iterable[int],
+        max_workers: Optional[int] = None,
+        processes: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a SeasonCollection, nothing is fetched yet.
+
+        Parameters
+        ----------
+        sport : str
+            Name of the sport, a key of SPORTS
+        years : Iterable[int]
+            The seasons, at least one, duplicates are ignored
+        max_workers : int, optional
+            Number of fetch threads, by default one per season to load
+        processes : int, optional
+            Number of parsing processes, by default one per season to load
+            up to the number of CPUs; 0 parses on the fetch threads
+        """
+        from .sports import SPORTS
+
+        if sport not in SPORTS:
+            raise ValueError(f"unknown sport {sport!r}, expected one of {', '.join(SPORTS)}")
+        self.sport = sport
+        self.years = tuple(sorted(set(years)))
+        if not self.years:
+            raise ValueError("a SeasonCollection needs at least one season")
+        self._max_workers = max_workers
+        self._processes = processes
+        self._seasons: dict[int, Sport] = {}
+        self.errors: dict[int, Exception] = {}
+
+    def __repr__(self) -> str:
+        return f"SeasonCollection({self.sport!r}, {list(self.years)})"
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def load(self) -> SeasonCollection:
+        """
+        Load every season not loaded yet.
+
+        Seasons that fail are left out, see `errors`.
+
+        Returns
+        -------
+        SeasonCollection
+            The collection itself
+        """
+        from .sports import SPORTS
+
+        current = datetime.date.today().year
+        missing = []
+        for year in self.years:
+            if year in self._seasons:
+                continue
+            season = _recall(self.sport, year) if year < current else None
+            if season is None:
+                missing.append(SPORTS[self.sport](year=year))
+            else:
+                self._seasons[year] = season
+
+        if missing:
+            processes = self._processes
+            if processes is None:
+                processes = min(len(missing), os.cpu_count() or 1)
+            self.errors = _load_seasons(missing, self._max_workers, processes)
+            for season in missing:
+                if season.year in self.errors:
+                    continue
+                self._seasons[season.year] = season
+                if season.year < current:
+                    _remember(season)
+        return self
+
+    def __getitem__(self, year: int) -> Sport:
+        if year not in self.years:
+            raise KeyError(year)
+        self.load()
+        if year in self.errors:
+            raise self.errors[year]
+        return self._seasons[year]
+
+    def __iter__(self) -> Iterator[Sport]:
+        self.load()
+        return (self._seasons[year] for year in self.years if year in self._seasons)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Get the season highs of every season in one long DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns Season, Statistic, Value, Player, Opponent and Date, one
+            row per achievement as `Sport._season_highs_long` returns them,
+            loaded seasons ascending
+        """
+        import pandas as pd
+
+        loaded = list(self)
+        return pd.concat(
+            [season._season_highs_long() for season in loaded],
+            keys=[season.year for season in loaded],
+            names=["Season", None],
+        ).reset_index(level="Season").reset_index(drop=True)
+
+    def achievements(self) -> AchievementBatch:
+        """
+        Get the tweetable, dated season highs of every season in one batch.
+
+        Returns
+        -------
+        AchievementBatch
+            Every season's `Sport.achievements`, seasons ascending
+        """
+        return AchievementBatch.concat(season.achievements for season in self)
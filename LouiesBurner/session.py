@@ -0,0 +1,200 @@
+"""Shared pooled HTTP session used by every scraper."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from .timing import stage
+
+# requests is imported with the session, so importing this module is free
+if TYPE_CHECKING:
+    import requests
+
+__all__ = [
+    "RequestStat",
+    "fetch",
+    "get_request_stats",
+    "get_session",
+    "reset_request_stats",
+    "summarize_request_stats",
+]
+
+
+# seconds to wait for a connection and for each read, overridable per run
+CONNECT_TIMEOUT: float = float(os.environ.get("LOUIESBURNER_CONNECT_TIMEOUT", 5))
+READ_TIMEOUT: float = float(os.environ.get("LOUIESBURNER_READ_TIMEOUT", 30))
+
+# connections kept alive per host, enough for every sport loading at once
+POOL_SIZE: int = 8
+
+# serve recorded pages instead of the network, or record every fetched page
+REPLAY_DIR: str = os.environ.get("LOUIESBURNER_REPLAY_DIR", "")
+RECORD_DIR: str = os.environ.get("LOUIESBURNER_RECORD_DIR", "")
+
+USER_AGENT: str = "LouiesBurner (+https://github.com/Jensen-holm/LouiesBurner)"
+
+# request costs kept in memory, the oldest are dropped first so a long serve stays bounded
+MAX_REQUEST_STATS: int = 10_000
+
+
+class RequestStat(NamedTuple):
+    """
+    Cost of a single HTTP request.
+
+    Attributes
+    ----------
+    url : str
+        Requested URL
+    status : int
+        HTTP status code of the response
+    bytes : int
+        Size of the decoded body
+    wire_bytes : int
+        Bytes read off the socket, smaller than ``bytes`` when compressed
+    seconds : float
+        Wall time from sending the request to having the full body
+    """
+
+    url: str
+    status: int
+    bytes: int
+    wire_bytes: int
+    seconds: float
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_stats: deque[RequestStat] = deque(maxlen=MAX_REQUEST_STATS)
+_stats_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide session, creating it on first use.
+
+    The session keeps connections alive across requests, so the TLS
+    handshake with gvsulakers happens once per run, and advertises every
+    content encoding urllib3 can decode (gzip, deflate and brotli when the
+    ``brotli`` package is installed). With ``LOUIESBURNER_REPLAY_DIR`` or
+    ``LOUIESBURNER_RECORD_DIR`` set, pages are replayed from or recorded to
+    that fixture directory (see `replay`).
+
+    Returns
+    -------
+    requests.Session
+        The shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util import make_headers
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(make_headers(accept_encoding=True))
+            session.headers["User-Agent"] = USER_AGENT
+            if REPLAY_DIR or RECORD_DIR:
+                from .replay import install
+
+                mode = "replay" if REPLAY_DIR else "record"
+                install(session, mode, REPLAY_DIR or RECORD_DIR)
+            _session = session
+        return _session
+
+
+def fetch(
+    url: str,
+    headers: Optional[dict] = None,
+    timeout: Optional[float | tuple[float, float]] = None,
+) -> requests.Response:
+    """
+    GET a URL through the shared session and record what it cost.
+
+    Parameters
+    ----------
+    url : str
+        URL to fetch
+    headers : dict, optional
+        Extra request headers, e.g. conditional GET validators
+    timeout : float | tuple[float, float], optional
+        Connect/read timeouts, by default (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    Returns
+    -------
+    requests.Response
+        The response, with its body already read
+    """
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    with stage("request", url=url) as record:
+        start = time.perf_counter()
+        resp = get_session().get(url, headers=headers, timeout=timeout)
+        body = resp.content
+        seconds = time.perf_counter() - start
+
+        try:
+            wire_bytes = resp.raw.tell()
+        except (AttributeError, OSError):
+            wire_bytes = len(body)
+
+        stat = RequestStat(
+            url=url,
+            status=resp.status_code,
+            bytes=len(body),
+            wire_bytes=wire_bytes,
+            seconds=seconds,
+        )
+        record.update(status=stat.status, bytes=stat.bytes, wire_bytes=stat.wire_bytes)
+
+    with _stats_lock:
+        _stats.append(stat)
+    return resp
+
+
+def get_request_stats() -> list[RequestStat]:
+    """
+    Get the cost of the requests made so far.
+
+    Returns
+    -------
+    list[RequestStat]
+        One entry per request, in the order they completed, at most the
+        last MAX_REQUEST_STATS
+    """
+    with _stats_lock:
+        return list(_stats)
+
+
+def reset_request_stats() -> None:
+    """
+    Forget all recorded request costs.
+    """
+    with _stats_lock:
+        _stats.clear()
+
+
+def summarize_request_stats() -> str:
+    """
+    Summarize the recorded request costs in one line.
+
+    Returns
+    -------
+    str
+        Request count, decoded/wire kilobytes and total latency
+    """
+    stats = get_request_stats()
+    return (
+        f"{len(stats)} requests, "
+        f"{sum(s.bytes for s in stats) / 1024:.1f} KiB "
+        f"({sum(s.wire_bytes for s in stats) / 1024:.1f} KiB on the wire), "
+        f"{sum(s.seconds for s in stats):.2f}s"
+    )
@@ -0,0 +1,187 @@
+"""Snapshots of season high tables, diffed run to run to find new highs."""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .parsing import SEASON_HIGH_SIGNATURE, find_tables, split_tables
+
+__all__ = ["Snapshot", "SnapshotStore", "diff_rows", "table_hash"]
+
+
+# where snapshots live unless LOUIESBURNER_SNAPSHOT_DIR says otherwise
+DEFAULT_SNAPSHOT_DIR: str = ".cache/snapshots"
+
+# (Statistic, Player, Opponent, Value), every part as text
+Row = tuple[str, str, str, str]
+
+
+class Snapshot(NamedTuple):
+    """
+    Compact copy of a parsed season high table.
+
+    Attributes
+    ----------
+    table_hash : str
+        `table_hash` of the stats page the rows were parsed from
+    rows : tuple[Row, ...]
+        One (Statistic, Player, Opponent, Value) row per achievement
+    """
+
+    table_hash: str
+    rows: tuple[Row, ...]
+
+
+def table_hash(page: str, signature: tuple[str, ...] = SEASON_HIGH_SIGNATURE) -> str:
+    """
+    Hash the raw markup of the season high tables of a stats page.
+
+    Only the tables matching the signature are hashed, so changes anywhere
+    else on the page (other tables, scripts, timestamps) keep the hash.
+
+    Parameters
+    ----------
+    page : str
+        Full stats page HTML
+    signature : tuple[str, ...], optional
+        Column labels identifying a season high table
+
+    Returns
+    -------
+    str
+        Hex sha256 of the matching tables
+    """
+    tables = split_tables(page)
+    digest = hashlib.sha256()
+    for n in find_tables(tables, signature):
+        digest.update(tables[n].encode())
+    return digest.hexdigest()
+
+
+def diff_rows(previous: Optional[Snapshot], current: Snapshot) -> list[Row]:
+    """
+    Get the rows that are new or changed since the previous snapshot.
+
+    Rows are matched on (Statistic, Player, Opponent), so a corrected value
+    counts as changed and a broken or tied high as new. Rows that
+    disappeared are not reported.
+
+    Parameters
+    ----------
+    previous : Snapshot, optional
+        The last snapshot, every row is new without one
+    current : Snapshot
+        The snapshot just taken
+
+    Returns
+    -------
+    list[Row]
+        Added or changed rows, in table order
+    """
+    if previous is None:
+        return list(current.rows)
+    seen = {row[:3]: row[3] for row in previous.rows}
+    return [row for row in current.rows if seen.get(row[:3]) != row[3]]
+
+
+class SnapshotStore:
+    """
+    Last committed snapshot of every (sport, year), one JSON file each.
+
+    A new snapshot is only staged while its highs are being posted and is
+    written by `commit`, so highs that failed to post are found again by
+    the next run's diff.
+
+    Attributes
+    ----------
+    root : pathlib.Path
+        Directory holding the snapshot files
+    """
+
+    def __init__(self, root: Optional[str | os.PathLike] = None) -> None:
+        """
+        Initialize a SnapshotStore.
+
+        Parameters
+        ----------
+        root : str | os.PathLike, optional
+            Snapshot directory, by default ``$LOUIESBURNER_SNAPSHOT_DIR`` or ``.cache/snapshots``
+        """
+        if root is None:
+            root = os.environ.get("LOUIESBURNER_SNAPSHOT_DIR", DEFAULT_SNAPSHOT_DIR)
+        self.root = Path(root)
+        self._staged: dict[tuple[str, int], Snapshot] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, sport: str, year: int) -> Path:
+        return self.root / f"{sport}-{year}.json"
+
+    def load(self, sport: str, year: int) -> Optional[Snapshot]:
+        """
+        Read the last committed snapshot of a season.
+
+        Parameters
+        ----------
+        sport : str
+            Sport identifier
+        year : int
+            Season year
+
+        Returns
+        -------
+        Optional[Snapshot]
+            The snapshot, None if the season was never committed
+        """
+        try:
+            data = json.loads(self._path(sport, year).read_text())
+        except (OSError, ValueError):
+            return None
+        return Snapshot(data["table_hash"], tuple(tuple(row) for row in data["rows"]))
+
+    def stage(self, sport: str, year: int, snapshot: Snapshot) -> None:
+        """
+        Hold a snapshot until `commit` writes it.
+
+        Parameters
+        ----------
+        sport : str
+            Sport identifier
+        year : int
+            Season year
+        snapshot : Snapshot
+            The snapshot just taken
+        """
+        with self._lock:
+            self._staged[(sport, year)] = snapshot
+
+    def commit(self, sport: str, year: int) -> None:
+        """
+        Write the staged snapshot of a season, if there is one.
+
+        Parameters
+        ----------
+        sport : str
+            Sport identifier
+        year : int
+            Season year
+        """
+        with self._lock:
+            snapshot = self._staged.pop((sport, year), None)
+        if snapshot is None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._path(sport, year).write_text(
+            json.dumps(
+                {
+                    "table_hash": snapshot.table_hash,
+                    "taken_at": datetime.datetime.now(datetime.timezone.utc).isoformat(
+                        timespec="seconds"
+                    ),
+                    "rows": snapshot.rows,
+                }
+            )
+        )
@@ -1,4 +1,5 @@
 from .baseball import Baseball
+from .soccer import Soccer
 from .sport import Sport
 from .softball import Softball
 
@@ -6,11 +7,13 @@ from .softball import Softball
 SPORTS = {
     "baseball": Baseball,
     "softball": Softball,
+    "womens-soccer": Soccer,
 }
 
 __all__ = [
     "SPORTS",
     "Baseball",
+    "Soccer",
     "Softball",
     "Sport",
 ]
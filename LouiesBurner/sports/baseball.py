@@ -2,9 +2,9 @@
 
 import datetime
 import re
-import random
-from typing import Optional, List, Dict
-import pandas as pd
+from typing import Optional, List
+from ..achievements import Achievement
+from ..templates import BASEBALL
 from .sport import Sport
 
 
@@ -36,11 +36,15 @@ class Baseball(Sport):
     ----------
     _szn_high_idxs : list[int]
         Indices of individual box score season best tables in the scraped data
+        (fallback positions; their count is how many season high tables are parsed)
     """
 
     # these are individual box score season best indices
     _szn_high_idxs = [11, 12, 13]
 
+    _negative_stats = frozenset(negative_stats)
+    _templates = BASEBALL
+
     def __init__(self, year: int) -> None:
         """
         Initialize a Baseball instance.
@@ -110,87 +114,9 @@ class Baseball(Sport):
         - "swiped" for stolen bases
         - "dominated for" for innings pitched
         """
-        stat = stat.lower()
-        if stat in ["strikeouts", "hits", "runs scored", "rbis"]:
-            return "racked up"
-        elif stat in ["home runs", "doubles", "triples"]:
-            return "crushed"
-        elif stat in ["stolen bases"]:
-            return "swiped"
-        elif stat in ["innings pitched"]:
-            return "dominated for"
-        return "recorded"
+        return self._templates.verb(stat)
 
-    def create_tweet_text(self, highs: list[dict]) -> str:
-        """
-        Create an engaging tweet about baseball season high achievement(s).
-
-        Parameters
-        ----------
-        highs : list[dict]
-            List of dictionaries containing achievement information.
-            Each dictionary should contain:
-            - Player: str, name of the player
-            - Value: Any, the value achieved
-            - Statistic: str, type of statistic
-            - Opponent: str, opposing team
-
-        Returns
-        -------
-        str
-            Formatted tweet text describing the achievement(s)
-
-        Notes
-        -----
-        Uses baseball-specific templates and hashtags (#GLVCbsb).
-        Handles both single and multiple achievements by the same player.
-        """
-        player = highs[0]["Player"]
-        assert isinstance(player, str)
-
-        if all(h["Player"] == player for h in highs):
-            if len(highs) == 1:
-                high = highs[0]
-                single_templates = [
-                    "🚨 SEASON HIGH ALERT! 🚨\n{player} just {verb} {stat_type} with {value} against {opponent}! #AnchorUp ⚓️",
-                    "🔥 {player} is ON FIRE! 🔥\nJust set a season high with {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
-                    "⚡️ RECORD BREAKER ⚡️\n{player} leads the way with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
-                    "👀 Look what {player} just did!\nNew season high: {value} {stat_type} vs {opponent}! #AnchorUp⚓️",
-                    "💪 BEAST MODE: {player} 💪\nDominates with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
-                ]
-
-                return random.choice(single_templates).format(
-                    player=high["Player"],
-                    value=high["Value"],
-                    stat_type=high["Statistic"].lower(),
-                    opponent=re.sub(r"\s*\([^)]*\)", "", high["Opponent"]),
-                    verb=self._get_baseball_verb(high["Statistic"]),
-                )
-            else:
-                # Combine multiple achievements
-                achievements = []
-                for high in highs:
-                    stat = high["Statistic"].lower()
-                    achievements.append(f"{high['Value']} {stat}")
-                achievements_str = (
-                    ", ".join(achievements[:-1]) + f" and {achievements[-1]}"
-                )
-                multi_templates = [
-                    "🔥 WHAT A GAME! 🔥\n{player} sets multiple season highs with {achievements} against {opponent}! #AnchorUp",
-                    "⚡️ {player} IS UNSTOPPABLE! ⚡️\nNew season highs: {achievements} vs {opponent}! #GLVCbsb",
-                    "💪 DOMINANT PERFORMANCE 💪\n{player} sets new highs with {achievements} against {opponent}! #AnchorUp",
-                ]
-                return random.choice(multi_templates).format(
-                    player=player,
-                    achievements=achievements_str,
-                    opponent=re.sub(r"\s*\([^)]*\)", "", highs[0]["Opponent"]),
-                )
-
-        # If we somehow get here (shouldn't with current logic), use a simple template
-        high = highs[0]
-        return f"🎯 New season high! {high['Player']} {self._get_baseball_verb(high['Statistic'])} {high['Value']} {high['Statistic'].lower()} against {re.sub(r'\s*\([^)]*\)', '', high['Opponent'])}! #AnchorUp #GLVCbsb"
-
-    def get_season_highs_for_date(self, date: datetime.date) -> List[Dict]:
+    def get_season_highs_for_date(self, date: datetime.date) -> List[Achievement]:
         """
         Get baseball season highs that were set/tied on the day before the given date.
 
@@ -201,59 +127,16 @@ class Baseball(Sport):
 
         Returns
         -------
-        List[Dict]
-            List of dictionaries containing season high information:
-            - Statistic : str
-                Name of the statistic
-            - Value : Any
-                Value achieved
-            - Player : str
-                Player who achieved it
-            - Opponent : str
-                Opponent it was achieved against
-            - Date : datetime.date
-                Date it was achieved
+        List[Achievement]
+            The season highs, with their Statistic, Value, Player,
+            Opponent and Date
 
         Notes
         -----
         Filters out negative statistics (defined in negative_stats list)
-        and only includes achievements from the previous day.
+        and only includes achievements from the previous day. Tied highs are
+        exploded into long format and filtered with vectorized masks rather
+        than row by row.
         """
-        # Get the previous day's date
         prev_date = date - datetime.timedelta(days=1)
-
-        # Get the season highs dataframe
-        df = self.season_high_df
-
-        # Track any new or tied season highs
-        new_highs = []
-
-        # Process each row in the dataframe
-        for _, row in df.iterrows():
-            statistic = row["Statistic"]
-
-            # Skip stats we don't want to tweet about
-            if not self._should_tweet_stat(statistic):
-                continue
-
-            high_value = row["High"]
-            players = row["Player"].split("; ")
-            opponents = row["Opponent"].split("; ")
-
-            # Check each player/opponent combination for this statistic
-            for player, opponent in zip(players, opponents):
-                game_date = self._extract_date(opponent)
-
-                # Only include achievements from the previous day
-                if game_date and game_date == prev_date:
-                    new_highs.append(
-                        {
-                            "Statistic": statistic,
-                            "Value": high_value,
-                            "Player": player,
-                            "Opponent": opponent,
-                            "Date": game_date,
-                        }
-                    )
-
-        return new_highs
+        return self._season_highs_on(prev_date)
@@ -0,0 +1,295 @@
+"""Women's soccer module for handling game summaries and season highs."""
+
+from __future__ import annotations
+
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Dict
+from .sport import Sport
+from ..achievements import Achievement
+from ..cache import fetch_page
+from ..templates import TWEET_LIMIT, TweetTooLong, tweet_length
+
+# bs4 is imported by the scraping and schedule modules, only when a page is parsed
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+    from ..schedule import Schedule
+
+
+# game data every summary tweet needs
+summary_stats = [
+    "Outcome",
+    "Opponent",
+    "Score",
+    "Goal Scorers",
+    "Attendance",
+    "Overall Record",
+    "Conference Record",
+]
+
+
+class Soccer(Sport):
+    """
+    Class for handling women's soccer game summaries and season highs.
+
+    The stats page and the schedule page are fetched concurrently, once. The
+    parsed stats page is shared by the game summary, offensive stats and
+    player stats lookups, the schedule by every user of the season.
+
+    Attributes
+    ----------
+    _szn_high_idxs : list[int]
+        Empty, every table matching the season high signature is used
+    """
+
+    _szn_high_idxs = []
+
+    _SCHEDULE_URL = "https://gvsulakers.com/sports/{sport}/schedule/{year}?grid=true"
+
+    def __init__(self, year: int) -> None:
+        """
+        Initialize a Soccer instance.
+
+        Parameters
+        ----------
+        year : int
+            The year for which to fetch women's soccer statistics
+        """
+        super().__init__(year=year, sport="womens-soccer")
+        self._schedule_url = self._SCHEDULE_URL.format(sport=self.sport, year=year)
+        self._pages: Optional[Dict[str, str]] = None
+        self._stats_soup: Optional[BeautifulSoup] = None
+
+    @property
+    def schedule_url(self) -> str:
+        """
+        Get the URL of the schedule page (grid view).
+
+        Returns
+        -------
+        str
+            The complete URL for fetching the schedule
+        """
+        return self._schedule_url
+
+    @property
+    def pages(self) -> Dict[str, str]:
+        """
+        Get the stats and schedule page HTML, fetching both concurrently.
+
+        Both go through the on-disk page cache, so a rerun revalidates them
+        with conditional GETs.
+
+        Returns
+        -------
+        Dict[str, str]
+            HTML keyed by "stats" and "schedule"
+        """
+        if self._pages is None:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                stats = pool.submit(fetch_page, self.sport, self.year, "stats", self.url)
+                schedule = pool.submit(
+                    fetch_page, self.sport, self.year, "schedule", self.schedule_url
+                )
+                self._pages = {"stats": stats.result(), "schedule": schedule.result()}
+        return self._pages
+
+    def _fetch_stats_html(self) -> str:
+        return self.pages["stats"]
+
+    @property
+    def stats_soup(self) -> BeautifulSoup:
+        """
+        Get the stats page parsed down to the sections that are scraped.
+
+        Returns
+        -------
+        BeautifulSoup
+            Game results, game offensive and individual offensive sections
+        """
+        from ..scraping import STATS_STRAINER, parse_soup
+
+        if self._stats_soup is None:
+            self._stats_soup = parse_soup(self.pages["stats"], STATS_STRAINER)
+        return self._stats_soup
+
+    @property
+    def schedule(self) -> Schedule:
+        """
+        Get the season schedule, shared with every other user of the season.
+
+        Returns
+        -------
+        Schedule
+            The games on the schedule page
+        """
+        from ..schedule import get_schedule
+
+        return get_schedule(self.sport, self.year, html=self.pages["schedule"])
+
+    def game_dates(self) -> List[datetime.date]:
+        """
+        Get the date of every game on the schedule.
+
+        Returns
+        -------
+        List[datetime.date]
+            Sorted, distinct game dates
+        """
+        return self.schedule.dates()
+
+    def most_recent_game_date(
+        self, today: Optional[datetime.date] = None
+    ) -> Optional[datetime.date]:
+        """
+        Get the date of the most recent game before today.
+
+        Parameters
+        ----------
+        today : datetime.date, optional
+            Reference date, by default today
+
+        Returns
+        -------
+        Optional[datetime.date]
+            The latest scheduled game date before today, None if there is none
+        """
+        game = self.schedule.previous_game(today or datetime.date.today())
+        return game.start.date() if game is not None else None
+
+    def game_summary(self, game_date: datetime.date) -> Dict:
+        """
+        Get the general game data of a game.
+
+        Parameters
+        ----------
+        game_date : datetime.date
+            The date of the game
+
+        Returns
+        -------
+        Dict
+            Game data as returned by `get_game_data_by_date`, empty if no game
+        """
+        from ..scraping import get_game_data_by_date
+
+        return get_game_data_by_date(self.stats_soup, game_date.strftime("%m/%d/%Y"))
+
+    def offensive_stats(self, game_date: datetime.date) -> Dict:
+        """
+        Get the team offensive stats of a game.
+
+        Parameters
+        ----------
+        game_date : datetime.date
+            The date of the game
+
+        Returns
+        -------
+        Dict
+            Offensive stats as returned by `get_offensive_stats_by_date`,
+            empty if no game
+        """
+        from ..scraping import get_offensive_stats_by_date
+
+        stats = get_offensive_stats_by_date(
+            self.stats_soup, game_date.strftime("%m/%d/%Y")
+        )
+        return stats if isinstance(stats, dict) else {}
+
+    def player_stats(self) -> Dict[str, Dict]:
+        """
+        Get the season stats of every player.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            Player name to stats, as returned by `get_all_player_stats`
+        """
+        from ..scraping import get_all_player_stats
+
+        return get_all_player_stats(self.stats_soup)
+
+    def create_game_summary_text(self, game_date: datetime.date) -> str:
+        """
+        Create a tweet summarizing a game.
+
+        Parameters
+        ----------
+        game_date : datetime.date
+            The date of the game
+
+        Returns
+        -------
+        str
+            Formatted tweet text with score, goal scorers, records and attendance
+
+        Raises
+        ------
+        ValueError
+            If the stats page is missing data the summary needs, or the
+            summary does not fit in a tweet (TweetTooLong)
+        """
+        gd = self.game_summary(game_date)
+        missing = [stat for stat in summary_stats if gd.get(stat, None) is None]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} not in game data for {game_date}")
+        if not isinstance(gd["Goal Scorers"], list):
+            raise ValueError(f"invalid goal scorer data: {gd['Goal Scorers']}")
+
+        header = (
+            f"GVSU Women's Soccer({gd['Outcome']}) Vs. {gd['Opponent']} "
+            f"{game_date.strftime('%m/%d/%Y')}\n\n"
+            f"| Score: {gd['Score']}\n"
+        )
+        footer = (
+            f"| Overall Record: {gd['Overall Record']}\n"
+            f"| Conference Record: {gd['Conference Record']}\n\n"
+            f"| Fans in Attendance: {gd['Attendance']}"
+        )
+        scorers = "\n        ".join(gd["Goal Scorers"])
+        tweet = f"{header}| Goal Scorers: \n        {scorers}\n{footer}"
+        if tweet_length(tweet) > TWEET_LIMIT:
+            # a high scoring game, list the scorers on one line instead
+            tweet = f"{header}| Goal Scorers: {', '.join(gd['Goal Scorers'])}\n{footer}"
+        if tweet_length(tweet) > TWEET_LIMIT:
+            raise TweetTooLong(f"summary of {game_date} is {tweet_length(tweet)} characters")
+        return tweet
+
+    def get_game_summaries(self, date: datetime.date) -> List[str]:
+        """
+        Get a summary tweet for the game played the day before a date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date to check (will check previous day)
+
+        Returns
+        -------
+        List[str]
+            One summary tweet if there was a game, otherwise none
+        """
+        prev_date = date - datetime.timedelta(days=1)
+        if not self.game_summary(prev_date):
+            return []
+        return [self.create_game_summary_text(prev_date)]
+
+    def get_season_highs_for_date(self, date: datetime.date) -> List[Achievement]:
+        """
+        Get women's soccer season highs that were set/tied on the day before the given date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date to check for season highs (will check previous day)
+
+        Returns
+        -------
+        List[Achievement]
+            The season highs, see `Sport.get_season_highs_for_date`. Empty when the stats page has
+            no individual season high tables.
+        """
+        prev_date = date - datetime.timedelta(days=1)
+        return self._season_highs_on(prev_date)
@@ -1,9 +1,22 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 import datetime
-import random
-import re
-import pandas as pd
-from typing import Any
+import io
+from itertools import chain, groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Optional
+from ..achievements import Achievement, AchievementBatch, as_achievement
+from ..cache import fetch_page
+from ..parsing import read_season_high_tables, read_tables
+from ..snapshot import Snapshot, diff_rows, table_hash
+from ..templates import DEFAULT, TemplateSet
+from ..timing import stage
+
+# pandas/numpy are imported where the season high table is first used, so
+# importing the sports (e.g. for the CLI or tests) does not pay for them
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Sport(ABC):
@@ -20,7 +33,26 @@ class Sport(ABC):
     """
 
     _BASE_URL = "https://gvsulakers.com/sports/{sport}/stats/{year}"
-    __slots__ = ["_year", "_url", "_szn_high_idxs", "_szn_high_df"]
+
+    # matches the date in an opponent string like 'Team Name (MM/DD/YYYY)'
+    _DATE_PATTERN = r"\((\d{1,2}/\d{1,2}/\d{4})\)"
+
+    # upper case statistics that are never tweeted, overridden per sport
+    _negative_stats: frozenset[str] = frozenset()
+
+    # tweet templates, hashtags and verbs, overridden per sport
+    _templates: TemplateSet = DEFAULT
+    __slots__ = [
+        "_year",
+        "_sport",
+        "_url",
+        "_szn_high_idxs",
+        "_szn_high_df",
+        "_szn_highs",
+        "_szn_highs_src",
+        "_szn_high_index",
+        "_szn_high_index_src",
+    ]
 
     def __init__(self, year: int, sport: str) -> None:
         """
@@ -34,7 +66,12 @@ class Sport(ABC):
             The sport identifier used in the URL
         """
         self._year = year
+        self._sport = sport
         self._szn_high_df = None
+        self._szn_highs = None
+        self._szn_highs_src = None
+        self._szn_high_index = None
+        self._szn_high_index_src = None
         self._url = self._BASE_URL.format(
             year=year,
             sport=sport,
@@ -52,6 +89,18 @@ class Sport(ABC):
         """
         return self._year
 
+    @property
+    def sport(self) -> str:
+        """
+        Get the sport identifier used in gvsulakers URLs.
+
+        Returns
+        -------
+        str
+            The sport identifier, e.g. "baseball"
+        """
+        return self._sport
+
     @property
     def url(self) -> str:
         """
@@ -69,6 +118,10 @@ class Sport(ABC):
         """
         Get the indices of season high tables in the scraped data.
 
+        Before the page is loaded these are the class defaults. Once
+        `season_high_df` has loaded, they are the positions found on the
+        page by header signature.
+
         Returns
         -------
         list[int]
@@ -76,12 +129,26 @@ class Sport(ABC):
         """
         return self._szn_high_idxs
 
+    def _fetch_stats_html(self) -> str:
+        """
+        Fetch the stats page through the on-disk page cache.
+
+        Returns
+        -------
+        str
+            The stats page HTML
+        """
+        return fetch_page(self._sport, self._year, "stats", url=self.url)
+
     @property
     def season_high_df(self) -> pd.DataFrame:
         """
         Get the DataFrame containing season high statistics.
 
-        Lazily loads the data from the URL if not already loaded.
+        Lazily loads the data from the URL if not already loaded. The page is
+        fetched through the on-disk page cache, so repeated runs revalidate
+        with a conditional GET instead of downloading the page again. Only
+        the tables whose header matches the season high signature are parsed.
 
         Returns
         -------
@@ -89,83 +156,354 @@ class Sport(ABC):
             DataFrame containing season high statistics
         """
         if self._szn_high_df is None:
-            all_dfs = pd.read_html(self.url)
-            self._szn_high_df = pd.concat(
-                [df for n, df in enumerate(all_dfs) if n in self._szn_high_idxs]
-            )
+            self._load_season_high_df()
+        return self._szn_high_df
+
+    def _load_season_high_df(
+        self, read_html: Callable[[str], list[pd.DataFrame]] = read_tables
+    ) -> pd.DataFrame:
+        """
+        Fetch the stats page and parse its season high tables.
+
+        Parameters
+        ----------
+        read_html : Callable[[str], list[pd.DataFrame]], optional
+            Parses the markup of the season high tables, by default in
+            this thread, see `read_season_high_tables`
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing season high statistics, also kept as
+            `season_high_df`
+        """
+        self._szn_high_df = self._read_season_high_df(
+            self._fetch_stats_html_timed(), read_html
+        )
         return self._szn_high_df
 
-    def create_tweet_text(self, highs: list[dict]) -> str:
+    def _fetch_stats_html_timed(self) -> str:
+        with stage("fetch", sport=self._sport, year=self._year) as record:
+            html = self._fetch_stats_html()
+            record["bytes"] = len(html.encode())
+        return html
+
+    def _read_season_high_df(
+        self, html: str, read_html: Callable[[str], list[pd.DataFrame]] = read_tables
+    ) -> pd.DataFrame:
+        """
+        Parse the season high tables of a stats page into one DataFrame.
+
+        Parameters
+        ----------
+        html : str
+            The stats page HTML
+        read_html : Callable[[str], list[pd.DataFrame]], optional
+            Parses the markup of the season high tables, by default `read_tables`
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing season high statistics
+        """
+        import pandas as pd
+
+        with stage("parse", sport=self._sport, year=self._year) as record:
+            idxs, dfs = read_season_high_tables(
+                html,
+                sport=self._sport,
+                year=self._year,
+                limit=len(self._szn_high_idxs) or None,
+                read_html=read_html,
+            )
+            if idxs:
+                self._szn_high_idxs = idxs
+            elif self._szn_high_idxs:
+                # page layout changed, fall back to the hardcoded positions
+                all_dfs = pd.read_html(io.StringIO(html))
+                dfs = [df for n, df in enumerate(all_dfs) if n in self._szn_high_idxs]
+            else:
+                # the page has no season high tables (yet)
+                dfs = [pd.DataFrame(columns=["Statistic", "High", "Player", "Opponent"])]
+            df = pd.concat(dfs)
+            record["tables"], record["rows"] = len(dfs), len(df)
+        return df
+
+    def _season_highs_long(self) -> pd.DataFrame:
+        """
+        Get the season high table in long format, one row per achievement.
+
+        Tied highs are stored as ``"; "``-joined Player and Opponent strings.
+        They are exploded so each (statistic, player, opponent) is its own
+        row, and the game date is extracted from every opponent at once.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns Statistic, Value, Player, Opponent and Date, where Date
+            is a datetime64 column (NaT when the opponent has no date)
+        """
+        import numpy as np
+        import pandas as pd
+
+        df = self.season_high_df
+        players = df["Player"].astype(str).str.split("; ")
+        opponents = df["Opponent"].astype(str).str.split("; ")
+
+        # pair players with opponents like zip() would, trimming ragged ties
+        ties = np.minimum(players.str.len(), opponents.str.len()).to_numpy()
+        long = pd.DataFrame(
+            {
+                "Statistic": np.repeat(df["Statistic"].to_numpy(), ties),
+                "Value": np.repeat(df["High"].to_numpy(), ties),
+                "Player": pd.Series(
+                    list(chain.from_iterable(p[:k] for p, k in zip(players, ties))),
+                    dtype="str",
+                ),
+                "Opponent": pd.Series(
+                    list(chain.from_iterable(o[:k] for o, k in zip(opponents, ties))),
+                    dtype="str",
+                ),
+            }
+        )
+        long["Date"] = pd.to_datetime(
+            long["Opponent"].str.extract(self._DATE_PATTERN, expand=False),
+            format="%m/%d/%Y",
+            errors="coerce",
+        )
+        return long
+
+    @property
+    def achievements(self) -> AchievementBatch:
+        """
+        Get the tweetable, dated season highs as one columnar batch.
+
+        Built once, the first time it is used after `season_high_df` loads.
+
+        Returns
+        -------
+        AchievementBatch
+            Achievements of statistics that are tweeted and have a game
+            date, in table order
+        """
+        import numpy as np
+
+        df = self.season_high_df
+        if self._szn_highs is None or self._szn_highs_src is not df:
+            with stage("extract", sport=self._sport, year=self._year) as record:
+                batch = AchievementBatch.from_frame(self._season_highs_long())
+                tweetable = ~batch.is_statistic_in(self._negative_stats)
+                highs = batch.take(tweetable & ~np.isnat(batch.dates))
+                record["rows"], record["highs"] = len(batch), len(highs)
+
+            self._szn_highs = highs
+            self._szn_highs_src = df
+        return self._szn_highs
+
+    @property
+    def season_highs_by_date(self) -> dict[datetime.date, list[Achievement]]:
+        """
+        Get the tweetable season highs indexed by the date they were achieved.
+
+        Built once from `achievements`, so looking up any number of dates
+        costs one pass over the table.
+
+        Returns
+        -------
+        dict[datetime.date, list[Achievement]]
+            Game date to its achievements, in table order
+        """
+        highs = self.achievements
+        if self._szn_high_index is None or self._szn_high_index_src is not highs:
+            self._szn_high_index = highs.by_date()
+            self._szn_high_index_src = highs
+        return self._szn_high_index
+
+    def diff_season_highs(
+        self, previous: Optional[Snapshot]
+    ) -> tuple[Snapshot, list[Achievement]]:
+        """
+        Get the tweetable season highs that are new or changed since a snapshot.
+
+        Unlike `get_season_highs_for_date` this does not depend on the game
+        date, so stats entered late, games past midnight and missed runs
+        are all caught. When the season high tables hash the same as in the
+        previous snapshot the page is not parsed at all.
+
+        Parameters
+        ----------
+        previous : Snapshot, optional
+            The last committed snapshot of this season
+
+        Returns
+        -------
+        tuple[Snapshot, list[Achievement]]
+            The current snapshot and the added or changed achievements, in
+            table order
+        """
+        html = self._fetch_stats_html_timed()
+        digest = table_hash(html)
+        if previous is not None and previous.table_hash == digest:
+            return previous, []
+
+        if self._szn_high_df is None:
+            self._szn_high_df = self._read_season_high_df(html)
+
+        import numpy as np
+
+        with stage("extract", sport=self._sport, year=self._year, diff=True) as record:
+            long = self._season_highs_long()
+            current = Snapshot(
+                digest,
+                tuple(
+                    zip(
+                        long["Statistic"].astype(str),
+                        long["Player"].astype(str),
+                        long["Opponent"].astype(str),
+                        long["Value"].astype(str),
+                    )
+                ),
+            )
+            changed = set(diff_rows(previous, current))
+            is_changed = np.fromiter(
+                (row in changed for row in current.rows), bool, len(long)
+            )
+            batch = AchievementBatch.from_frame(long)
+            tweetable = ~batch.is_statistic_in(self._negative_stats)
+            highs = batch.take(is_changed & tweetable & ~np.isnat(batch.dates))
+            record["rows"], record["highs"] = len(long), len(highs)
+        return current, list(highs)
+
+    def _season_highs_on(self, game_date: datetime.date) -> list[Achievement]:
+        """
+        Get the tweetable season highs achieved on a game date.
+
+        Parameters
+        ----------
+        game_date : datetime.date
+            The date the games were played
+
+        Returns
+        -------
+        list[Achievement]
+            The achievements of that date, in table order
+        """
+        return list(self.season_highs_by_date.get(game_date, []))
+
+    def get_season_highs_for_range(
+        self, start: datetime.date, end: datetime.date
+    ) -> dict[datetime.date, list[Achievement]]:
+        """
+        Get season highs for every check date in a range with one table scan.
+
+        Parameters
+        ----------
+        start : datetime.date
+            First date to check (inclusive), will check the previous day
+        end : datetime.date
+            Last date to check (inclusive), will check the previous day
+
+        Returns
+        -------
+        dict[datetime.date, list[Achievement]]
+            Check date to the achievements `get_season_highs_for_date` would
+            return for it, only for dates that have any
+        """
+        index = self.season_highs_by_date
+        highs = {}
+        for offset in range((end - start).days + 1):
+            date = start + datetime.timedelta(days=offset)
+            on_date = index.get(date - datetime.timedelta(days=1))
+            if on_date:
+                highs[date] = list(on_date)
+        return highs
+
+    def create_tweet_text(self, highs: list[Achievement]) -> str:
         """
         Create an engaging tweet about season high achievement(s).
 
         Parameters
         ----------
-        highs : list[dict]
-            List of dictionaries containing achievement information.
-            Each dictionary should contain:
-            - Player: str, name of the player
-            - Value: Any, the value achieved
-            - Statistic: str, type of statistic
-            - Opponent: str, opposing team
+        highs : list[Achievement]
+            The achievements to tweet about. Dictionaries with the keys
+            Player, Value, Statistic and Opponent are accepted too.
 
         Returns
         -------
         str
-            Formatted tweet text describing the achievement(s)
+            Formatted tweet text describing the achievement(s), at most
+            TWEET_LIMIT characters long
+
+        Raises
+        ------
+        TweetTooLong
+            If not even the compact fallback template fits
 
         Notes
         -----
-        This is a default implementation that can be overridden by specific sports.
+        The templates, hashtags and verbs come from the sport's entry in
+        the template registry (`_templates`).
         Handles both single and multiple achievements by the same player.
         """
-        # If multiple achievements by same player, combine them
-        player = highs[0]["Player"]
-        assert isinstance(player, str)
-
-        if all(h["Player"] == player for h in highs):
-            if len(highs) == 1:
-                high = highs[0]
-                single_templates = [
-                    "🚨 SEASON HIGH ALERT! 🚨\n{player} just recorded {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
-                    "🔥 {player} is ON FIRE! 🔥\nJust set a season high with {value} {stat_type} vs {opponent}! #AnchorUp",
-                    "⚡️ RECORD BREAKER ⚡️\n{player} leads the way with {value} {stat_type} against {opponent}! #AnchorUp",
-                    "👀 Look what {player} just did!\nNew season high: {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
-                    "💪 BEAST MODE: {player} 💪\nDominates with {value} {stat_type} against {opponent}! #AnchorUp",
-                ]
-
-                return random.choice(single_templates).format(
-                    player=high["Player"],
-                    value=high["Value"],
-                    stat_type=high["Statistic"].lower(),
-                    opponent=re.sub(r"\s*\([^)]*\)", "", high["Opponent"]),
-                )
+        return self._templates.render(highs)
+
+    def compose_all(
+        self, highs: list[Achievement] | AchievementBatch
+    ) -> tuple[list[list[Achievement]], list[str]]:
+        """
+        Compose the tweets of a day's season highs in one pass.
+
+        Highs are grouped by player and every group is rendered with the
+        sport's templates. A group too long for one tweet is split in
+        halves, so every returned tweet fits in TWEET_LIMIT.
+
+        Parameters
+        ----------
+        highs : list[Achievement] | AchievementBatch
+            Season highs as returned by `get_season_highs_for_date`, or a
+            batch such as `achievements`
+
+        Returns
+        -------
+        tuple[list[list[Achievement]], list[str]]
+            The highs of each tweet, sorted by player, and the tweets, aligned
+
+        Raises
+        ------
+        TweetTooLong
+            If a single achievement cannot fit in a tweet
+        """
+        with stage("group", sport=self._sport, highs=len(highs)) as record:
+            if isinstance(highs, AchievementBatch):
+                groups = [list(group) for group in highs.group_by_player()]
             else:
-                # Combine multiple achievements
-                achievements = []
-                for high in highs:
-                    stat = high["Statistic"].lower()
-                    achievements.append(f"{high['Value']} {stat}")
-                achievements_str = (
-                    ", ".join(achievements[:-1]) + f" and {achievements[-1]}"
-                )
-                multi_templates = [
-                    "🔥 WHAT A GAME! 🔥\n{player} sets multiple season highs with {achievements} against {opponent}! #AnchorUp ⚓️",
-                    "⚡️ {player} IS UNSTOPPABLE! ⚡️\nNew season highs: {achievements} vs {opponent}! #AnchorUp",
-                    "💪 DOMINANT PERFORMANCE 💪\n{player} sets new highs with {achievements} against {opponent}! #AnchorUp",
-                ]
-                return random.choice(multi_templates).format(
-                    player=player,
-                    achievements=achievements_str,
-                    opponent=re.sub(r"\s*\([^)]*\)", "", highs[0]["Opponent"]),
-                )
-
-        # If we somehow get here (shouldn't with current logic), use a simple template
-        high = highs[0]
-        return f"🎯 New season high! {high['Player']} recorded {high['Value']} {high['Statistic'].lower()} against {re.sub(r'\s*\([^)]*\)', '', high['Opponent'])}! #AnchorUp"
+                highs = sorted(map(as_achievement, highs), key=attrgetter("Player"))
+                groups = [list(group) for _, group in groupby(highs, key=attrgetter("Player"))]
+            record["groups"] = len(groups)
+        with stage("compose", sport=self._sport) as record:
+            groups, tweets = self._templates.render_all(groups)
+            record["tweets"] = len(tweets)
+        return groups, tweets
+
+    def get_game_summaries(self, date: datetime.date) -> list[str]:
+        """
+        Get game summary tweets for the games played the day before a date.
+
+        Parameters
+        ----------
+        date : datetime.date
+            The date to check (will check previous day)
+
+        Returns
+        -------
+        list[str]
+            Tweet texts to post alongside the season highs. The default
+            implementation has none; sports with game summaries override it.
+        """
+        return []
 
     @abstractmethod
-    def get_season_highs_for_date(self, date: datetime.date) -> list[dict[str, Any]]:
+    def get_season_highs_for_date(self, date: datetime.date) -> list[Achievement]:
         """
         Get season highs that were set/tied on the day before the given date.
 
@@ -176,17 +514,8 @@ class Sport(ABC):
 
         Returns
         -------
-        list[dict[str, Any]]
-            List of dictionaries containing season high information:
-            - Statistic : str
-                Name of the statistic
-            - Value : float
-                Value achieved
-            - Player : str
-                Player who achieved it
-            - Opponent : str
-                Opponent it was achieved against
-            - Date : datetime.date
-                Date it was achieved
+        list[Achievement]
+            The season highs, with their Statistic, Value, Player,
+            Opponent and Date
         """
         pass
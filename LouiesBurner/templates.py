@@ -0,0 +1,365 @@
+"""Precompiled tweet templates per sport, with tweet length validation."""
+
+import random
+import re
+from string import Formatter
+from typing import Any, Mapping, Optional
+
+from .achievements import Achievement, as_achievement
+
+__all__ = [
+    "BASEBALL",
+    "DEFAULT",
+    "SOFTBALL",
+    "TEMPLATES",
+    "TWEET_LIMIT",
+    "TemplateSet",
+    "TweetTooLong",
+    "get_templates",
+    "tweet_length",
+]
+
+
+# X rejects tweets longer than this many weighted characters
+TWEET_LIMIT: int = 280
+
+# code point ranges X counts as one character, everything else counts as two
+# (twitter-text v3 configuration)
+_LIGHT_RANGES = ((0, 4351), (8192, 8205), (8208, 8223), (8242, 8247))
+
+# variation selectors and zero width joiners are part of the emoji before them
+_INVISIBLE = re.compile("[\ufe00-\ufe0f\u200d]")
+
+# ' (03/15/2024)' after an opponent name
+_OPPONENT_DATE = re.compile(r"\s*\([^)]*\)")
+
+
+class TweetTooLong(ValueError):
+    """A tweet that cannot be made to fit in TWEET_LIMIT."""
+
+
+def tweet_length(text: str) -> int:
+    """
+    Count the length of a tweet the way X does.
+
+    Parameters
+    ----------
+    text : str
+        Tweet text
+
+    Returns
+    -------
+    int
+        Weighted length, where emoji and most non-Latin characters count twice
+    """
+    length = 0
+    for char in _INVISIBLE.sub("", text):
+        cp = ord(char)
+        length += 1 if any(lo <= cp <= hi for lo, hi in _LIGHT_RANGES) else 2
+    return length
+
+
+def _compile(template: str) -> tuple[tuple[str, Optional[str]], ...]:
+    # split once into (literal, field) pairs so rendering is a join
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def _render(parts: tuple[tuple[str, Optional[str]], ...], fields: dict[str, Any]) -> str:
+    return "".join(
+        literal if field is None else f"{literal}{fields[field]}" for literal, field in parts
+    )
+
+
+class TemplateSet:
+    """
+    The tweet templates, verbs and hashtags of one sport, compiled once.
+
+    Fields available to the templates are player, value, stat_type, verb,
+    opponent and hashtags for a single achievement, and player,
+    achievements, opponent and hashtags for several.
+
+    Attributes
+    ----------
+    hashtags : str
+        Hashtags of the sport, used by the fallback templates
+    verbs : dict[str, str]
+        Lower case statistic to the verb used with it
+    default_verb : str
+        Verb for statistics without one
+    """
+
+    __slots__ = [
+        "hashtags",
+        "verbs",
+        "default_verb",
+        "_single",
+        "_multi",
+        "_fallback",
+        "_fallback_multi",
+    ]
+
+    def __init__(
+        self,
+        single: list[str],
+        multi: list[str],
+        fallback: str,
+        fallback_multi: str,
+        hashtags: str = "#AnchorUp",
+        verbs: Optional[dict[str, str]] = None,
+        default_verb: str = "recorded",
+    ) -> None:
+        """
+        Initialize a TemplateSet.
+
+        Parameters
+        ----------
+        single : list[str]
+            Templates for one achievement, one is picked at random
+        multi : list[str]
+            Templates for several achievements by the same player
+        fallback : str
+            Compact template for one achievement, used when the others are
+            too long
+        fallback_multi : str
+            Compact template for several achievements
+        hashtags : str, optional
+            Hashtags of the sport, by default "#AnchorUp"
+        verbs : dict[str, str], optional
+            Lower case statistic to verb, by default none
+        default_verb : str, optional
+            Verb for statistics without one, by default "recorded"
+        """
+        self.hashtags = hashtags
+        self.verbs = dict(verbs or {})
+        self.default_verb = default_verb
+        self._single = tuple(_compile(t) for t in single)
+        self._multi = tuple(_compile(t) for t in multi)
+        self._fallback = _compile(fallback)
+        self._fallback_multi = _compile(fallback_multi)
+
+    def verb(self, stat: str) -> str:
+        """
+        Get the verb used with a statistic.
+
+        Parameters
+        ----------
+        stat : str
+            The name of the statistic, any case
+
+        Returns
+        -------
+        str
+            The verb of the statistic, or the default verb
+        """
+        return self.verbs.get(stat.lower(), self.default_verb)
+
+    def _fields(self, highs: list[Achievement]) -> dict[str, Any]:
+        high = highs[0]
+        fields = {
+            "player": high.Player,
+            "opponent": _OPPONENT_DATE.sub("", high.Opponent),
+            "hashtags": self.hashtags,
+        }
+        if len(highs) == 1:
+            fields.update(
+                value=high.Value,
+                stat_type=high.Statistic.lower(),
+                verb=self.verb(high.Statistic),
+            )
+        else:
+            achievements = [f"{h.Value} {h.Statistic.lower()}" for h in highs]
+            fields["achievements"] = (
+                ", ".join(achievements[:-1]) + f" and {achievements[-1]}"
+            )
+        return fields
+
+    def render(
+        self, highs: list[Achievement | Mapping[str, Any]], limit: int = TWEET_LIMIT
+    ) -> str:
+        """
+        Render one tweet for the achievements of one player.
+
+        A template is picked at random. If the tweet would be too long, the
+        other templates are tried from shortest to longest, then the
+        compact fallback. Achievements of different players only get the
+        fallback for the first one.
+
+        Parameters
+        ----------
+        highs : list[Achievement | Mapping[str, Any]]
+            Achievements, or dictionaries with Player, Value, Statistic and
+            Opponent keys
+        limit : int, optional
+            Maximum weighted length, by default TWEET_LIMIT
+
+        Returns
+        -------
+        str
+            The tweet text
+
+        Raises
+        ------
+        TweetTooLong
+            If not even the fallback fits
+        """
+        highs = [as_achievement(h) for h in highs]
+        mixed = any(h.Player != highs[0].Player for h in highs)
+        if mixed:
+            # no template fits several players, keep the first one's high
+            highs = highs[:1]
+        fields = self._fields(highs)
+
+        if not mixed:
+            candidates = self._single if len(highs) == 1 else self._multi
+            tweet = _render(random.choice(candidates), fields)
+            if tweet_length(tweet) <= limit:
+                return tweet
+            for tweet in sorted((_render(t, fields) for t in candidates), key=tweet_length):
+                if tweet_length(tweet) <= limit:
+                    return tweet
+
+        fallback = self._fallback if len(highs) == 1 else self._fallback_multi
+        tweet = _render(fallback, fields)
+        if tweet_length(tweet) > limit:
+            raise TweetTooLong(f"{tweet_length(tweet)} > {limit}: {tweet!r}")
+        return tweet
+
+    def render_all(
+        self, groups: list[list[Achievement]], limit: int = TWEET_LIMIT
+    ) -> tuple[list[list[Achievement]], list[str]]:
+        """
+        Render one tweet per group, splitting groups that cannot fit in one.
+
+        Parameters
+        ----------
+        groups : list[list[Achievement]]
+            Achievements grouped by player
+        limit : int, optional
+            Maximum weighted length, by default TWEET_LIMIT
+
+        Returns
+        -------
+        tuple[list[list[Achievement]], list[str]]
+            The achievements of each tweet and the tweets, aligned
+
+        Raises
+        ------
+        TweetTooLong
+            If a single achievement cannot fit
+        """
+        out_groups, tweets = [], []
+        pending = list(reversed(groups))
+        while pending:
+            group = pending.pop()
+            try:
+                tweets.append(self.render(group, limit))
+                out_groups.append(group)
+            except TweetTooLong:
+                if len(group) == 1:
+                    raise
+                half = len(group) // 2
+                pending += [group[half:], group[:half]]
+        return out_groups, tweets
+
+
+DEFAULT = TemplateSet(
+    single=[
+        "🚨 SEASON HIGH ALERT! 🚨\n{player} just recorded {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+        "🔥 {player} is ON FIRE! 🔥\nJust set a season high with {value} {stat_type} vs {opponent}! #AnchorUp",
+        "⚡️ RECORD BREAKER ⚡️\n{player} leads the way with {value} {stat_type} against {opponent}! #AnchorUp",
+        "👀 Look what {player} just did!\nNew season high: {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
+        "💪 BEAST MODE: {player} 💪\nDominates with {value} {stat_type} against {opponent}! #AnchorUp",
+    ],
+    multi=[
+        "🔥 WHAT A GAME! 🔥\n{player} sets multiple season highs with {achievements} against {opponent}! #AnchorUp ⚓️",
+        "⚡️ {player} IS UNSTOPPABLE! ⚡️\nNew season highs: {achievements} vs {opponent}! #AnchorUp",
+        "💪 DOMINANT PERFORMANCE 💪\n{player} sets new highs with {achievements} against {opponent}! #AnchorUp",
+    ],
+    fallback="{player}: season high {value} {stat_type} vs {opponent} {hashtags}",
+    fallback_multi="{player}: season highs {achievements} vs {opponent} {hashtags}",
+)
+
+BASEBALL = TemplateSet(
+    single=[
+        "🚨 SEASON HIGH ALERT! 🚨\n{player} just {verb} {stat_type} with {value} against {opponent}! #AnchorUp ⚓️",
+        "🔥 {player} is ON FIRE! 🔥\nJust set a season high with {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
+        "⚡️ RECORD BREAKER ⚡️\n{player} leads the way with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+        "👀 Look what {player} just did!\nNew season high: {value} {stat_type} vs {opponent}! #AnchorUp⚓️",
+        "💪 BEAST MODE: {player} 💪\nDominates with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+    ],
+    multi=[
+        "🔥 WHAT A GAME! 🔥\n{player} sets multiple season highs with {achievements} against {opponent}! #AnchorUp",
+        "⚡️ {player} IS UNSTOPPABLE! ⚡️\nNew season highs: {achievements} vs {opponent}! #GLVCbsb",
+        "💪 DOMINANT PERFORMANCE 💪\n{player} sets new highs with {achievements} against {opponent}! #AnchorUp",
+    ],
+    fallback="{player}: season high {value} {stat_type} vs {opponent} {hashtags}",
+    fallback_multi="{player}: season highs {achievements} vs {opponent} {hashtags}",
+    hashtags="#AnchorUp #GLVCbsb",
+    verbs={
+        "strikeouts": "racked up",
+        "hits": "racked up",
+        "runs scored": "racked up",
+        "rbis": "racked up",
+        "home runs": "crushed",
+        "doubles": "crushed",
+        "triples": "crushed",
+        "stolen bases": "swiped",
+        "innings pitched": "dominated for",
+    },
+)
+
+SOFTBALL = TemplateSet(
+    single=[
+        "🥎 SEASON HIGH ALERT! 🥎\n{player} just {verb} {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+        "🔥 {player} is ON FIRE! 🔥\nJust set a season high with {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
+        "⚡️ RECORD BREAKER ⚡️\n{player} leads the way with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+        "👀 Look what {player} just did!\nNew season high: {value} {stat_type} vs {opponent}! #AnchorUp ⚓️",
+        "💪 BEAST MODE: {player} 💪\nDominates with {value} {stat_type} against {opponent}! #AnchorUp ⚓️",
+    ],
+    multi=[
+        "🥎 WHAT A GAME! 🥎\n{player} sets multiple season highs with {achievements} against {opponent}! #AnchorUp #GLVCsb ⚓️",
+        "⚡️ {player} IS UNSTOPPABLE! ⚡️\nNew season highs: {achievements} vs {opponent}! #GLVCsb",
+        "💪 DOMINANT PERFORMANCE 💪\n{player} sets new highs with {achievements} against {opponent}! #AnchorUp #GLVCsb",
+    ],
+    fallback="{player}: season high {value} {stat_type} vs {opponent} {hashtags}",
+    fallback_multi="{player}: season highs {achievements} vs {opponent} {hashtags}",
+    hashtags="#AnchorUp #GLVCsb",
+    verbs={
+        "at bats": "finished with",
+        "hits": "racked up",
+        "runs scored": "racked up",
+        "rbis": "racked up",
+        "home runs": "crushed",
+        "doubles": "crushed",
+        "triples": "crushed",
+        "stolen bases": "swiped",
+        "walks": "drew",
+        "sac hits": "executed",
+        "sac flies": "executed",
+        "hit by pitch": "took one for the team with",
+    },
+)
+
+# sport name to its templates, sports without an entry use "default"
+TEMPLATES: dict[str, TemplateSet] = {
+    "default": DEFAULT,
+    "baseball": BASEBALL,
+    "softball": SOFTBALL,
+}
+
+
+def get_templates(sport: str) -> TemplateSet:
+    """
+    Get the templates of a sport.
+
+    Parameters
+    ----------
+    sport : str
+        Sport identifier, e.g. "baseball"
+
+    Returns
+    -------
+    TemplateSet
+        The sport's templates, or the default ones
+    """
+    return TEMPLATES.get(sport, DEFAULT)
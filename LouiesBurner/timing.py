@@ -0,0 +1,107 @@
+"""Per-stage timings of a run, emitted as JSON lines."""
+
+import atexit
+import contextlib
+import json
+import sys
+import threading
+import time
+from collections import deque
+from typing import IO, Any, Iterator, Optional
+
+__all__ = ["configure", "get_timings", "reset_timings", "stage"]
+
+
+# stages kept in memory, the oldest are dropped first so a long serve stays bounded
+MAX_RECORDS: int = 10_000
+
+_records: deque[dict[str, Any]] = deque(maxlen=MAX_RECORDS)
+_lock = threading.Lock()
+_sink: Optional[IO[str]] = None
+# whether _sink is a file configure opened, and so has to close
+_owns_sink: bool = False
+
+
+def configure(sink: Optional[IO[str] | str]) -> None:
+    """
+    Choose where finished stages are written.
+
+    A file opened for a previous path is closed, and the last one is closed
+    at exit.
+
+    Parameters
+    ----------
+    sink : IO[str] | str, optional
+        A text stream, a file path to append to, ``"-"`` for stderr, or
+        None to only keep the records in memory
+    """
+    global _sink, _owns_sink
+    owns = isinstance(sink, str) and sink != "-"
+    if isinstance(sink, str):
+        sink = sys.stderr if sink == "-" else open(sink, "a", buffering=1)
+    with _lock:
+        previous, owned = _sink, _owns_sink
+        _sink, _owns_sink = sink, owns
+    if owned and previous is not None:
+        previous.close()
+
+
+atexit.register(configure, None)
+
+
+@contextlib.contextmanager
+def stage(name: str, **fields: Any) -> Iterator[dict[str, Any]]:
+    """
+    Time a stage of the pipeline.
+
+    The yielded record can be filled with counts (bytes, rows, tweets, ...)
+    while the stage runs. It is written as one JSON line when the stage
+    ends, also when it raises.
+
+    Parameters
+    ----------
+    name : str
+        Stage name, e.g. "fetch", "parse" or "post"
+    **fields : Any
+        Context such as the sport, stored in the record
+
+    Yields
+    ------
+    dict[str, Any]
+        The record, with the keys stage, seconds and the given fields
+    """
+    record = {"stage": name, **fields}
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        record["seconds"] = round(time.perf_counter() - start, 6)
+        with _lock:
+            _records.append(record)
+            if _sink is not None:
+                _sink.write(json.dumps(record, default=str) + "\n")
+
+
+def get_timings() -> list[dict[str, Any]]:
+    """
+    Get the stages recorded so far.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One record per finished stage, in the order they finished, at most
+        the last MAX_RECORDS
+    """
+    with _lock:
+        return list(_records)
+
+
+def reset_timings() -> None:
+    """
+    Forget all recorded stages.
+    """
+    with _lock:
+        _records.clear()
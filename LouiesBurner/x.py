@@ -1,7 +1,11 @@
-from tweepy import API, Client, OAuth1UserHandler
 import os
+from functools import cache
+from typing import TYPE_CHECKING
 
-__all__ = ["api", "client"]
+if TYPE_CHECKING:
+    from tweepy import API, Client
+
+__all__ = ["api", "client", "get_api", "get_client"]
 
 CLIENT_ID = os.environ.get("CLIENT_ID")
 CLIENT_SECRET = os.environ.get("CLIENT_SECRET")
@@ -12,18 +16,55 @@ CONSUMER_KEY = os.environ.get("CONSUMER_KEY")
 CONSUMER_SECRET = os.environ.get("CONSUMER_SECRET")
 
 
-_auth = OAuth1UserHandler(
-    consumer_key=CONSUMER_KEY,
-    consumer_secret=CONSUMER_SECRET,
-    access_token=ACCESS_TOKEN,
-    access_token_secret=ACCESS_TOKEN_SECRET,
-)
+# tweepy is only imported, and the clients only built, the first time
+# something actually talks to X, so dry runs and tests never pay for it
+
+
+@cache
+def get_api() -> "API":
+    """
+    Get the v1.1 API handle, building it on first use.
+
+    Returns
+    -------
+    tweepy.API
+        API authenticated with the OAuth 1.0a user credentials
+    """
+    from tweepy import API, OAuth1UserHandler
+
+    auth = OAuth1UserHandler(
+        consumer_key=CONSUMER_KEY,
+        consumer_secret=CONSUMER_SECRET,
+        access_token=ACCESS_TOKEN,
+        access_token_secret=ACCESS_TOKEN_SECRET,
+    )
+    return API(auth)
+
+
+@cache
+def get_client() -> "Client":
+    """
+    Get the v2 client used to post tweets, building it on first use.
+
+    Returns
+    -------
+    tweepy.Client
+        Client authenticated with the OAuth 1.0a user credentials
+    """
+    from tweepy import Client
+
+    return Client(
+        consumer_key=CONSUMER_KEY,
+        consumer_secret=CONSUMER_SECRET,
+        access_token=ACCESS_TOKEN,
+        access_token_secret=ACCESS_TOKEN_SECRET,
+    )
 
-api = API(_auth)
 
-client = Client(
-    consumer_key=CONSUMER_KEY,
-    consumer_secret=CONSUMER_SECRET,
-    access_token=ACCESS_TOKEN,
-    access_token_secret=ACCESS_TOKEN_SECRET,
-)
+def __getattr__(name: str):
+    # keeps `from LouiesBurner.x import api, client` working, lazily
+    if name == "api":
+        return get_api()
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
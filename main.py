@@ -1,13 +1,175 @@
 import datetime
-import time
-from itertools import groupby
-from LouiesBurner.sports import SPORTS
-from LouiesBurner.x import client
+from concurrent.futures import ThreadPoolExecutor
+from LouiesBurner.achievements import Achievement
+from LouiesBurner.ledger import Ledger
+from LouiesBurner.posting import post_tweets
+from LouiesBurner.session import get_session, summarize_request_stats
+from LouiesBurner.snapshot import SnapshotStore
+from LouiesBurner.timing import configure, stage
+from LouiesBurner.sports import SPORTS, Sport
+from LouiesBurner.x import get_client
+
+
+def load_season_highs(
+    sport: str,
+    date: datetime.date,
+    snapshots: SnapshotStore | None = None,
+) -> tuple[Sport, list[Achievement]]:
+    """
+    Fetch, parse and extract the season highs of one sport.
+
+    Parameters
+    ----------
+    sport : str
+        The name of the sport to load. Must be one of the keys in SPORTS dictionary.
+    date : datetime.date
+        The date to check for season highs. Will check the previous day's data.
+    snapshots : SnapshotStore, optional
+        When given, highs are found by diffing the season high table against
+        the last committed snapshot instead of by date. The new snapshot is
+        staged, `post_season_highs` commits it once everything was posted.
+        The first snapshot of a season falls back to the date.
+
+    Returns
+    -------
+    tuple[Sport, list[Achievement]]
+        The loaded sport object and the season highs set on the previous day,
+        or added/changed since the last snapshot
+    """
+    sport_class = SPORTS.get(sport, None)
+    assert sport_class is not None, f"Invalid sport '{sport}'"
+
+    sport_obj = sport_class(year=date.year)
+    if snapshots is None:
+        return sport_obj, sport_obj.get_season_highs_for_date(date)
+
+    previous = snapshots.load(sport, sport_obj.year)
+    snapshot, new_highs = sport_obj.diff_season_highs(previous)
+    if previous is None:
+        # without a baseline every row is new, only the date tells what to post
+        new_highs = sport_obj.get_season_highs_for_date(date)
+    snapshots.stage(sport, sport_obj.year, snapshot)
+    return sport_obj, new_highs
+
+
+def load_all_season_highs(
+    date: datetime.date,
+    sports: list[str] | None = None,
+    max_workers: int = 4,
+    snapshots: SnapshotStore | None = None,
+) -> dict[str, tuple[Sport, list[Achievement]] | Exception]:
+    """
+    Load the season highs of several sports concurrently.
+
+    Fetching and parsing overlap across sports on a bounded thread pool, so
+    loading every sport takes about as long as the slowest one.
+
+    Parameters
+    ----------
+    date : datetime.date
+        The date to check for season highs. Will check the previous day's data.
+    sports : list[str], optional
+        Names of the sports to load, by default every key in SPORTS.
+    max_workers : int, optional
+        Upper bound on concurrent loads, by default 4.
+    snapshots : SnapshotStore, optional
+        Find highs by snapshot diff, see `load_season_highs`.
+
+    Returns
+    -------
+    dict[str, tuple[Sport, list[Achievement]] | Exception]
+        Per sport, either what `load_season_highs` returned or the exception
+        that made it fail.
+    """
+    sports = list(SPORTS) if sports is None else sports
+    results: dict[str, tuple[Sport, list[Achievement]] | Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sports)))) as pool:
+        futures = {
+            sport: pool.submit(load_season_highs, sport, date, snapshots)
+            for sport in sports
+        }
+        for sport, future in futures.items():
+            try:
+                results[sport] = future.result()
+            except Exception as e:
+                results[sport] = e
+    return results
+
+
+def main_all(
+    date: datetime.date,
+    ledger: Ledger | None = None,
+    snapshots: SnapshotStore | None = None,
+    force: bool = False,
+    _retries: int = 5,
+    _retry_sleep_time: int = 2,
+) -> None:
+    """
+    Process and tweet season highs for every sport in SPORTS.
+
+    Parameters
+    ----------
+    date : datetime.date
+        The date to check for season highs. Will check the previous day's data.
+    ledger : Ledger, optional
+        Posting ledger; sports that already handled the date are not loaded.
+    snapshots : SnapshotStore, optional
+        Find highs by snapshot diff, every sport is loaded since late stats
+        can show up after a date was handled.
+    force : bool, optional
+        Load every sport even if the ledger says it handled the date, by
+        default False. Highs already in the ledger are still not reposted.
+    _retries : int, optional
+        Number of attempts per tweet if posting it fails, by default 5.
+    _retry_sleep_time : int, optional
+        Upper bound in seconds of the first retry delay, doubled on each
+        further attempt, by default 2.
+
+    Returns
+    -------
+    None
+        Prints a result or failure message per sport.
+    """
+    sports = list(SPORTS)
+    if ledger is not None and snapshots is None and not force:
+        sports = [sport for sport in sports if not ledger.is_handled(sport, date)]
+        if not sports:
+            return print(f"Every sport already handled {date}")
+
+    failures = {}
+    for sport, result in load_all_season_highs(
+        date, sports=sports, snapshots=snapshots
+    ).items():
+        if isinstance(result, Exception):
+            print(f"Failed to load {sport}: {result!r}")
+            failures[sport] = result
+            continue
+
+        sport_obj, new_highs = result
+        try:
+            post_season_highs(
+                sport=sport,
+                sport_obj=sport_obj,
+                new_highs=new_highs,
+                date=date,
+                ledger=ledger,
+                snapshots=snapshots,
+                _retries=_retries,
+                _retry_sleep_time=_retry_sleep_time,
+            )
+        except Exception as e:
+            print(f"Failed to post {sport}: {e!r}")
+            failures[sport] = e
+
+    if failures:
+        print(f"{len(failures)}/{len(sports)} sports failed: {', '.join(failures)}")
 
 
 def main(
     sport: str,
     date: datetime.date,
+    force: bool = False,
+    diff: bool = False,
     _retries: int = 5,
     _retry_sleep_time: int = 2,
 ) -> None:
@@ -17,13 +179,20 @@ def main(
     Parameters
     ----------
     sport : str
-        The name of the sport to process. Must be one of the keys in SPORTS dictionary.
+        The name of the sport to process. Must be one of the keys in SPORTS dictionary,
+        or "all" to process every sport concurrently.
     date : datetime.date
         The date to check for season highs. Will check the previous day's data.
+    force : bool, optional
+        Process the date even if the ledger says it was handled, by default False.
+    diff : bool, optional
+        Find highs by diffing the season high table against the last
+        snapshot instead of by date, by default False.
     _retries : int, optional
-        Number of retry attempts if tweet posting fails, by default 5.
+        Number of attempts per tweet if posting it fails, by default 5.
     _retry_sleep_time : int, optional
-        Time in seconds to sleep between retries, by default 2.
+        Upper bound in seconds of the first retry delay, doubled on each
+        further attempt, by default 2.
 
     Returns
     -------
@@ -36,57 +205,342 @@ def main(
     1. Validates the sport and creates appropriate sport object
     2. Gets season highs for the specified date
     3. Groups achievements by player
-    4. Creates and posts tweets for each player's achievements
-    5. Handles posting failures with retries
+    4. Creates a tweet for each player's achievements
+    5. Posts the tweets, retrying only the ones that fail
+
+    The stats page is fetched at most once, no matter how many posts fail,
+    and not at all when the posting ledger says the date was already handled.
     """
-    if not _retries:
-        return print("maximum retries reached, try again")
+    snapshots = SnapshotStore() if diff else None
+    with Ledger() as ledger:
+        if sport == "all":
+            return main_all(
+                date=date,
+                ledger=ledger,
+                snapshots=snapshots,
+                force=force,
+                _retries=_retries,
+                _retry_sleep_time=_retry_sleep_time,
+            )
 
-    sport_class = SPORTS.get(sport, None)
-    assert sport_class is not None, f"Invalid sport '{sport}'"
+        if not force and not diff and ledger.is_handled(sport, date):
+            return print(f"{sport} season highs for {date} were already handled")
 
-    sport_obj = sport_class(year=date.year)
-    new_highs = sport_obj.get_season_highs_for_date(date)
+        sport_obj, new_highs = load_season_highs(sport, date, snapshots)
+        return post_season_highs(
+            sport=sport,
+            sport_obj=sport_obj,
+            new_highs=new_highs,
+            date=date,
+            ledger=ledger,
+            snapshots=snapshots,
+            _retries=_retries,
+            _retry_sleep_time=_retry_sleep_time,
+        )
+
+
+def serve(
+    sports: list[str] | None = None,
+    diff: bool = False,
+    check_time: datetime.time | None = None,
+    poll: bool = False,
+) -> None:
+    """
+    Check sports after their games from one long-running process.
+
+    Reads the exported schedules, sleeps until the day after each game day
+    and runs `main` for that sport and date. The HTTP session, page cache,
+    schedules and X client stay warm between checks, and every sport runs on
+    the same event loop.
+
+    Parameters
+    ----------
+    sports : list[str], optional
+        Sports to serve, by default every sport with a schedule csv.
+    diff : bool, optional
+        Find highs by snapshot diff, see `main`, by default False.
+    check_time : datetime.time, optional
+        Timezone aware time of day of the checks, by default 12:00 UTC.
+    poll : bool, optional
+        Also poll the stats pages from the scheduled end of the games and
+        check as soon as the season high tables change, by default False.
+
+    Returns
+    -------
+    None
+        Returns once every served season has no checks left.
+    """
+    import asyncio
+    from functools import partial
+
+    from LouiesBurner.daemon import CHECK_TIME, serve as serve_checks
+
+    def warm() -> None:
+        get_session()
+        get_client()
+
+    ran = asyncio.run(
+        serve_checks(
+            partial(main, diff=diff),
+            sports=sports,
+            check_time=check_time or CHECK_TIME,
+            warm=warm,
+            poll=poll,
+            snapshots=SnapshotStore() if diff else None,
+        )
+    )
+    print(f"No checks left, ran {sum(ran.values())}")
+
+
+def replay_date(sport_obj: Sport, date: datetime.date) -> list[dict]:
+    """
+    Compose the tweets a run for one date would post, without posting them.
+
+    Parameters
+    ----------
+    sport_obj : Sport
+        The loaded sport object.
+    date : datetime.date
+        The date to check for season highs. Will check the previous day's data.
+
+    Returns
+    -------
+    list[dict]
+        One record per tweet with the keys sport, date, game_date, kind
+        ("summary" or "highs"), highs, tweet and length, or a single record
+        with an error key when a tweet could not be composed.
+    """
+    from LouiesBurner.templates import tweet_length
+
+    base = {
+        "sport": sport_obj.sport,
+        "date": date.isoformat(),
+        "game_date": (date - datetime.timedelta(days=1)).isoformat(),
+    }
+    records = []
+    try:
+        for tweet in sport_obj.get_game_summaries(date):
+            records.append({**base, "kind": "summary", "highs": [], "tweet": tweet})
+        groups, tweets = compose_tweets(
+            sport_obj, sport_obj.get_season_highs_for_date(date)
+        )
+    except ValueError as e:
+        # TweetTooLong, or a malformed row the templates could not format
+        return [{**base, "error": f"{type(e).__name__}: {e}"}]
+    for group, tweet in zip(groups, tweets):
+        highs = [high._asdict() for high in group]
+        records.append({**base, "kind": "highs", "highs": highs, "tweet": tweet})
+    for record in records:
+        record["length"] = tweet_length(record["tweet"])
+    return records
+
+
+def replay(
+    sports: list[str], year: int, output: str = "-", seed: int | None = None
+) -> dict[str, int]:
+    """
+    Dry-run a whole season: compose the tweets of every check date, post nothing.
+
+    Each season is fetched once, then the day after every game day in its
+    schedule is checked from the in-memory season high table, so template
+    and filter changes can be validated against a full season in bulk.
+
+    Parameters
+    ----------
+    sports : list[str]
+        Sports to replay, keys of SPORTS.
+    year : int
+        The season to replay.
+    output : str, optional
+        File the records of `replay_date` are written to as JSON lines,
+        '-' for stdout (default).
+    seed : int, optional
+        Seed for the random template choice, so runs can be diffed.
+
+    Returns
+    -------
+    dict[str, int]
+        Per sport, the number of tweets composed. Sports whose stats or
+        schedule could not be loaded are reported and left out.
+    """
+    import json
+    import random
+    import sys
+
+    from LouiesBurner.schedule import get_schedule
+
+    if seed is not None:
+        random.seed(seed)
+    out = sys.stdout if output == "-" else open(output, "w")
+    composed = {}
+    try:
+        for sport in sports:
+            sport_obj = SPORTS[sport](year=year)
+            try:
+                # the season's one fetch, outside the timed replay
+                sport_obj.season_high_df
+                game_dates = get_schedule(sport, year).dates()
+            except Exception as e:
+                print(f"Failed to load {sport} {year}: {e!r}", file=sys.stderr)
+                continue
+            with stage("replay", sport=sport, year=year, dates=len(game_dates)) as record:
+                record["tweets"] = record["errors"] = 0
+                for game_date in game_dates:
+                    date = game_date + datetime.timedelta(days=1)
+                    for line in replay_date(sport_obj, date):
+                        out.write(json.dumps(line, default=str) + "\n")
+                        record["errors" if "error" in line else "tweets"] += 1
+            composed[sport] = record["tweets"]
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return composed
+
+
+def compose_tweets(
+    sport_obj: Sport, new_highs: list[Achievement]
+) -> tuple[list[list[Achievement]], list[str]]:
+    """
+    Group season highs by player and compose one tweet per player.
+
+    Parameters
+    ----------
+    sport_obj : Sport
+        The loaded sport object used to compose the tweets.
+    new_highs : list[Achievement]
+        Season highs as returned by `get_season_highs_for_date`.
+
+    Returns
+    -------
+    tuple[list[list[Achievement]], list[str]]
+        The highs of each tweet, sorted by player, and the tweets. A player
+        whose highs do not fit in one tweet gets several.
+    """
+    return sport_obj.compose_all(new_highs)
+
+
+def post_season_highs(
+    sport: str,
+    sport_obj: Sport,
+    new_highs: list[Achievement],
+    date: datetime.date,
+    ledger: Ledger | None = None,
+    snapshots: SnapshotStore | None = None,
+    _retries: int = 5,
+    _retry_sleep_time: int = 2,
+) -> None:
+    """
+    Tweet the game summaries of a sport, then its season highs grouped by player.
+
+    Parameters
+    ----------
+    sport : str
+        The name of the sport the highs belong to.
+    sport_obj : Sport
+        The loaded sport object used to compose the tweets.
+    new_highs : list[Achievement]
+        Season highs as returned by `get_season_highs_for_date`.
+    date : datetime.date
+        The date that was checked for season highs.
+    ledger : Ledger, optional
+        Posting ledger used to skip highs and game summaries that were
+        already posted and to record the ones posted now.
+    snapshots : SnapshotStore, optional
+        Snapshot store whose staged snapshot of the season is committed once
+        nothing is left to post.
+    _retries : int, optional
+        Number of attempts per tweet if posting it fails, by default 5.
+    _retry_sleep_time : int, optional
+        Upper bound in seconds of the first retry delay, doubled on each
+        further attempt, by default 2.
+
+    Returns
+    -------
+    None
+        Prints success/failure messages and posted tweets.
+    """
     prev_date = (date - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+    with stage("summarize", sport=sport) as record:
+        summaries = sport_obj.get_game_summaries(date)
+        record["tweets"] = len(summaries)
 
-    if not new_highs:
+    if not new_highs and not summaries:
+        if snapshots is not None:
+            snapshots.commit(sport, sport_obj.year)
         return print(f"No {sport} szn highs were set on {prev_date}")
 
-    new_highs.sort(key=lambda x: x["Player"])
-    tweets = []
-    for _, group in groupby(new_highs, key=lambda x: x["Player"]):
-        achievements = list(group)
-        tweet_txt = sport_obj.create_tweet_text(achievements)
-        try:
-            client.create_tweet(text=tweet_txt)
-            print("Tweet posted successfully!")
-            tweets.append(tweet_txt)
-            time.sleep(_retry_sleep_time)
-        except Exception as e:
-            print(f"Error posting tweet: {e}")
-            print(f"sleeping for {_retry_sleep_time}s")
-            time.sleep(_retry_sleep_time)
-            _ = main(
-                sport=sport,
-                date=date,
-                _retry_sleep_time=_retry_sleep_time,
-                _retries=_retries - 1,
-            )
+    game_date = date - datetime.timedelta(days=1)
+    if ledger is not None:
+        summaries = ledger.filter_new_summaries(sport, game_date, summaries)
+        new_highs = ledger.filter_new(sport, new_highs)
+        if not new_highs and not summaries:
+            ledger.mark_handled(sport, date)
+            if snapshots is not None:
+                snapshots.commit(sport, sport_obj.year)
+            return print(f"All {sport} tweets from {prev_date} were already posted")
+
+    groups, highs_tweets = compose_tweets(sport_obj, new_highs)
+    tweets = [*summaries, *highs_tweets]
+
+    with stage("post", sport=sport, tweets=len(tweets)) as record:
+        posted, failed = post_tweets(
+            tweets,
+            post=lambda text: get_client().create_tweet(text=text),
+            retries=_retries,
+            base_delay=_retry_sleep_time,
+        )
+        record["posted"], record["failed"] = len(posted), len(failed)
+    if failed:
+        print(f"{len(failed)} {sport} tweet(s) failed after {_retries} attempts")
+
+    if ledger is not None:
+        posted_set = set(posted)
+        ledger.record_summaries(
+            sport, game_date, [summary for summary in summaries if summary in posted_set]
+        )
+        ledger.record(
+            sport,
+            [
+                high
+                for tweet, group in zip(tweets[len(summaries) :], groups)
+                if tweet in posted_set
+                for high in group
+            ],
+        )
+        if not failed:
+            ledger.mark_handled(sport, date)
+
+    if snapshots is not None and not failed:
+        snapshots.commit(sport, sport_obj.year)
 
-    return print(f"New tweets created:\n{'\n\n'.join(tweets)}")
+    separator = "\n\n"
+    return print(f"New tweets created:\n{separator.join(posted)}")
 
 
 if __name__ == "__main__":
+    import sys
     from argparse import ArgumentParser
+    from functools import partial
 
     arg_parser = ArgumentParser()
 
+    arg_parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve", "replay"],
+        default="run",
+        help="'run' checks one date and exits (default), 'serve' keeps running and "
+        "checks the day after every game in the schedule csvs, 'replay' composes the "
+        "tweets of every check date of a season as JSON lines without posting",
+    )
+
     arg_parser.add_argument(
         "-sport",
         type=str,
-        choices=list(SPORTS.keys()),
-        help="name of sport to scrape",
-        default="baseball",
+        choices=[*SPORTS.keys(), "all"],
+        help="name of sport to scrape, or 'all' to process every sport concurrently "
+        "(default: baseball, or every scheduled sport with 'serve')",
+        default=None,
     )
 
     arg_parser.add_argument(
@@ -96,5 +550,117 @@ if __name__ == "__main__":
         default=datetime.date.today().isoformat(),
     )
 
+    arg_parser.add_argument(
+        "-diff",
+        action="store_true",
+        help="find new or changed highs by diffing against the last snapshot, not by date",
+    )
+
+    arg_parser.add_argument(
+        "-force",
+        action="store_true",
+        help="process the date even if the posting ledger says it was already handled",
+    )
+
+    arg_parser.add_argument(
+        "-timings",
+        "--timings",
+        metavar="PATH",
+        default="-",
+        help="append per-stage timings as JSON lines to PATH, '-' for stderr (default)",
+    )
+
+    arg_parser.add_argument(
+        "-profile",
+        "--profile",
+        metavar="PATH",
+        help="write a cProfile dump of any command to PATH (read it with pstats); "
+        "with '-sport all' the concurrent loads run on worker threads cProfile does not see",
+    )
+
+    arg_parser.add_argument(
+        "-check-time",
+        "--check-time",
+        type=lambda text: datetime.time.fromisoformat(text).replace(
+            tzinfo=datetime.timezone.utc
+        ),
+        help="with 'serve', UTC time of day (HH:MM) of the checks, default 12:00",
+    )
+
+    arg_parser.add_argument(
+        "-poll",
+        "--poll",
+        action="store_true",
+        help="with 'serve', poll the stats pages from the end of each game day and post "
+        "as soon as the season high tables change, instead of waiting for the check",
+    )
+
+    arg_parser.add_argument(
+        "-year",
+        "--year",
+        type=int,
+        help="with 'replay', the season to replay (default: the year of -date)",
+    )
+
+    arg_parser.add_argument(
+        "-output",
+        "--output",
+        metavar="PATH",
+        default="-",
+        help="with 'replay', write the JSON lines to PATH, '-' for stdout (default)",
+    )
+
+    arg_parser.add_argument(
+        "-seed",
+        "--seed",
+        type=int,
+        help="with 'replay', seed the random template choice so runs can be diffed",
+    )
+
     # parse arguments, and unpack them into main function
-    _ = main(**arg_parser.parse_args().__dict__)
+    args = arg_parser.parse_args().__dict__
+    configure(args.pop("timings"))
+    profile_path = args.pop("profile")
+    command = args.pop("command")
+    check_time = args.pop("check_time")
+    poll = args.pop("poll")
+    year, output, seed = args.pop("year"), args.pop("output"), args.pop("seed")
+    if command in ("run", "replay"):
+        args["sport"] = args["sport"] or "baseball"
+
+    if command == "serve":
+        sport = args["sport"]
+        run = partial(
+            serve,
+            sports=None if sport in (None, "all") else [sport],
+            diff=args["diff"],
+            check_time=check_time,
+            poll=poll,
+        )
+    elif command == "replay":
+        sport = args["sport"]
+        run = partial(
+            replay,
+            sports=list(SPORTS) if sport == "all" else [sport],
+            year=year or args["date"].year,
+            output=output,
+            seed=seed,
+        )
+    else:
+        run = partial(main, **args)
+
+    # with 'replay' stdout may be the JSON lines
+    report = sys.stderr if command == "replay" else sys.stdout
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(run)
+        finally:
+            # also when a serve is stopped with Ctrl-C
+            profiler.dump_stats(profile_path)
+            print(f"Wrote profile to {profile_path}", file=report)
+    else:
+        run()
+    print(f"Fetched {summarize_request_stats()}", file=report)
@@ -0,0 +1,51 @@
+"""
+Archive past seasons' season high tables and query them.
+
+Past seasons are fetched once; rerunning only refreshes the current one.
+
+    python scripts/archive_season_highs.py baseball --since 2015
+    python scripts/archive_season_highs.py baseball --best HITS --since 2015
+"""
+
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from LouiesBurner.archive import Archive  # noqa: E402
+from LouiesBurner.sports import SPORTS  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sport", choices=list(SPORTS))
+    parser.add_argument("--since", type=int, default=2015, help="first season")
+    parser.add_argument("--best", metavar="STATISTIC", help="query instead of ingesting")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    with Archive() as archive:
+        if args.best:
+            start = time.perf_counter()
+            best = archive.best(args.sport, args.best, since=args.since, limit=args.limit)
+            elapsed = (time.perf_counter() - start) * 1e3
+            for high in best:
+                print(
+                    f"{high['Value']:>6} {high['Player']} vs {high['Opponent']} ({high['Year']})"
+                )
+            return print(f"{len(best)} rows in {elapsed:.2f} ms")
+
+        years = range(args.since, datetime.date.today().year + 1)
+        for year, added in archive.ingest_seasons(args.sport, years).items():
+            if isinstance(added, Exception):
+                print(f"{args.sport} {year}: failed to load: {added!r}")
+            else:
+                print(f"{args.sport} {year}: {added} new achievements")
+        print(f"Archived seasons: {archive.seasons(args.sport)}")
+
+
+if __name__ == "__main__":
+    main()
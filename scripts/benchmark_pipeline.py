@@ -0,0 +1,196 @@
+"""
+Benchmark the whole pipeline of every sport against recorded pages.
+
+Times fetch, parse, highs extraction, tweet composition and a dry-run post
+per sport, replaying pages from a fixture directory so runs are
+reproducible and never touch gvsulakers or X. Every repeat starts from an
+empty page cache and table index, so fetch and parse are measured cold.
+Results are written as JSON; pass an earlier result with --compare to see
+the change per stage.
+
+    # record live pages once (needs network)
+    python scripts/benchmark_pipeline.py --record fixtures/2024 --date 2024-04-20
+    # or generate synthetic pages shaped like the real ones
+    python scripts/benchmark_pipeline.py --synthetic fixtures/synthetic
+
+    python scripts/benchmark_pipeline.py fixtures/2024 --date 2024-04-20 \\
+        --output bench.json --compare bench-main.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from LouiesBurner import cache, parsing, schedule  # noqa: E402
+from LouiesBurner.posting import post_tweets  # noqa: E402
+from LouiesBurner.replay import FixtureStore, record, replay  # noqa: E402
+from LouiesBurner.sports import SPORTS, Soccer  # noqa: E402
+from main import compose_tweets  # noqa: E402
+
+STAGES = ["fetch", "parse", "highs", "compose", "post"]
+
+
+def run_once(sport: str, date: datetime.date) -> tuple[dict[str, float], int, int]:
+    """Run the pipeline of one sport cold, returning seconds per stage."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache._default_cache = cache.PageCache(root=tmp)
+        parsing._table_index.clear()
+        schedule._schedules.clear()
+
+        sport_obj = SPORTS[sport](year=date.year)
+        times = {}
+
+        start = time.perf_counter()
+        if isinstance(sport_obj, Soccer):
+            sport_obj.pages
+        else:
+            sport_obj._fetch_stats_html()
+        times["fetch"] = time.perf_counter() - start
+
+        # includes reading the page back from the (fresh) page cache
+        start = time.perf_counter()
+        sport_obj.season_high_df
+        if isinstance(sport_obj, Soccer):
+            sport_obj.stats_soup
+        times["parse"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        highs = sport_obj.get_season_highs_for_date(date)
+        times["highs"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, tweets = compose_tweets(sport_obj, highs)
+        tweets = [*sport_obj.get_game_summaries(date), *tweets]
+        times["compose"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            post_tweets(tweets, post=lambda text: None)
+        times["post"] = time.perf_counter() - start
+
+        cache._default_cache = None
+    return times, len(highs), len(tweets)
+
+
+def benchmark(sports: list[str], date: datetime.date, repeat: int) -> dict:
+    """Time every stage of every sport, keeping min and median per stage."""
+    results = {}
+    for sport in sports:
+        runs = [run_once(sport, date) for _ in range(repeat)]
+        results[sport] = {
+            stage: {
+                "min_ms": min(t[stage] for t, _, _ in runs) * 1e3,
+                "median_ms": statistics.median(t[stage] for t, _, _ in runs) * 1e3,
+            }
+            for stage in STAGES
+        }
+        results[sport]["highs"]["count"] = runs[0][1]
+        results[sport]["compose"]["tweets"] = runs[0][2]
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict, baseline: dict | None = None) -> None:
+    for sport, stages in results.items():
+        parts = []
+        for stage in STAGES:
+            ms = stages[stage]["median_ms"]
+            part = f"{stage} {ms:7.2f} ms"
+            old = (baseline or {}).get(sport, {}).get(stage)
+            if old and old["median_ms"]:
+                part += f" ({ms / old['median_ms']:4.2f}x)"
+            parts.append(part)
+        print(f"{sport:>13}: " + " | ".join(parts))
+
+
+def synthetic_fixtures(root: Path, year: int) -> None:
+    """Write synthetic stats and schedule pages for every sport into root."""
+    from benchmark_season_highs import make_table
+    from benchmark_soup_parsing import synthetic_schedule_page, synthetic_stats_page
+
+    store = FixtureStore(root)
+    for n, (sport, sport_cls) in enumerate(SPORTS.items()):
+        tables = "".join(make_table(40, seed=n + k).to_html(index=False) for k in range(2))
+        page = synthetic_stats_page().replace("</body>", f"{tables}</body>")
+        store.save(sport_cls(year).url, page.encode(), 200, {})
+        if sport_cls is Soccer:
+            url = Soccer(year).schedule_url
+            store.save(url, synthetic_schedule_page().encode(), 200, {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("fixtures", nargs="?", type=Path, help="fixture directory to replay")
+    parser.add_argument("--record", type=Path, help="record live pages into this directory")
+    parser.add_argument("--synthetic", type=Path, help="write synthetic pages into this directory")
+    parser.add_argument(
+        "--date",
+        type=datetime.date.fromisoformat,
+        default=datetime.date(2024, 3, 15),
+        help="check date, the previous day is searched for highs",
+    )
+    parser.add_argument("--sports", nargs="+", choices=list(SPORTS), default=list(SPORTS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON here")
+    parser.add_argument("--compare", type=Path, help="earlier JSON result to compare against")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        synthetic_fixtures(args.synthetic, args.date.year)
+        return print(f"Wrote synthetic pages to {args.synthetic}")
+    if args.record:
+        with record(args.record):
+            for sport in args.sports:
+                run_once(sport, args.date)
+        return print(f"Recorded {len(FixtureStore(args.record).urls())} pages to {args.record}")
+    if args.fixtures is None:
+        parser.error("a fixture directory, --record or --synthetic is required")
+
+    with replay(args.fixtures):
+        results = benchmark(args.sports, args.date, args.repeat)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(
+                timespec="seconds"
+            ),
+            "python": platform.python_version(),
+            "date": args.date.isoformat(),
+            "repeat": args.repeat,
+            "fixtures": str(args.fixtures),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
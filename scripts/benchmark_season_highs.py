@@ -0,0 +1,138 @@
+"""
+Benchmark the row-by-row and vectorized season high extraction.
+
+Builds synthetic season high tables shaped like the gvsulakers ones
+(ties joined with "; ", dates in the opponent string), checks that both
+paths return the same achievements and prints their timings for a single
+date and for a whole season of dates. The vectorized timings include
+building the achievement batch and the per-date index from scratch.
+Finally compares the memory of the achievements as dictionaries and as
+an `AchievementBatch`.
+
+    python scripts/benchmark_season_highs.py
+"""
+
+import datetime
+import random
+import sys
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from LouiesBurner.sports import Baseball  # noqa: E402
+from LouiesBurner.sports.baseball import negative_stats  # noqa: E402
+
+STATS = [
+    "AT BATS", "RUNS SCORED", "HITS", "RBIS", "DOUBLES", "TRIPLES",
+    "HOME RUNS", "WALKS", "STRIKEOUTS", "STOLEN BASES", "CAUGHT STEALING",
+    "HIT INTO DP", "INNINGS PITCHED", "HITS ALLOWED", "RUNS ALLOWED",
+    "EARNED RUNS", "WALKS ALLOWED", "WILD PITCHES", "PUTOUTS", "ASSISTS",
+]  # fmt: skip
+
+
+def make_table(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Build a season high table with n_rows rows and random ties."""
+    rng = random.Random(seed)
+    start = datetime.date(2024, 2, 14)
+    rows = []
+    for n in range(n_rows):
+        ties = rng.choice([1, 1, 1, 2, 3, 5])
+        players, opponents = [], []
+        for _ in range(ties):
+            day = start + datetime.timedelta(days=rng.randrange(100))
+            players.append(f"Player {rng.randrange(40)}")
+            opponents.append(f"Team {rng.randrange(30)} ({day:%-m/%-d/%Y})")
+        rows.append(
+            {
+                "Statistic": STATS[n % len(STATS)],
+                "High": rng.randrange(1, 6),
+                "Player": "; ".join(players),
+                "Opponent": "; ".join(opponents),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def iterrows_highs(sport: Baseball, date: datetime.date) -> list[dict]:
+    """The original row-by-row implementation, kept as the baseline."""
+    prev_date = date - datetime.timedelta(days=1)
+    new_highs = []
+    for _, row in sport.season_high_df.iterrows():
+        statistic = row["Statistic"]
+        if statistic.upper() in negative_stats:
+            continue
+        players = row["Player"].split("; ")
+        opponents = row["Opponent"].split("; ")
+        for player, opponent in zip(players, opponents):
+            game_date = sport._extract_date(opponent)
+            if game_date and game_date == prev_date:
+                new_highs.append(
+                    {
+                        "Statistic": statistic,
+                        "Value": row["High"],
+                        "Player": player,
+                        "Opponent": opponent,
+                        "Date": game_date,
+                    }
+                )
+    return new_highs
+
+
+def deep_size(obj: object) -> int:
+    """Bytes of a dictionary or tuple and of the objects it holds."""
+    items = obj.values() if isinstance(obj, dict) else obj
+    return sys.getsizeof(obj) + sum(sys.getsizeof(item) for item in items)
+
+
+def main() -> None:
+    dates = [datetime.date(2024, 2, 15) + datetime.timedelta(days=d) for d in range(100)]
+    for label, n_rows in [("season (60 rows)", 60), ("10x season (600 rows)", 600)]:
+        sport = Baseball(2024)
+        sport._szn_high_df = make_table(n_rows)
+
+        for date in dates:
+            highs = sport.get_season_highs_for_date(date)
+            assert iterrows_highs(sport, date) == [h._asdict() for h in highs]
+
+        number = 20
+        old = timeit.timeit(lambda: iterrows_highs(sport, dates[30]), number=number)
+
+        def cold_lookup() -> None:
+            sport._szn_highs = None
+            sport.get_season_highs_for_date(dates[30])
+
+        new = timeit.timeit(cold_lookup, number=number)
+        print(
+            f"{label:>24}: one date   iterrows {old / number * 1e3:8.2f} ms | "
+            f"vectorized {new / number * 1e3:7.2f} ms | {old / new:6.1f}x"
+        )
+
+        old = timeit.timeit(
+            lambda: [iterrows_highs(sport, d) for d in dates], number=1
+        )
+
+        def cold_range() -> None:
+            sport._szn_highs = None
+            sport.get_season_highs_for_range(dates[0], dates[-1])
+
+        new = timeit.timeit(cold_range, number=number) / number
+        print(
+            f"{'':>24}  {len(dates)} dates iterrows {old * 1e3:8.2f} ms | "
+            f"vectorized {new * 1e3:7.2f} ms | {old / new:6.1f}x"
+        )
+
+        batch = sport.achievements
+        dicts = [h._asdict() for h in batch]
+        old = sum(deep_size(h) for h in dicts)
+        new = batch.nbytes + deep_size(batch.statistics + batch.players + batch.opponents)
+        print(
+            f"{'':>24}  {len(batch)} highs dicts {old / 1024:8.1f} KiB | "
+            f"batch {new / 1024:9.1f} KiB | {old / new:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
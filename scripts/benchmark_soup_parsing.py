@@ -0,0 +1,136 @@
+"""
+Benchmark html.parser full-page parsing against lxml + SoupStrainer.
+
+Pass saved copies of a stats page and a schedule page (grid view) to
+measure real pages; without arguments a synthetic page of similar shape
+is generated. Both paths must give the same season data.
+
+    python scripts/benchmark_soup_parsing.py [STATS_HTML [SCHEDULE_HTML]]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from LouiesBurner.schedule import SCHEDULE_STRAINER, get_womens_soccer_schedule  # noqa: E402
+from LouiesBurner.scraping import (  # noqa: E402
+    STATS_STRAINER,
+    get_game_data_for_season,
+    get_offensive_stats_for_season,
+    get_player_names,
+    parse_soup,
+)
+
+
+def synthetic_stats_page(n_games: int = 20, n_filler: int = 40) -> str:
+    """A stats page with the three scraped sections plus unrelated tables."""
+    games, offense = [], []
+    for n in range(n_games):
+        date = f"{9 + n // 28:02d}/{1 + n % 28:02d}/2024"
+        games.append(
+            f'<tr><td>{date}</td><td><a href="#">Team {n}</a></td><td>W</td>'
+            f'<td data-label="Score">2-1</td><td data-label="Attend">{300 + n}</td>'
+            f'<td data-label="Goals Scored [Assist]"><span>Doe, Jane (1) [Smith]</span></td>'
+            f'<td data-label="Overall">({n}-0-0, 0-0-0)</td><td data-label="Conference">0-0-0</td></tr>'
+        )
+        offense.append(
+            f'<tr><td>{date}</td><td>vsTeam {n}</td><td data-label="Score">2-1</td>'
+            + "".join(
+                f'<td data-label="{label}">{value}</td>'
+                for label, value in [
+                    ("G", 2), ("A", 1), ("PTS", 5), ("SH", 14), ("Shot%", "0.143"),
+                    ("SOG", 7), ("SOG%", ".500"), ("YC-RC", "1-0"), ("GW", 1), ("PK-ATT", "0-0"),
+                ]
+            )  # fmt: skip
+            + "<td>90:00</td></tr>"
+        )
+    players = "".join(
+        f'<tr><td><a href="#">Player, Number{n}</a></td>'
+        + "".join(f"<td>{n}</td>" for _ in range(14))
+        + "</tr>"
+        for n in range(30)
+    )
+    filler = "".join(
+        "<section><table>"
+        + "".join(
+            "<tr>" + "".join(f"<td>{r}.{c}</td>" for c in range(15)) + "</tr>"
+            for r in range(40)
+        )
+        + "</table></section>"
+        for _ in range(n_filler)
+    )
+    return (
+        "<html><head>" + "<script>var x = 1;</script>" * 50 + "</head><body>"
+        + "<nav>" + "<a href='#'>link</a>" * 500 + "</nav>"
+        + f'<section id="game-results"><table>{"".join(games)}</table></section>'
+        + f'<section id="game-game-our-offensive"><table>{"".join(offense)}</table></section>'
+        + f'<section id="individual-overall-offensive"><table>{players}</table></section>'
+        + filler
+        + "</body></html>"
+    )  # fmt: skip
+
+
+def synthetic_schedule_page(n_games: int = 20) -> str:
+    """A schedule grid with game rows surrounded by page chrome."""
+    rows = "".join(
+        f'<tr class="sidearm-schedule-game"><td>September {1 + n % 28}, 2024 (Fri)</td>'
+        f"<td>Team {n}</td><td>7 p.m.</td></tr>"
+        for n in range(n_games)
+    )
+    chrome = "<div>" + "<a href='#'>link</a><p>text</p>" * 3000 + "</div>"
+    return f"<html><body>{chrome}<table>{rows}</table>{chrome}</body></html>"
+
+
+def measure(parse, page: str, repeat: int = 5) -> tuple[float, float]:
+    """Best wall time in ms and peak traced memory in MiB of parse(page)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(page)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    parse(page)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best * 1e3, peak / 2**20
+
+
+def compare(label: str, page: str, strainer, extract) -> None:
+    before = lambda html: BeautifulSoup(html, "html.parser")  # noqa: E731
+    after = lambda html: parse_soup(html, parse_only=strainer)  # noqa: E731
+
+    assert extract(before(page)) == extract(after(page)), f"{label}: results differ"
+
+    (t0, m0), (t1, m1) = measure(before, page), measure(after, page)
+    print(
+        f"{label:>9} ({len(page) / 1024:7.0f} KiB): "
+        f"html.parser {t0:8.1f} ms {m0:6.1f} MiB | "
+        f"lxml+strainer {t1:7.1f} ms {m1:5.1f} MiB | {t0 / t1:4.1f}x faster"
+    )
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    stats = Path(args[0]).read_text() if args else synthetic_stats_page()
+    schedule = Path(args[1]).read_text() if len(args) > 1 else synthetic_schedule_page()
+
+    compare(
+        "stats",
+        stats,
+        STATS_STRAINER,
+        lambda soup: (
+            get_game_data_for_season(soup),
+            get_offensive_stats_for_season(soup),
+            get_player_names(soup),
+        ),
+    )
+    compare("schedule", schedule, SCHEDULE_STRAINER, get_womens_soccer_schedule)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,162 @@
-import csv
-from datetime import datetime, timedelta
+import sys
+from collections import defaultdict
+from datetime import time, timedelta
+import json
 import yaml
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from LouiesBurner.schedule import Schedule, get_schedule  # noqa: E402
+from LouiesBurner.sports import SPORTS  # noqa: E402
+
+# which seasons of which sports get checked, and when
+CONFIG_PATH = Path("schedules/checks.yml")
+WORKFLOW_PATH = Path(".github/workflows/season_highs.yml")
+
+SECRETS = [
+    "CLIENT_ID",
+    "CLIENT_SECRET",
+    "BEARER_TOKEN",
+    "ACCESS_TOKEN",
+    "ACCESS_TOKEN_SECRET",
+    "CONSUMER_KEY",
+    "CONSUMER_SECRET",
+]
+
 
 def parse_schedule(csv_file):
-    game_dates = set()
-    with open(csv_file, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                game_date = datetime.strptime(row["Start Date"], "%m/%d/%Y")
-                game_dates.add(game_date)
-            except ValueError:
-                continue
-    return sorted(list(game_dates))
-
-
-def generate_cron_schedule(game_dates):
-    # get the day after each game at 12:00 UTC
-    check_dates = [game_date + timedelta(days=1) for game_date in game_dates]
-    cron_expressions = []
-    for date in check_dates:
-        # Format: minute hour day month day-of-week
-        cron_expressions.append(f"0 12 {date.day} {date.month} *")
-    return cron_expressions
-
-
-def create_workflow_file(name, sport, cron_expressions):
-    workflow = {
-        "name": f"{name} Season Highs Check",
-        "on": {
-            "schedule": [{"cron": expr} for expr in cron_expressions],
-            "workflow_dispatch": None,
-        },
+    return Schedule.from_csv(csv_file).dates()
+
+
+def load_config(path=CONFIG_PATH):
+    """
+    Returns the check config, with every sport in SPORTS
+
+            Parameters:
+                    path (str | Path): yaml file with check_time and sports.<sport>.seasons
+
+            Returns:
+                    check_time (time): UTC time of day of the checks
+                    seasons (dict[str, list[int]]): seasons to check per sport, empty when unscheduled
+    """
+    with open(path, "r") as f:
+        config = yaml.safe_load(f) or {}
+    check_time = time.fromisoformat(str(config.get("check_time", "12:00")))
+    sports = config.get("sports") or {}
+    unknown = set(sports) - set(SPORTS)
+    if unknown:
+        raise ValueError(f"unknown sports in {path}: {', '.join(sorted(unknown))}")
+    seasons = {sport: list((sports.get(sport) or {}).get("seasons") or []) for sport in SPORTS}
+    return check_time, seasons
+
+
+def _ranges(numbers):
+    # [1, 2, 3, 7, 9, 10] -> '1-3,7,9,10'
+    numbers = sorted(numbers)
+    parts, start = [], 0
+    for i in range(1, len(numbers) + 1):
+        if i == len(numbers) or numbers[i] != numbers[i - 1] + 1:
+            run = numbers[start:i]
+            if len(run) >= 3:
+                parts.append(f"{run[0]}-{run[-1]}")
+            else:
+                parts.extend(str(n) for n in run)
+            start = i
+    return ",".join(parts)
+
+
+def compress_cron(check_dates, check_time=time(12, 0)):
+    """
+    Returns the fewest cron expressions firing on exactly the given dates
+
+    One expression per month with the days as a list of ranges, and months
+    with the same days share an expression.
+
+            Parameters:
+                    check_dates (Iterable[date]): dates to fire on
+                    check_time (time): UTC time of day to fire at
+
+            Returns:
+                    cron_expressions (list[str]): expressions, in calendar order
+    """
+    days_by_month = defaultdict(set)
+    for day in check_dates:
+        days_by_month[day.month].add(day.day)
+    months_by_days = defaultdict(list)
+    for month, days in sorted(days_by_month.items()):
+        months_by_days[frozenset(days)].append(month)
+    return [
+        f"{check_time.minute} {check_time.hour} {_ranges(days)} {_ranges(months)} *"
+        for days, months in months_by_days.items()
+    ]
+
+
+def generate_cron_schedule(game_dates, check_time=time(12, 0)):
+    # the day after each game, compressed into as few expressions as possible
+    return compress_cron({d + timedelta(days=1) for d in game_dates}, check_time)
+
+
+def group_check_dates(dates_by_sport):
+    """
+    Returns the check dates grouped by the set of sports checked on them
+
+            Parameters:
+                    dates_by_sport (dict[str, Iterable[date]]): game dates per sport
+
+            Returns:
+                    groups (dict[tuple[str, ...], list[date]]): sorted check dates per sorted sport tuple
+    """
+    sports_by_date = defaultdict(set)
+    for sport, game_dates in dates_by_sport.items():
+        for game_date in game_dates:
+            sports_by_date[game_date + timedelta(days=1)].add(sport)
+    groups = defaultdict(list)
+    for check_date, sports in sorted(sports_by_date.items()):
+        groups[tuple(sorted(sports))].append(check_date)
+    return dict(groups)
+
+
+def create_workflow_file(dates_by_sport, check_time=time(12, 0)):
+    """
+    Returns one workflow checking every sport the day after its games
+
+    Sports with games on the same day are checked by the same run; each
+    sport's step only runs for the cron expressions that include it.
+
+            Parameters:
+                    dates_by_sport (dict[str, Iterable[date]]): game dates per sport
+                    check_time (time): UTC time of day of the checks
+
+            Returns:
+                    workflow (dict): the workflow, ready for yaml.dump
+    """
+    crons_by_sport = defaultdict(list)
+    schedule = []
+    for sports, check_dates in group_check_dates(dates_by_sport).items():
+        for expr in compress_cron(check_dates, check_time):
+            schedule.append({"cron": expr})
+            for sport in sports:
+                crons_by_sport[sport].append(expr)
+
+    check_steps = [
+        {
+            "name": f"Check {sport} season highs",
+            # a failed sport does not skip the sports after it
+            "if": "${{ !cancelled() && (github.event_name != 'schedule' || "
+            f"contains(fromJSON('{json.dumps(crons_by_sport[sport])}'), github.event.schedule)) }}}}",
+            "run": f"python main.py -sport {sport}",
+        }
+        for sport in dates_by_sport
+        if crons_by_sport[sport]
+    ]
+    return {
+        "name": "Season Highs Check",
+        "on": {"schedule": schedule, "workflow_dispatch": None},
         "jobs": {
             "check-season-highs": {
                 "runs-on": "ubuntu-latest",
+                "env": {name: f"${{{{ secrets.{name} }}}}" for name in SECRETS},
                 "steps": [
                     {"uses": "actions/checkout@v4"},
                     {
@@ -44,49 +164,59 @@ def create_workflow_file(name, sport, cron_expressions):
                         "uses": "actions/setup-python@v4",
                         "with": {"python-version": "3.12"},
                     },
+                    {
+                        # page cache and posting ledger carried between runs
+                        "name": "Restore cache and posting ledger",
+                        "uses": "actions/cache/restore@v4",
+                        "with": {
+                            "path": ".cache",
+                            "key": "season-highs-cache-${{ github.run_id }}",
+                            "restore-keys": "season-highs-cache-",
+                        },
+                    },
                     {
                         "name": "Install dependencies",
                         "run": "python -m pip install --upgrade pip\npip install -r requirements.txt",
                     },
+                    *check_steps,
                     {
-                        "name": "Check for new season highs",
-                        "run": f"python main.py -sport {sport}",
-                        "env": {
-                            "CLIENT_ID": "${{ secrets.CLIENT_ID }}",
-                            "CLIENT_SECRET": "${{ secrets.CLIENT_SECRET }}",
-                            "BEARER_TOKEN": "${{ secrets.BEARER_TOKEN }}",
-                            "ACCESS_TOKEN": "${{ secrets.ACCESS_TOKEN }}",
-                            "ACCESS_TOKEN_SECRET": "${{ secrets.ACCESS_TOKEN_SECRET }}",
-                            "CONSUMER_KEY": "${{ secrets.CONSUMER_KEY }}",
-                            "CONSUMER_SECRET": "${{ secrets.CONSUMER_SECRET }}",
+                        # saved even when a check failed, so what it posted stays in the ledger
+                        "name": "Save cache and posting ledger",
+                        "if": "always()",
+                        "uses": "actions/cache/save@v4",
+                        "with": {
+                            "path": ".cache",
+                            "key": "season-highs-cache-${{ github.run_id }}",
                         },
                     },
                 ],
             }
         },
     }
-    return workflow
 
 
 def main():
-    # Create workflows directory if it doesn't exist
-    Path(".github/workflows").mkdir(parents=True, exist_ok=True)
-
-    # Baseball schedule
-    baseball_dates = parse_schedule("schedules/bsbl_25_schedule.csv")
-    baseball_cron = generate_cron_schedule(baseball_dates)
-    baseball_workflow = create_workflow_file("Baseball", "baseball", baseball_cron)
-
-    with open(".github/workflows/baseball.yml", "w") as f:
-        yaml.dump(baseball_workflow, f, sort_keys=False)
+    check_time, seasons = load_config()
+    dates_by_sport = {}
+    for sport, years in seasons.items():
+        if not years:
+            print(f"{sport}: no seasons in {CONFIG_PATH}, not scheduled")
+            continue
+        dates_by_sport[sport] = sorted(
+            {d for year in years for d in get_schedule(sport, year).dates()}
+        )
 
-    # Softball schedule
-    softball_dates = parse_schedule("schedules/softball_25_schedule.csv")
-    softball_cron = generate_cron_schedule(softball_dates)
-    softball_workflow = create_workflow_file("Softball", "softball", softball_cron)
+    workflow = create_workflow_file(dates_by_sport, check_time)
+    WORKFLOW_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(WORKFLOW_PATH, "w") as f:
+        yaml.dump(workflow, f, sort_keys=False, width=1000)
 
-    with open(".github/workflows/softball.yml", "w") as f:
-        yaml.dump(softball_workflow, f, sort_keys=False)
+    checks = sum(len(dates) for dates in group_check_dates(dates_by_sport).values())
+    runs_before = sum(len(dates) for dates in dates_by_sport.values())
+    print(
+        f"Wrote {WORKFLOW_PATH}: {len(workflow['on']['schedule'])} cron expressions, "
+        f"{checks} runs per season (was {runs_before} with one workflow per sport)"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+import sys
+import os
+import datetime
+import pickle
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner.achievements import Achievement, AchievementBatch, as_achievement
+from LouiesBurner.sports.baseball import Baseball
+
+
+def make_highs():
+    return [
+        Achievement("HITS", 4, "Mary Smith", "Team A (3/15/2024)", datetime.date(2024, 3, 15)),
+        Achievement("RBIS", 3, "John Doe", "Team A (3/15/2024)", datetime.date(2024, 3, 15)),
+        Achievement("RUNS SCORED", 2, "Mary Smith", "Team B (3/16/2024)", datetime.date(2024, 3, 16)),
+        Achievement("WALKS", 2, "Ann Lee", "Team C", None),
+    ]
+
+
+def test_achievement_supports_key_access():
+    """Test that Achievement reads like the dictionaries it replaced"""
+    high = as_achievement(
+        {"Statistic": "HITS", "Value": 4, "Player": "John Doe", "Opponent": "Team A"}
+    )
+    assert high == Achievement("HITS", 4, "John Doe", "Team A")
+    assert high["Player"] == high.Player == high[2] == "John Doe"
+    assert high.Date is None
+    with pytest.raises(KeyError):
+        high["High"]
+    assert as_achievement(high) is high
+    assert not hasattr(high, "__dict__")
+
+
+def test_batch_round_trips_achievements():
+    """Test that a batch is categorical and iterates back to the same records"""
+    highs = make_highs()
+    batch = AchievementBatch.from_achievements(highs)
+
+    assert len(batch) == 4
+    assert batch.players == ("Ann Lee", "John Doe", "Mary Smith")
+    assert batch.player_codes.tolist() == [2, 1, 2, 0]
+    assert list(batch) == highs
+    assert batch[-1] == highs[-1]
+    assert pickle.loads(pickle.dumps(highs[0])) == highs[0]
+
+
+def test_batch_selects_and_groups_on_codes():
+    """Test date selection, the statistic mask and grouping by player"""
+    batch = AchievementBatch.from_achievements(make_highs())
+
+    assert [h.Statistic for h in batch.on(datetime.date(2024, 3, 15))] == ["HITS", "RBIS"]
+    assert batch.is_statistic_in({"WALKS", "HITS"}).tolist() == [True, False, False, True]
+    assert sorted(batch.by_date()) == [datetime.date(2024, 3, 15), datetime.date(2024, 3, 16)]
+
+    groups = batch.group_by_player()
+    assert [[h.Statistic for h in group] for group in groups] == [
+        ["WALKS"],
+        ["RBIS"],
+        ["HITS", "RUNS SCORED"],
+    ]
+    assert AchievementBatch.from_achievements([]).group_by_player() == []
+
+
+def test_concat_recodes_against_merged_names():
+    """Test that batches with different players join into one"""
+    highs = make_highs()
+    batch = AchievementBatch.concat(
+        [
+            AchievementBatch.from_achievements(highs[:2]),
+            AchievementBatch.from_achievements(highs[2:]),
+        ]
+    )
+    assert list(batch) == highs
+    assert batch.players == ("Ann Lee", "John Doe", "Mary Smith")
+    assert len(AchievementBatch.concat([])) == 0
+
+
+def test_sport_achievements_and_compose_from_a_batch():
+    """Test that the batch of a season composes the same tweets as its lists"""
+    import pandas as pd
+
+    baseball = Baseball(2024)
+    baseball._szn_high_df = pd.DataFrame(
+        {
+            "Statistic": ["HITS", "STRIKEOUTS", "RBIS"],
+            "High": [4, 3, 5],
+            "Player": ["John Doe; Mary Smith", "John Doe", "John Doe"],
+            "Opponent": [
+                "Team A (3/15/2024); Team B (3/16/2024)",
+                "Team A (3/15/2024)",
+                "Team A (3/15/2024)",
+            ],
+        }
+    )
+    batch = baseball.achievements
+    # strikeouts are not tweeted
+    assert [h.Statistic for h in batch] == ["HITS", "HITS", "RBIS"]
+    assert baseball.achievements is batch
+
+    highs = baseball.get_season_highs_for_date(datetime.date(2024, 3, 16))
+    assert all(isinstance(h, Achievement) for h in highs)
+
+    groups, tweets = baseball.compose_all(batch.on(datetime.date(2024, 3, 15)))
+    assert groups == [list(batch.on(datetime.date(2024, 3, 15)))]
+    assert len(tweets) == 1 and "John Doe" in tweets[0]
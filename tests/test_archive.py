@@ -0,0 +1,105 @@
+import sys
+import os
+import datetime
+from collections import OrderedDict
+import pandas as pd
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import seasons
+from LouiesBurner.archive import Archive
+from LouiesBurner.sports.baseball import Baseball
+
+
+def _season(year, rows):
+    baseball = Baseball(year)
+    baseball._szn_high_df = pd.DataFrame(
+        rows, columns=["Statistic", "High", "Player", "Opponent"]
+    )
+    return baseball
+
+
+def test_ingest_is_incremental(tmp_path):
+    """Test that reingesting a season only adds new achievements"""
+    with Archive(tmp_path / "archive.sqlite3") as archive:
+        rows = [["HITS", 4, "John Doe; Jane Smith", "Team A (3/15/2024); Team B (3/16/2024)"]]
+        assert archive.ingest(_season(2024, rows)) == 2
+        assert archive.ingest(_season(2024, rows)) == 0
+
+        rows.append(["RBIS", 6, "Amy Brown", "Team C (4/2/2024)"])
+        assert archive.ingest(_season(2024, rows)) == 1
+        assert archive.seasons("baseball") == [2024]
+
+
+def test_reingest_replaces_superseded_highs(tmp_path):
+    """Test that a corrected or beaten high replaces the archived one"""
+    with Archive(tmp_path / "archive.sqlite3") as archive:
+        archive.ingest(_season(2024, [["HITS", 4, "John Doe", "Team A (3/15/2024)"]]))
+        added = archive.ingest(_season(2024, [["HITS", 5, "Jane Smith", "Team B (3/20/2024)"]]))
+
+        assert added == 1
+        best = archive.best("baseball", "HITS")
+        assert [(h["Player"], h["Value"]) for h in best] == [("Jane Smith", "5")]
+
+def test_best_across_seasons(tmp_path):
+    """Test the best single-game totals query across seasons"""
+    with Archive(tmp_path / "archive.sqlite3") as archive:
+        archive.ingest(_season(2014, [["HITS", 6, "Old Timer", "Team Z (4/1/2014)"]]))
+        archive.ingest(_season(2016, [["HITS", 4, "John Doe", "Team A (3/15/2016)"]]))
+        archive.ingest(_season(2024, [["Hits", 5, "Jane Smith", "Team B (3/16/2024)"]]))
+
+        best = archive.best("baseball", "hits", since=2015)
+        assert [(h["Year"], h["Player"], h["Value"]) for h in best] == [
+            (2024, "Jane Smith", "5"),
+            (2016, "John Doe", "4"),
+        ]
+        assert best[0]["Date"] == datetime.date(2024, 3, 16)
+        assert len(archive.best("baseball", "HITS")) == 3
+
+
+def test_closed_seasons_are_not_fetched_again(tmp_path, monkeypatch):
+    """Test that archived past seasons are skipped and the current one refreshed"""
+    fetched, ingested = [], []
+
+    def fake_ingest(self, sport_obj):
+        ingested.append(sport_obj.year)
+        return 0
+
+    def fake_load(seasons_to_load, max_workers, processes):
+        fetched.extend(season.year for season in seasons_to_load)
+        return {}
+
+    with Archive(tmp_path / "archive.sqlite3") as archive:
+        archive.ingest(_season(2023, [["HITS", 4, "John Doe", "Team A (3/15/2023)"]]))
+        archive.ingest(_season(2024, [["HITS", 4, "John Doe", "Team A (3/15/2024)"]]))
+        monkeypatch.setattr(Archive, "ingest", fake_ingest)
+        monkeypatch.setattr(seasons, "_load_seasons", fake_load)
+        monkeypatch.setattr(seasons, "_seasons", OrderedDict())
+
+        archive.ingest_seasons(
+            "baseball", [2022, 2023, 2024], today=datetime.date(2024, 5, 1)
+        )
+    assert fetched == ingested == [2022, 2024]
+
+
+def test_a_failed_season_does_not_stop_the_others(tmp_path, monkeypatch):
+    """Test that seasons failing to load are reported and the rest archived"""
+    ingested = []
+
+    def fake_ingest(self, sport_obj):
+        ingested.append(sport_obj.year)
+        return 1
+
+    def fake_load(seasons_to_load, max_workers, processes):
+        return {2023: ConnectionError("stats page down")}
+
+    monkeypatch.setattr(Archive, "ingest", fake_ingest)
+    monkeypatch.setattr(seasons, "_load_seasons", fake_load)
+    monkeypatch.setattr(seasons, "_seasons", OrderedDict())
+
+    with Archive(tmp_path / "archive.sqlite3") as archive:
+        added = archive.ingest_seasons("baseball", [2022, 2023, 2024])
+
+    assert ingested == [2022, 2024]
+    assert added[2022] == added[2024] == 1
+    assert isinstance(added[2023], ConnectionError)
@@ -0,0 +1,104 @@
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import cache
+from LouiesBurner.cache import PageCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeGet:
+    """Records requests and replays queued responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers or {}))
+        return self.responses.pop(0)
+
+
+URL = "https://gvsulakers.com/sports/baseball/stats/2024"
+
+
+def test_cache_key_is_filesystem_safe():
+    """Test that cache keys only contain safe characters"""
+    assert PageCache.key("baseball", 2024, "stats") == "baseball-2024-stats"
+    key = PageCache.key("baseball", 2024, "schedule?grid=true")
+    assert "/" not in key and "?" not in key
+
+
+def test_fresh_entry_served_without_request(tmp_path, monkeypatch):
+    """Test that an entry within its TTL never hits the network"""
+    fake_get = FakeGet(FakeResponse(200, "<html>v1</html>", {"ETag": '"abc"'}))
+    monkeypatch.setattr(cache, "fetch", fake_get)
+    page_cache = PageCache(tmp_path, ttl=60)
+
+    assert page_cache.get(URL, "baseball", 2024) == "<html>v1</html>"
+    assert page_cache.get(URL, "baseball", 2024) == "<html>v1</html>"
+    assert len(fake_get.calls) == 1
+
+
+def test_stale_entry_revalidates_and_serves_304(tmp_path, monkeypatch):
+    """Test that a stale entry sends conditional headers and reuses the body on 304"""
+    fake_get = FakeGet(
+        FakeResponse(
+            200,
+            "<html>v1</html>",
+            {"ETag": '"abc"', "Last-Modified": "Sat, 15 Mar 2025 12:00:00 GMT"},
+        ),
+        FakeResponse(304),
+    )
+    monkeypatch.setattr(cache, "fetch", fake_get)
+    page_cache = PageCache(tmp_path, ttl=0)
+
+    page_cache.get(URL, "baseball", 2024)
+    assert page_cache.get(URL, "baseball", 2024) == "<html>v1</html>"
+
+    _, headers = fake_get.calls[1]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Sat, 15 Mar 2025 12:00:00 GMT"
+
+
+def test_max_age_zero_always_revalidates(tmp_path, monkeypatch):
+    """Test that max_age=0 sends a conditional request even for a fresh entry"""
+    fake_get = FakeGet(
+        FakeResponse(200, "<html>v1</html>", {"ETag": '"abc"'}),
+        FakeResponse(304),
+    )
+    monkeypatch.setattr(cache, "fetch", fake_get)
+    page_cache = PageCache(tmp_path, ttl=60)
+
+    page_cache.get(URL, "baseball", 2024)
+    assert page_cache.get(URL, "baseball", 2024, max_age=0) == "<html>v1</html>"
+    assert fake_get.calls[1][1]["If-None-Match"] == '"abc"'
+
+
+def test_eviction_keeps_cache_under_size_bound(tmp_path, monkeypatch):
+    """Test that the least recently used entries are evicted past max_bytes"""
+    fake_get = FakeGet(
+        FakeResponse(200, "a" * 100),
+        FakeResponse(200, "b" * 100),
+    )
+    monkeypatch.setattr(cache, "fetch", fake_get)
+    page_cache = PageCache(tmp_path, ttl=60, max_bytes=150)
+
+    page_cache.get(URL, "baseball", 2023)
+    os.utime(tmp_path / "baseball-2023-stats.html", (0, 0))
+    page_cache.get(URL, "baseball", 2024)
+
+    assert not (tmp_path / "baseball-2023-stats.html").exists()
+    assert (tmp_path / "baseball-2024-stats.html").exists()
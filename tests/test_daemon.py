@@ -0,0 +1,105 @@
+import sys
+import os
+import asyncio
+import datetime
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import daemon
+from LouiesBurner.schedule import Game, Schedule
+
+UTC = datetime.timezone.utc
+
+
+class FakeClock:
+    """Clock that only moves when the daemon sleeps"""
+
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+def make_schedule(*days):
+    return Schedule(
+        Game(datetime.datetime(2025, 3, d, 14), "Team A") for d in days
+    )
+
+
+def test_check_times_are_the_day_after_each_game_day():
+    """Test that doubleheaders share a check and checks are sorted"""
+    times = daemon.check_times([make_schedule(8, 1, 1), make_schedule(2)])
+    assert times == [
+        datetime.datetime(2025, 3, 2, 12, tzinfo=UTC),
+        datetime.datetime(2025, 3, 3, 12, tzinfo=UTC),
+        datetime.datetime(2025, 3, 9, 12, tzinfo=UTC),
+    ]
+
+
+def test_serve_sport_sleeps_until_each_check():
+    """Test that checks run in order, on time, and long sleeps are chunked"""
+    clock = FakeClock(datetime.datetime(2025, 3, 1, 0, tzinfo=UTC))
+    times = daemon.check_times([make_schedule(1, 3)])
+    checked = []
+
+    def check(sport, date):
+        checked.append((sport, date, clock()))
+
+    ran = asyncio.run(daemon.serve_sport("baseball", times, check, clock, clock.sleep))
+
+    assert ran == 2
+    assert [(s, d) for s, d, _ in checked] == [
+        ("baseball", datetime.date(2025, 3, 2)),
+        ("baseball", datetime.date(2025, 3, 4)),
+    ]
+    assert [when for _, _, when in checked] == times
+    assert max(clock.sleeps) <= daemon.MAX_SLEEP
+
+
+def test_serve_sport_catches_up_and_survives_failures():
+    """Test that a just missed check still runs and a failing one is skipped"""
+    # started 2 hours after the 3/2 check, long after the 2/28 one
+    clock = FakeClock(datetime.datetime(2025, 3, 2, 14, tzinfo=UTC))
+    times = daemon.check_times([make_schedule(1, 2)])
+    times.insert(0, datetime.datetime(2025, 2, 28, 12, tzinfo=UTC))
+    checked = []
+
+    def check(sport, date):
+        checked.append(date)
+        if date == datetime.date(2025, 3, 2):
+            raise ConnectionError("stats page down")
+
+    ran = asyncio.run(daemon.serve_sport("softball", times, check, clock, clock.sleep))
+
+    assert ran == 2
+    assert checked == [datetime.date(2025, 3, 2), datetime.date(2025, 3, 3)]
+
+
+def test_serve_runs_sports_on_one_loop(monkeypatch):
+    """Test that several sports interleave on the same event loop"""
+    schedules = {"baseball": make_schedule(1, 5), "softball": make_schedule(3)}
+    monkeypatch.setattr(
+        daemon, "SCHEDULE_CSVS", {("baseball", 2025): None, ("softball", 2025): None}
+    )
+    monkeypatch.setattr(daemon, "get_schedule", lambda sport, year: schedules[sport])
+    clock = FakeClock(datetime.datetime(2025, 3, 1, 0, tzinfo=UTC))
+    checked, warmed = [], []
+
+    ran = asyncio.run(
+        daemon.serve(
+            lambda sport, date: checked.append((date.day, sport)),
+            warm=lambda: warmed.append(True),
+            clock=clock,
+            sleep=clock.sleep,
+        )
+    )
+
+    assert ran == {"baseball": 2, "softball": 1}
+    assert warmed == [True]
+    assert checked == [(2, "baseball"), (4, "softball"), (6, "baseball")]
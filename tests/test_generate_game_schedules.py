@@ -0,0 +1,55 @@
+import sys
+import os
+import datetime
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+yaml = pytest.importorskip("yaml")
+
+import generate_game_schedules as gen
+
+
+def test_compress_cron_uses_day_ranges_and_shares_months():
+    """Test that check dates compress into one expression per distinct day set"""
+    dates = [
+        datetime.date(2025, 3, d) for d in (1, 2, 3, 7, 9, 10)
+    ] + [datetime.date(2025, 4, 5), datetime.date(2025, 5, 5)]
+    assert gen.compress_cron(dates) == ["0 12 1-3,7,9,10 3 *", "0 12 5 4,5 *"]
+    assert gen.compress_cron(dates[:1], datetime.time(9, 30)) == ["30 9 1 3 *"]
+
+
+def test_generate_cron_schedule_checks_the_day_after():
+    """Test that doubleheaders and consecutive days share expressions"""
+    games = [datetime.date(2025, 2, d) for d in (14, 15, 15, 16)]
+    assert gen.generate_cron_schedule(games) == ["0 12 15-17 2 *"]
+
+
+def test_workflow_runs_each_check_date_once():
+    """Test that sports checked on the same day share a run"""
+    dates_by_sport = {
+        "baseball": [datetime.date(2025, 3, 1), datetime.date(2025, 3, 2)],
+        "softball": [datetime.date(2025, 3, 2), datetime.date(2025, 3, 5)],
+    }
+    workflow = gen.create_workflow_file(dates_by_sport)
+    crons = [entry["cron"] for entry in workflow["on"]["schedule"]]
+
+    assert sorted(crons) == ["0 12 2 3 *", "0 12 3 3 *", "0 12 6 3 *"]
+    steps = {s.get("name"): s for s in workflow["jobs"]["check-season-highs"]["steps"]}
+    baseball = steps["Check baseball season highs"]
+    assert "0 12 3 3 *" in baseball["if"] and "0 12 6 3 *" not in baseball["if"]
+    assert baseball["run"] == "python main.py -sport baseball"
+    # a failed check neither skips the next sport nor loses the ledger
+    assert baseball["if"].startswith("${{ !cancelled() && (")
+    save = workflow["jobs"]["check-season-highs"]["steps"][-1]
+    assert save["uses"] == "actions/cache/save@v4" and save["if"] == "always()"
+
+
+def test_config_lists_every_sport():
+    """Test that the shipped config covers every sport and loads"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    check_time, seasons = gen.load_config(os.path.join(root, "schedules", "checks.yml"))
+    assert check_time == datetime.time(12, 0)
+    assert set(seasons) == set(gen.SPORTS)
+    assert seasons["baseball"] == [2025]
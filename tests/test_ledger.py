@@ -0,0 +1,63 @@
+import sys
+import os
+import datetime
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner.ledger import Ledger
+
+
+HIGHS = [
+    {
+        "Statistic": "HITS",
+        "Value": 4,
+        "Player": "John Doe",
+        "Opponent": "Team A (3/15/2024)",
+        "Date": datetime.date(2024, 3, 15),
+    },
+    {
+        "Statistic": "WALKS",
+        "Value": 3,
+        "Player": "Jane Smith",
+        "Opponent": "Team A (3/15/2024)",
+        "Date": datetime.date(2024, 3, 15),
+    },
+]
+
+
+def test_handled_dates_persist(tmp_path):
+    """Test that handled dates survive reopening the ledger"""
+    path = tmp_path / "ledger.sqlite3"
+    date = datetime.date(2024, 3, 16)
+
+    with Ledger(path) as ledger:
+        assert not ledger.is_handled("baseball", date)
+        ledger.mark_handled("baseball", date)
+
+    with Ledger(path) as ledger:
+        assert ledger.is_handled("baseball", date)
+        assert not ledger.is_handled("softball", date)
+
+
+def test_filter_new_drops_posted_achievements(tmp_path):
+    """Test that recorded achievements are filtered per sport"""
+    with Ledger(tmp_path / "ledger.sqlite3") as ledger:
+        ledger.record("baseball", HIGHS[:1])
+        ledger.record("baseball", HIGHS[:1])
+
+        assert ledger.filter_new("baseball", HIGHS) == HIGHS[1:]
+        assert ledger.filter_new("softball", HIGHS) == HIGHS
+
+
+def test_filter_new_summaries_drops_posted_summaries(tmp_path):
+    """Test that recorded game summaries are filtered per sport and game date"""
+    date = datetime.date(2024, 9, 5)
+    summaries = ["Game 1 recap", "Game 2 recap"]
+
+    with Ledger(tmp_path / "ledger.sqlite3") as ledger:
+        ledger.record_summaries("womens-soccer", date, summaries[:1])
+
+        assert ledger.filter_new_summaries("womens-soccer", date, summaries) == summaries[1:]
+        assert ledger.filter_new_summaries("womens-soccer", date.replace(day=6), summaries) == summaries
+        assert ledger.filter_new_summaries("baseball", date, summaries) == summaries
@@ -0,0 +1,251 @@
+import sys
+import os
+import subprocess
+import threading
+import datetime
+import json
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+import main
+from LouiesBurner import cache, parsing, schedule
+from LouiesBurner.cache import PageCache
+from LouiesBurner.ledger import Ledger
+from LouiesBurner.schedule import Game, Schedule
+from LouiesBurner.sports.baseball import Baseball
+
+
+def test_load_all_season_highs_runs_concurrently(monkeypatch):
+    """Test that sports load in parallel and failures are reported per sport"""
+    # both loads have to be running at once to get past the barrier
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fake_load(sport, date, snapshots=None):
+        both_running.wait()
+        if sport == "softball":
+            raise ValueError("stats page unavailable")
+        return object(), [{"Player": "John Doe"}]
+
+    monkeypatch.setattr(main, "load_season_highs", fake_load)
+
+    results = main.load_all_season_highs(
+        datetime.date(2024, 3, 16), sports=["baseball", "softball"]
+    )
+
+    assert results["baseball"][1] == [{"Player": "John Doe"}]
+    assert isinstance(results["softball"], ValueError)
+
+
+HIGHS = [
+    {
+        "Statistic": "HITS",
+        "Value": 4,
+        "Player": "John Doe",
+        "Opponent": "Team A (3/15/2024)",
+        "Date": datetime.date(2024, 3, 15),
+    },
+    {
+        "Statistic": "WALKS",
+        "Value": 3,
+        "Player": "Jane Smith",
+        "Opponent": "Team A (3/15/2024)",
+        "Date": datetime.date(2024, 3, 15),
+    },
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.tweets = []
+
+    def create_tweet(self, text):
+        self.tweets.append(text)
+
+
+def test_forced_main_all_still_skips_posted_highs(tmp_path, monkeypatch):
+    """Test that -force reloads handled sports but never reposts their highs"""
+    date = datetime.date(2024, 3, 16)
+    client = FakeClient()
+    loaded = []
+
+    def fake_load_all(date, sports, snapshots=None):
+        loaded.extend(sports)
+        return {sport: (Baseball(2024), list(HIGHS)) for sport in sports}
+
+    monkeypatch.setattr(main, "load_all_season_highs", fake_load_all)
+    monkeypatch.setattr(main, "get_client", lambda: client)
+
+    with Ledger(tmp_path / "ledger.sqlite3") as ledger:
+        ledger.record("baseball", HIGHS[:1])
+        ledger.mark_handled("baseball", date)
+
+        main.main_all(date, ledger=ledger, force=True)
+
+        assert loaded == ["baseball", "softball", "womens-soccer"]
+        # John Doe's hits were posted for baseball before, not for the others
+        assert len(client.tweets) == 5
+        assert sum("John Doe" in tweet for tweet in client.tweets) == 2
+        assert all(ledger.is_handled(sport, date) for sport in loaded)
+        assert len(ledger.posted_keys("softball")) == 2
+
+
+def test_main_all_posts_other_sports_when_one_fails(tmp_path, monkeypatch, capsys):
+    """Test that a sport failing to post does not stop the ones after it"""
+    date = datetime.date(2024, 3, 16)
+    client = FakeClient()
+    summarized = []
+
+    def fake_load_all(date, sports, snapshots=None):
+        return {sport: (Baseball(2024), list(HIGHS)) for sport in sports}
+
+    def fake_summaries(self, date):
+        summarized.append(date)
+        if len(summarized) == 1:
+            raise ValueError("box score unavailable")
+        return []
+
+    monkeypatch.setattr(main, "load_all_season_highs", fake_load_all)
+    monkeypatch.setattr(main, "get_client", lambda: client)
+    monkeypatch.setattr(Baseball, "get_game_summaries", fake_summaries)
+    monkeypatch.setattr(main, "SPORTS", {"baseball": Baseball, "softball": Baseball})
+
+    with Ledger(tmp_path / "ledger.sqlite3") as ledger:
+        main.main_all(date, ledger=ledger)
+
+        assert len(client.tweets) == 2
+        assert not ledger.is_handled("baseball", date)
+        assert ledger.is_handled("softball", date)
+    assert "1/2 sports failed: baseball" in capsys.readouterr().out
+
+
+def test_posted_game_summaries_are_not_reposted(tmp_path, monkeypatch):
+    """Test that a rerun after posting a game summary posts nothing"""
+    date = datetime.date(2024, 3, 16)
+    client = FakeClient()
+    monkeypatch.setattr(main, "get_client", lambda: client)
+    monkeypatch.setattr(Baseball, "get_game_summaries", lambda self, date: ["Final: 5-3"])
+
+    with Ledger(tmp_path / "ledger.sqlite3") as ledger:
+        main.post_season_highs("baseball", Baseball(2024), [], date, ledger=ledger)
+        main.post_season_highs("baseball", Baseball(2024), [], date, ledger=ledger)
+
+        assert client.tweets == ["Final: 5-3"]
+        assert ledger.is_handled("baseball", date)
+
+
+def test_forced_check_posts_highs_set_after_the_date_was_handled(tmp_path, monkeypatch):
+    """Test that the forced safety-net check posts a doubleheader's second game only"""
+    date = datetime.date(2024, 3, 16)
+    client = FakeClient()
+    monkeypatch.setenv("LOUIESBURNER_LEDGER", str(tmp_path / "ledger.sqlite3"))
+    monkeypatch.setattr(main, "get_client", lambda: client)
+    monkeypatch.setattr(
+        main, "load_season_highs", lambda sport, date, snapshots=None: (Baseball(2024), list(HIGHS))
+    )
+    with Ledger() as ledger:
+        # an early check posted the first game and marked the date handled
+        ledger.record("baseball", HIGHS[:1])
+        ledger.mark_handled("baseball", date)
+
+    main.main("baseball", date)
+    assert client.tweets == []
+
+    main.main("baseball", date, force=True)
+    assert len(client.tweets) == 1 and "Jane Smith" in client.tweets[0]
+
+
+STATS_PAGE = (
+    "<table><thead><tr><th>Statistic</th><th>High</th><th>Player</th><th>Opponent</th></tr>"
+    "</thead><tbody>"
+    "<tr><td>HITS</td><td>4</td><td>John Doe; Mary Smith</td>"
+    "<td>Team A (3/15/2024); Team B (3/16/2024)</td></tr>"
+    "<tr><td>RBIS</td><td>5</td><td>John Doe</td><td>Team A (3/15/2024)</td></tr>"
+    "<tr><td>STRIKEOUTS</td><td>3</td><td>Mary Smith</td><td>Team B (3/16/2024)</td></tr>"
+    "</tbody></table>"
+)
+
+
+def test_replay_composes_every_check_date_without_posting(tmp_path, monkeypatch):
+    """Test that replay fetches once and writes one JSON line per tweet"""
+    fetched = []
+
+    def fake_fetch(self):
+        fetched.append(self.year)
+        return STATS_PAGE
+
+    def no_posting():
+        raise AssertionError("replay must not post")
+
+    games = Schedule(
+        Game(datetime.datetime(2024, 3, d, 14), "Team A") for d in (15, 16, 17)
+    )
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path / "cache"))
+    monkeypatch.setattr(parsing, "_table_index", {})
+    monkeypatch.setattr(schedule, "_schedules", {("baseball", 2024): games})
+    monkeypatch.setattr(Baseball, "_fetch_stats_html", fake_fetch)
+    monkeypatch.setattr(main, "get_client", no_posting)
+
+    output = tmp_path / "replay.jsonl"
+    composed = main.replay(["baseball"], 2024, output=str(output), seed=1)
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+
+    assert fetched == [2024]
+    assert composed == {"baseball": 2}
+    assert [(l["date"], l["game_date"], l["kind"]) for l in lines] == [
+        ("2024-03-16", "2024-03-15", "highs"),
+        ("2024-03-17", "2024-03-16", "highs"),
+    ]
+    assert [h["Statistic"] for h in lines[0]["highs"]] == ["HITS", "RBIS"]
+    assert lines[1]["highs"] == [
+        {
+            "Statistic": "HITS",
+            "Value": 4,
+            "Player": "Mary Smith",
+            "Opponent": "Team B (3/16/2024)",
+            "Date": "2024-03-16",
+        }
+    ]
+    assert all(0 < l["length"] <= 280 and l["tweet"] for l in lines)
+
+    # the same seed composes the same tweets
+    main.replay(["baseball"], 2024, output=str(tmp_path / "again.jsonl"), seed=1)
+    assert (tmp_path / "again.jsonl").read_text() == output.read_text()
+
+
+def test_replay_date_reports_value_errors(monkeypatch):
+    """Test that any ValueError composing a date becomes an error record"""
+
+    def bad_highs(self, date):
+        raise ValueError("could not convert 'DNP' to a number")
+
+    monkeypatch.setattr(Baseball, "get_season_highs_for_date", bad_highs)
+    (record,) = main.replay_date(Baseball(2024), datetime.date(2024, 3, 16))
+
+    assert record["error"] == "ValueError: could not convert 'DNP' to a number"
+    assert record["game_date"] == "2024-03-15"
+
+
+# packages `import main` must leave to the code paths that need them
+HEAVY_MODULES = {"pandas", "numpy", "tweepy", "requests", "bs4", "lxml", "soupsieve"}
+
+
+def test_import_is_lazy():
+    """Test that importing main does not load the heavy dependencies"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # "import time: self | cumulative | name", indented by nesting depth
+    imported = {
+        line.split("|")[2].strip().split(".")[0]: int(line.split("|")[1])
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    loaded = {name: imported[name] for name in HEAVY_MODULES & set(imported)}
+    assert not loaded, f"import main loaded {loaded} (cumulative microseconds)"
@@ -0,0 +1,67 @@
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import cache, parsing
+from LouiesBurner.cache import PageCache
+from LouiesBurner.parsing import find_tables, read_season_high_tables, split_tables
+
+
+def _table(header, rows):
+    head = "".join(f"<th><span>{h}</span></th>" for h in header)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+PAGE = "<html><body>{}</body></html>".format(
+    "".join(
+        [
+            _table(["Player", "AVG"], [["John Doe", ".300"]]),
+            _table(["Statistic", "High", "Opponent"], [["HITS", 15, "Team A (3/15/2024)"]]),
+            _table(
+                ["Statistic", "High", "Player", "Opponent"],
+                [["HITS", 4, "John Doe", "Team A (3/15/2024)"]],
+            ),
+            _table(
+                ["Statistic", "High", "Player", "Opponent"],
+                [["STRIKEOUTS", 10, "Bob Johnson", "Team C (3/15/2024)"]],
+            ),
+        ]
+    )
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path))
+    monkeypatch.setattr(parsing, "_table_index", {})
+
+
+def test_find_tables_by_header_signature():
+    """Test that only individual season high tables match the signature"""
+    tables = split_tables(PAGE)
+    assert len(tables) == 4
+    assert find_tables(tables) == [2, 3]
+    assert find_tables(tables, limit=1) == [2]
+
+
+def test_read_season_high_tables_parses_only_matches():
+    """Test that only matching tables are turned into DataFrames"""
+    idxs, dfs = read_season_high_tables(PAGE, "baseball", 2024)
+    assert idxs == [2, 3]
+    assert [df["Statistic"].iloc[0] for df in dfs] == ["HITS", "STRIKEOUTS"]
+
+
+def test_table_index_is_cached_per_sport_and_year(tmp_path):
+    """Test that discovered positions are persisted and reused"""
+    read_season_high_tables(PAGE, "softball", 2024, limit=1)
+    assert (tmp_path / "table-index.json").exists()
+    assert parsing._table_index == {"softball-2024": [2]}
+
+    parsing._table_index.clear()
+    idxs, _ = read_season_high_tables(PAGE, "softball", 2024, limit=1)
+    assert idxs == [2]
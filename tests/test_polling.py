@@ -0,0 +1,129 @@
+import sys
+import os
+import asyncio
+import datetime
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import daemon, polling
+from LouiesBurner.polling import TableWatch, poll_starts, poll_until_changed
+from LouiesBurner.schedule import Game, Schedule
+
+UTC = datetime.timezone.utc
+
+TABLE = (
+    "<table><tr><th>Statistic</th><th>High</th><th>Player</th><th>Opponent</th></tr>"
+    "<tr><td>Hits</td><td>{}</td><td>John Doe</td><td>Team A (3/1/2025)</td></tr></table>"
+)
+
+
+class FakeClock:
+    """Clock that only moves when something sleeps"""
+
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+class FakePages:
+    """Serves queued pages, repeating the last one"""
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.calls = 0
+
+    def __call__(self, sport, year):
+        self.calls += 1
+        return self.pages.pop(0) if len(self.pages) > 1 else self.pages[0]
+
+
+def test_poll_starts_at_the_end_of_the_last_game():
+    """Test that polling starts after the last game of a day, in UTC"""
+    schedule = Schedule(
+        [
+            Game(
+                datetime.datetime(2025, 4, 5, 13, 0),
+                "Team A",
+                end=datetime.datetime(2025, 4, 5, 16, 0),
+            ),
+            Game(datetime.datetime(2025, 4, 5, 17, 0), "Team A"),
+            Game(datetime.datetime(2025, 4, 6, 0, 0), "Team B"),
+        ]
+    )
+    starts = poll_starts([schedule])
+    # doubleheader: 17:00 EDT start plus three hours
+    assert starts[datetime.date(2025, 4, 5)] == datetime.datetime(2025, 4, 6, 0, 0, tzinfo=UTC)
+    # start TBD
+    assert starts[datetime.date(2025, 4, 6)] == datetime.datetime(2025, 4, 6, 22, 0, tzinfo=UTC)
+
+
+def test_table_watch_only_reports_table_changes():
+    """Test that page noise is told apart from season high changes"""
+    pages = FakePages(
+        TABLE.format(3),
+        TABLE.format(3),
+        TABLE.format(3) + "<p>updated 9:41</p>",
+        TABLE.format(4),
+    )
+    watch = TableWatch("baseball", 2025, fetch=pages)
+    assert [watch.poll() for _ in range(4)] == ["unchanged", "unchanged", "page", "table"]
+
+
+def test_poll_until_changed_backs_off_and_resets():
+    """Test that unchanged polls back off and page activity polls sooner"""
+    clock = FakeClock(datetime.datetime(2025, 3, 1, 22, tzinfo=UTC))
+    pages = FakePages(
+        *[TABLE.format(3)] * 3, TABLE.format(3) + "<p>live</p>", TABLE.format(5)
+    )
+    watch = TableWatch("baseball", 2025, fetch=pages)
+    until = clock() + datetime.timedelta(hours=12)
+
+    assert asyncio.run(poll_until_changed(watch, until, clock, clock.sleep))
+    first = polling.POLL_INTERVAL
+    assert clock.sleeps == [first, first * 1.5, first * 1.5**2, first]
+    assert pages.calls == 5
+
+
+def test_poll_until_changed_gives_up_at_the_deadline():
+    """Test that polling stops at the check time and intervals are capped"""
+    clock = FakeClock(datetime.datetime(2025, 3, 1, 22, tzinfo=UTC))
+    watch = TableWatch("baseball", 2025, fetch=FakePages(TABLE.format(3)))
+    until = clock() + datetime.timedelta(hours=14)
+
+    assert not asyncio.run(poll_until_changed(watch, until, clock, clock.sleep))
+    assert clock() == until
+    assert max(clock.sleeps) == polling.POLL_MAX_INTERVAL
+
+
+def test_serve_sport_checks_as_soon_as_the_table_changes():
+    """Test that a polled change runs the check early, the scheduled one still runs forced"""
+    clock = FakeClock(datetime.datetime(2025, 3, 1, 12, tzinfo=UTC))
+    when = datetime.datetime(2025, 3, 2, 12, tzinfo=UTC)
+    start = datetime.datetime(2025, 3, 1, 22, tzinfo=UTC)
+    pages = FakePages(TABLE.format(3), TABLE.format(3), TABLE.format(4))
+    checked = []
+
+    ran = asyncio.run(
+        daemon.serve_sport(
+            "baseball",
+            [when],
+            lambda sport, date, force=False: checked.append((clock(), force)),
+            clock,
+            clock.sleep,
+            polls={when: start},
+            watch=lambda day: TableWatch("baseball", day.year, fetch=pages),
+        )
+    )
+
+    assert ran == 2
+    assert start < checked[0][0] < start + datetime.timedelta(hours=1)
+    # the early check marked the date handled, the safety net looks past that
+    assert checked[0][1] is False
+    assert checked[1] == (when, True)
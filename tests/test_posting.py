@@ -0,0 +1,57 @@
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner.posting import backoff_delay, post_tweets
+
+
+class FlakyPoster:
+    """Fails the first `failures` attempts for each text listed in it"""
+
+    def __init__(self, failures):
+        self.failures = dict(failures)
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        if self.failures.get(text, 0) > 0:
+            self.failures[text] -= 1
+            raise RuntimeError("429 Too Many Requests")
+
+
+def test_backoff_delay_grows_and_is_capped():
+    """Test exponential backoff bounds with full jitter"""
+    assert backoff_delay(0, base_delay=2, rng=lambda: 1.0) == 2
+    assert backoff_delay(3, base_delay=2, rng=lambda: 1.0) == 16
+    assert backoff_delay(10, base_delay=2, max_delay=60, rng=lambda: 1.0) == 60
+    assert backoff_delay(3, base_delay=2, rng=lambda: 0.0) == 0
+
+
+def test_only_failed_tweet_is_retried():
+    """Test that a failure retries that tweet alone and never reposts others"""
+    poster = FlakyPoster({"second": 2})
+    sleeps = []
+
+    posted, failed = post_tweets(
+        ["first", "second", "third"], poster, retries=5, sleep=sleeps.append
+    )
+
+    assert posted == ["first", "second", "third"]
+    assert failed == []
+    assert poster.calls == ["first", "second", "second", "second", "third"]
+    assert len(sleeps) == 2
+
+
+def test_tweet_gives_up_after_retries():
+    """Test that a tweet that keeps failing is reported without blocking the rest"""
+    poster = FlakyPoster({"first": 10})
+
+    posted, failed = post_tweets(
+        ["first", "second"], poster, retries=3, sleep=lambda _: None
+    )
+
+    assert posted == ["second"]
+    assert failed == ["first"]
+    assert poster.calls.count("first") == 3
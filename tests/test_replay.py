@@ -0,0 +1,126 @@
+import sys
+import os
+import datetime
+import threading
+import subprocess
+import pstats
+import pytest
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import cache, parsing, schedule, session
+from LouiesBurner.cache import PageCache
+from LouiesBurner.replay import FixtureStore, record, replay
+from LouiesBurner.sports import Soccer
+
+STATS_PAGE = (
+    "<html><body><table><thead><tr><th>Statistic</th><th>High</th><th>Player</th>"
+    "<th>Opponent</th></tr></thead><tbody><tr><td>GOALS</td><td>3</td>"
+    "<td>Jane Doe</td><td>Ferris State (9/5/2024)</td></tr></tbody></table></body></html>"
+)
+SCHEDULE_PAGE = (
+    '<table><tr class="sidearm-schedule-game"><td>September 5, 2024 (Thu)</td>'
+    "<td>Ferris State</td></tr></table>"
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (SCHEDULE_PAGE if "schedule" in self.path else STATS_PAGE).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(session, "_session", None)
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path / "pages"))
+    monkeypatch.setattr(parsing, "_table_index", {})
+    monkeypatch.setattr(schedule, "_schedules", {})
+
+
+def test_record_then_replay_offline(server, tmp_path):
+    """Test that recorded pages are served without the server"""
+    with record(tmp_path / "fixtures") as store:
+        live = session.fetch(f"{server}/sports/baseball/stats/2024").text
+    assert store.urls() == [f"{server}/sports/baseball/stats/2024"]
+
+    with replay(tmp_path / "fixtures"):
+        resp = session.fetch(f"{server}/sports/baseball/stats/2024")
+        assert (resp.status_code, resp.text) == (200, live)
+
+        # validators are kept so the page cache can revalidate
+        resp = session.fetch(
+            f"{server}/sports/baseball/stats/2024", headers={"If-None-Match": '"v1"'}
+        )
+        assert resp.status_code == 304
+
+        with pytest.raises(requests.ConnectionError):
+            session.fetch(f"{server}/sports/softball/stats/2024")
+
+    assert session.get_request_stats()[-2].bytes == len(live)
+
+
+def test_soccer_pipeline_replays_from_fixtures(tmp_path):
+    """Test a whole sport running against a fixture directory"""
+    store = FixtureStore(tmp_path / "fixtures")
+    soccer = Soccer(2024)
+    store.save(soccer.url, STATS_PAGE.encode(), 200, {})
+    store.save(soccer.schedule_url, SCHEDULE_PAGE.encode(), 200, {})
+
+    with replay(tmp_path / "fixtures"):
+        highs = soccer.get_season_highs_for_date(datetime.date(2024, 9, 6))
+
+    assert [(h["Player"], h["Statistic"], h["Value"]) for h in highs] == [
+        ("Jane Doe", "GOALS", 3)
+    ]
+    assert soccer.most_recent_game_date(datetime.date(2024, 9, 6)) == datetime.date(2024, 9, 5)
+
+
+def test_profile_covers_the_replay_command(tmp_path):
+    """Test that -profile writes a dump for commands other than run"""
+    store = FixtureStore(tmp_path / "fixtures")
+    soccer = Soccer(2024)
+    store.save(soccer.url, STATS_PAGE.encode(), 200, {})
+    store.save(soccer.schedule_url, SCHEDULE_PAGE.encode(), 200, {})
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    profile = tmp_path / "replay.prof"
+
+    subprocess.run(
+        [
+            sys.executable, "main.py", "replay", "-sport", "womens-soccer", "-year", "2024",
+            "-output", str(tmp_path / "replay.jsonl"), "-profile", str(profile),
+        ],
+        cwd=root,
+        env={
+            **os.environ,
+            "LOUIESBURNER_REPLAY_DIR": str(tmp_path / "fixtures"),
+            "LOUIESBURNER_CACHE_DIR": str(tmp_path / "cache"),
+        },
+        capture_output=True,
+        check=True,
+    )
+
+    stats = pstats.Stats(str(profile))
+    assert any(name == "replay" for _, _, name in stats.stats)
+    assert len((tmp_path / "replay.jsonl").read_text().splitlines()) == 1
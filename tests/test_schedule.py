@@ -0,0 +1,120 @@
+import sys
+import os
+import datetime
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import schedule
+from LouiesBurner.schedule import (
+    SCHEDULE_CSVS,
+    Game,
+    Schedule,
+    find_most_recent_past_date,
+    get_schedule,
+)
+
+
+SCHEDULE_PAGE = """
+<table>
+<tr class="sidearm-schedule-game"><td>September 12, 2024 (Thu)</td><td>Wayne State</td></tr>
+<tr class="sidearm-schedule-game"><td>September 5, 2024 (Thu)</td><td>Ferris State</td></tr>
+</table>
+"""
+
+
+def test_schedule_from_csv():
+    """Test loading an exported schedule csv"""
+    games = Schedule.from_csv(SCHEDULE_CSVS[("softball", 2025)])
+    first = games.games[0]
+    assert first == Game(
+        start=datetime.datetime(2024, 9, 27, 15, 0),
+        opponent="Aquinas",
+        location="Allendale, MI",
+        end=datetime.datetime(2024, 9, 27, 18, 0),
+    )
+    assert games.games[3].opponent == "Western Michigan University"
+    assert games.dates() == sorted(set(games.dates()))
+    # the end times of TBD games are placeholders
+    tbd = Schedule.from_csv(SCHEDULE_CSVS[("baseball", 2025)]).games[0]
+    assert tbd.start.time() == datetime.time() and tbd.end is None
+
+
+def test_schedule_bisect_queries():
+    """Test previous/next game and window queries"""
+    games = Schedule(
+        [
+            Game(datetime.datetime(2025, 3, 2, 13), "B"),
+            Game(datetime.datetime(2025, 3, 1, 13), "A"),
+            Game(datetime.datetime(2025, 3, 2, 16), "C"),
+            Game(datetime.datetime(2025, 3, 8, 12), "D"),
+        ]
+    )
+    assert [g.opponent for g in games] == ["A", "B", "C", "D"]
+
+    # dates mean midnight, so games on that day are not "previous"
+    assert games.previous_game(datetime.date(2025, 3, 2)).opponent == "A"
+    assert games.previous_game(datetime.datetime(2025, 3, 2, 14)).opponent == "B"
+    assert games.previous_game(datetime.date(2025, 3, 1)) is None
+    assert games.next_game(datetime.date(2025, 3, 3)).opponent == "D"
+    assert games.next_game(datetime.date(2025, 3, 9)) is None
+
+    window = games.games_between(datetime.date(2025, 3, 2), datetime.date(2025, 3, 8))
+    assert [g.opponent for g in window] == ["B", "C"]
+    assert games.dates() == [
+        datetime.date(2025, 3, 1),
+        datetime.date(2025, 3, 2),
+        datetime.date(2025, 3, 8),
+    ]
+
+
+def test_find_most_recent_past_date():
+    """Test that the latest past date is found and no past date is an error"""
+    assert find_most_recent_past_date(["09/05/2024", "01/01/2999", "09/12/2024"]) == "09/12/2024"
+    with pytest.raises(ValueError, match="no past games"):
+        find_most_recent_past_date(["01/01/2999"])
+
+def test_get_schedule_is_shared(monkeypatch):
+    """Test that one schedule instance is loaded per sport and season"""
+    monkeypatch.setattr(schedule, "_schedules", {})
+    fetched = []
+
+    def fake_fetch_page(sport, year, page, url=""):
+        fetched.append(url)
+        return SCHEDULE_PAGE
+
+    monkeypatch.setattr(schedule, "fetch_page", fake_fetch_page)
+
+    games = get_schedule("womens-soccer", 2024)
+    assert get_schedule("womens-soccer", 2024) is games
+    assert fetched == ["https://gvsulakers.com/sports/womens-soccer/schedule/2024?grid=true"]
+    assert games.previous_game(datetime.date(2024, 9, 10)).opponent == "Ferris State"
+
+    # seasons with an exported csv never fetch the page
+    assert len(get_schedule("baseball", 2025)) > 0
+    assert len(fetched) == 1
+
+
+def test_get_schedule_fetches_outside_the_lock(monkeypatch):
+    """Test that a season being fetched does not hold up other seasons"""
+    monkeypatch.setattr(schedule, "_schedules", {})
+    fetching, release = threading.Event(), threading.Event()
+    released = []
+
+    def slow_fetch_page(sport, year, page, url=""):
+        fetching.set()
+        released.append(release.wait(timeout=5))
+        return SCHEDULE_PAGE
+
+    monkeypatch.setattr(schedule, "fetch_page", slow_fetch_page)
+    loading = threading.Thread(target=get_schedule, args=("womens-soccer", 2024))
+    loading.start()
+    assert fetching.wait(timeout=5)
+    # would wait for the fetch to time out if it held the lock
+    assert len(get_schedule("womens-soccer", 2023, html=SCHEDULE_PAGE)) == 2
+    release.set()
+    loading.join()
+
+    assert released == [True]
+    assert len(get_schedule("womens-soccer", 2024)) == 2
@@ -0,0 +1,129 @@
+import sys
+import os
+import threading
+import datetime
+import time
+from collections import OrderedDict
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import cache, parsing, seasons
+from LouiesBurner.cache import PageCache
+from LouiesBurner.seasons import SeasonCollection
+from LouiesBurner.sports.baseball import Baseball
+
+
+def _page(year):
+    rows = "".join(
+        f"<tr><td>{stat}</td><td>{high}</td><td>{player}</td><td>{opponent}</td></tr>"
+        for stat, high, player, opponent in [
+            ("HITS", 4, "John Doe", f"Team A (3/15/{year})"),
+            ("STRIKEOUTS", 3, "Mary Smith", f"Team B (3/16/{year})"),
+        ]
+    )
+    head = "".join(f"<th>{h}</th>" for h in ("Statistic", "High", "Player", "Opponent"))
+    return (
+        "<html><body><table><tr><th>Player</th></tr></table>"
+        f"<table><thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table></body></html>"
+    )
+
+
+@pytest.fixture
+def fetched(tmp_path, monkeypatch):
+    """Stats pages served from memory, each fetch taking 0.2 seconds"""
+    fetched = []
+    lock = threading.Lock()
+
+    def fake_fetch(self):
+        with lock:
+            fetched.append(self.year)
+        time.sleep(0.2)
+        return _page(self.year)
+
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path))
+    monkeypatch.setattr(parsing, "_table_index", {})
+    monkeypatch.setattr(seasons, "_seasons", OrderedDict())
+    monkeypatch.setattr(Baseball, "_fetch_stats_html", fake_fetch)
+    return fetched
+
+
+def test_seasons_load_in_parallel_into_one_frame(fetched):
+    """Test that five seasons load in about the time of one and are tagged"""
+    collection = SeasonCollection("baseball", [2024, 2020, 2021, 2022, 2023, 2024], processes=0)
+    start = time.perf_counter()
+    collection.load()
+    # one after the other the fetches alone would take a second
+    assert time.perf_counter() - start < 0.8
+
+    frame = collection.frame()
+    assert sorted(fetched) == [2020, 2021, 2022, 2023, 2024]
+    assert collection.years == (2020, 2021, 2022, 2023, 2024)
+    assert list(frame.columns) == ["Season", "Statistic", "Value", "Player", "Opponent", "Date"]
+    assert frame["Season"].tolist() == [2020, 2020, 2021, 2021, 2022, 2022, 2023, 2023, 2024, 2024]
+    assert (frame["Date"].dt.year == frame["Season"]).all()
+
+    # strikeouts are not tweeted
+    assert [h.Date.year for h in collection.achievements()] == [2020, 2021, 2022, 2023, 2024]
+
+
+def test_seasons_are_memoized_in_a_bounded_lru(fetched, monkeypatch):
+    """Test that loaded seasons are shared and the oldest ones dropped"""
+    monkeypatch.setattr(seasons, "SEASON_CACHE_SIZE", 2)
+    first = SeasonCollection("baseball", [2022, 2023], processes=0).load()
+    second = SeasonCollection("baseball", [2023, 2024], processes=0).load()
+
+    assert sorted(fetched) == [2022, 2023, 2024]
+    assert second[2023] is first[2023]
+    assert list(seasons._seasons) == [("baseball", 2023), ("baseball", 2024)]
+
+    SeasonCollection("baseball", [2022], processes=0).load()
+    assert sorted(fetched) == [2022, 2022, 2023, 2024]
+    with pytest.raises(KeyError):
+        first[2021]
+
+
+def test_current_season_is_fetched_again(fetched):
+    """Test that the season still being played is never served from the LRU"""
+    current = datetime.date.today().year
+    SeasonCollection("baseball", [current - 1, current], processes=0).load()
+    SeasonCollection("baseball", [current - 1, current], processes=0).load()
+
+    assert sorted(fetched) == [current - 1, current, current]
+    assert list(seasons._seasons) == [("baseball", current - 1)]
+
+
+def test_failed_seasons_are_kept_as_errors(fetched, monkeypatch):
+    """Test that one failed fetch leaves the other seasons loaded"""
+    fetch = Baseball._fetch_stats_html
+
+    def flaky_fetch(self):
+        if self.year == 2022:
+            raise ConnectionError("stats page down")
+        return fetch(self)
+
+    monkeypatch.setattr(Baseball, "_fetch_stats_html", flaky_fetch)
+    collection = SeasonCollection("baseball", [2021, 2022, 2023], processes=0).load()
+
+    assert [season.year for season in collection] == [2021, 2023]
+    assert list(collection.errors) == [2022]
+    assert collection.frame()["Season"].unique().tolist() == [2021, 2023]
+    with pytest.raises(ConnectionError):
+        collection[2022]
+    assert ("baseball", 2022) not in seasons._seasons
+
+def test_seasons_parse_in_a_process_pool(fetched):
+    """Test that tables parsed by worker processes match the ones parsed here"""
+    pooled = SeasonCollection("baseball", [2022, 2023], processes=2).frame()
+    seasons._seasons.clear()
+    local = SeasonCollection("baseball", [2022, 2023], processes=0).frame()
+
+    assert pooled.equals(local)
+
+
+def test_unknown_sport_or_no_season():
+    """Test that a collection needs a known sport and a season"""
+    with pytest.raises(ValueError):
+        SeasonCollection("cricket", [2024])
+    with pytest.raises(ValueError):
+        SeasonCollection("baseball", [])
@@ -0,0 +1,57 @@
+import sys
+import os
+import gzip
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import session
+
+BODY = b"<html>" + b"<tr><td>HITS</td></tr>" * 500 + b"</html>"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        body = BODY
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(BODY)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_reuses_connection_and_records_cost(server, monkeypatch):
+    """Test that requests share one keep-alive connection and record byte counts"""
+    monkeypatch.setattr(session, "_session", None)
+    session.reset_request_stats()
+    Handler.connections.clear()
+
+    for _ in range(3):
+        assert session.fetch(f"{server}/stats").content == BODY
+
+    stats = session.get_request_stats()
+    assert len(stats) == 3
+    assert len(Handler.connections) == 1
+    assert all(s.bytes == len(BODY) and s.wire_bytes < s.bytes for s in stats)
+    assert "3 requests" in session.summarize_request_stats()
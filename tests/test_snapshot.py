@@ -0,0 +1,91 @@
+import sys
+import os
+import datetime
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner import cache, parsing
+from LouiesBurner.cache import PageCache
+from LouiesBurner.snapshot import Snapshot, SnapshotStore, diff_rows, table_hash
+from LouiesBurner.sports.baseball import Baseball
+
+
+def _page(rows):
+    head = "".join(f"<th>{h}</th>" for h in ["Statistic", "High", "Player", "Opponent"])
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows)
+    return (
+        "<html><body><script>var now = {};</script>"
+        f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+        "</body></html>"
+    )
+
+
+ROWS = [
+    ["HITS", 4, "John Doe", "Team A (3/15/2024)"],
+    ["WILD PITCHES", 3, "Tom Lee", "Team A (3/15/2024)"],
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path))
+    monkeypatch.setattr(parsing, "_table_index", {})
+
+
+def test_table_hash_ignores_the_rest_of_the_page():
+    """Test that only the season high tables are hashed"""
+    page = _page(ROWS)
+    assert table_hash(page) == table_hash(page.replace("var now = {}", "var now = 1"))
+    assert table_hash(page) != table_hash(_page(ROWS[:1]))
+
+
+def test_diff_rows_reports_added_and_changed():
+    """Test row-level diff on (Statistic, Player, Opponent)"""
+    old = Snapshot("a", (("HITS", "John Doe", "Team A", "4"), ("RBIS", "Amy Brown", "Team B", "5")))
+    new = Snapshot(
+        "b",
+        (
+            ("HITS", "John Doe", "Team A", "4"),
+            ("RBIS", "Amy Brown", "Team B", "6"),
+            ("HITS", "Jane Smith", "Team C", "4"),
+        ),
+    )
+    assert diff_rows(old, new) == [new.rows[1], new.rows[2]]
+    assert diff_rows(None, new) == list(new.rows)
+
+
+def test_diff_season_highs_finds_late_stats_and_skips_unchanged(monkeypatch):
+    """Test that highs are found regardless of date and unchanged tables are not parsed"""
+    page = {"html": _page(ROWS)}
+    monkeypatch.setattr(Baseball, "_fetch_stats_html", lambda self: page["html"])
+
+    snapshot, highs = Baseball(2024).diff_season_highs(None)
+    # wild pitches are never tweeted
+    assert [h["Player"] for h in highs] == ["John Doe"]
+
+    def no_parse(self, html):
+        raise AssertionError("unchanged tables were parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(Baseball, "_read_season_high_df", no_parse)
+        assert Baseball(2024).diff_season_highs(snapshot) == (snapshot, [])
+
+    # a tie from two weeks ago entered late
+    page["html"] = _page(ROWS + [["HITS", 4, "Jane Smith", "Team B (3/1/2024)"]])
+    _, highs = Baseball(2024).diff_season_highs(snapshot)
+    assert [(h["Player"], h["Date"]) for h in highs] == [
+        ("Jane Smith", datetime.date(2024, 3, 1))
+    ]
+
+
+def test_store_commits_only_staged_snapshots(tmp_path):
+    """Test that snapshots are written on commit, not when staged"""
+    store = SnapshotStore(tmp_path / "snapshots")
+    snapshot = Snapshot("abc", (("HITS", "John Doe", "Team A", "4"),))
+
+    store.stage("baseball", 2024, snapshot)
+    assert store.load("baseball", 2024) is None
+
+    store.commit("baseball", 2024)
+    assert SnapshotStore(tmp_path / "snapshots").load("baseball", 2024) == snapshot
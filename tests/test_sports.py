@@ -8,6 +8,9 @@ sys.path.append(os.path.abspath(".."))
 
 from LouiesBurner.sports.baseball import Baseball
 from LouiesBurner.sports.softball import Softball
+from LouiesBurner.sports.soccer import Soccer
+from LouiesBurner.sports import SPORTS
+from LouiesBurner import schedule
 
 
 def test_baseball_initialization():
@@ -184,3 +187,127 @@ def test_softball_integration():
     assert "4" in tweet
     assert "hits" in tweet
     assert "#AnchorUp" in tweet
+
+
+def test_season_highs_with_ties():
+    """Test that tied season highs are split into one achievement per player"""
+    baseball = Baseball(2024)
+    baseball._szn_high_df = pd.DataFrame(
+        {
+            "Statistic": ["HITS", "RUNS SCORED", "WILD PITCHES"],
+            "High": [3, 2, 2],
+            "Player": ["John Doe; Jane Smith; Bob Johnson", "Amy Brown", "Tom Lee"],
+            "Opponent": [
+                "Team A (3/15/2024); Team B (3/14/2024)",
+                "Team C (3/15/2024)",
+                "Team D (3/15/2024)",
+            ],
+        }
+    )
+
+    highs = baseball.get_season_highs_for_date(datetime.date(2024, 3, 16))
+
+    # Bob Johnson has no matching opponent, Tom Lee's stat is negative
+    assert [(h["Statistic"], h["Player"]) for h in highs] == [
+        ("HITS", "John Doe"),
+        ("RUNS SCORED", "Amy Brown"),
+    ]
+    assert highs[0]["Opponent"] == "Team A (3/15/2024)"
+    assert highs[0]["Date"] == datetime.date(2024, 3, 15)
+
+
+def test_season_highs_for_range():
+    """Test that a date range is answered from the per-date index"""
+    softball = Softball(2024)
+    softball._szn_high_df = pd.DataFrame(
+        {
+            "Statistic": ["HITS", "WALKS", "STRIKEOUTS"],
+            "High": [4, 3, 2],
+            "Player": ["Jane Smith", "Sarah Jones", "Amy Brown"],
+            "Opponent": ["Team X (3/15/2024)", "Team Y (3/17/2024)", "Team Z (3/16/2024)"],
+        }
+    )
+
+    highs = softball.get_season_highs_for_range(
+        datetime.date(2024, 3, 15), datetime.date(2024, 3, 20)
+    )
+
+    assert list(highs) == [datetime.date(2024, 3, 16), datetime.date(2024, 3, 18)]
+    assert highs[datetime.date(2024, 3, 18)][0]["Player"] == "Sarah Jones"
+    for date, on_date in highs.items():
+        assert on_date == softball.get_season_highs_for_date(date)
+    assert softball.season_highs_by_date is softball.season_highs_by_date
+
+
+SOCCER_STATS_PAGE = """
+<html><body>
+<section id="game-results"><table><tbody>
+<tr><td>09/05/2024</td><td><a href="#">Ferris State</a></td><td>W</td>
+<td data-label="Score">2-1</td><td data-label="Attend">512</td>
+<td data-label="Goals Scored [Assist]"><span>Bearden, Kennedy (1) [Smith]</span><span>Doe, Jane (1)</span></td>
+<td data-label="Overall">(1-0-0, 0-0-0)</td><td data-label="Conference">0-0-0</td></tr>
+</tbody></table></section>
+</body></html>
+"""
+
+SOCCER_SCHEDULE_PAGE = """
+<table>
+<tr class="sidearm-schedule-game"><td>September 5, 2024 (Thu)</td><td>Ferris State</td></tr>
+<tr class="sidearm-schedule-game"><td>September 12, 2024 (Thu)</td><td>Wayne State</td></tr>
+</table>
+"""
+
+
+def test_soccer_initialization():
+    """Test Soccer class initialization"""
+    soccer = Soccer(2024)
+    assert soccer.year == 2024
+    assert soccer.sport == "womens-soccer"
+    assert soccer.url == "https://gvsulakers.com/sports/womens-soccer/stats/2024"
+    assert soccer.schedule_url.endswith("/womens-soccer/schedule/2024?grid=true")
+    assert SPORTS["womens-soccer"] is Soccer
+
+
+def test_soccer_game_summaries(monkeypatch):
+    """Test that a game on the previous day becomes one summary tweet"""
+    monkeypatch.setattr(schedule, "_schedules", {})
+    soccer = Soccer(2024)
+    soccer._pages = {"stats": SOCCER_STATS_PAGE, "schedule": SOCCER_SCHEDULE_PAGE}
+
+    assert soccer.most_recent_game_date(datetime.date(2024, 9, 10)) == datetime.date(2024, 9, 5)
+
+    (tweet,) = soccer.get_game_summaries(datetime.date(2024, 9, 6))
+    assert tweet.startswith("GVSU Women's Soccer(W) Vs. Ferris State 09/05/2024")
+    assert "Bearden, Kennedy\n        Doe, Jane" in tweet
+    assert "| Fans in Attendance: 512" in tweet
+    assert soccer.get_game_summaries(datetime.date(2024, 9, 13)) == []
+
+
+def test_soccer_without_season_high_tables():
+    """Test that a stats page without season high tables has no highs"""
+    soccer = Soccer(2024)
+    soccer._pages = {"stats": SOCCER_STATS_PAGE, "schedule": SOCCER_SCHEDULE_PAGE}
+    assert soccer.get_season_highs_for_date(datetime.date(2024, 9, 6)) == []
+
+
+def test_soccer_with_season_high_tables(tmp_path, monkeypatch):
+    """Test that soccer loads highs when the stats page has season high tables"""
+    from LouiesBurner import cache, parsing
+    from LouiesBurner.cache import PageCache
+
+    monkeypatch.setattr(cache, "_default_cache", PageCache(tmp_path))
+    monkeypatch.setattr(parsing, "_table_index", {})
+    highs_table = (
+        "<table><thead><tr><th>Statistic</th><th>High</th><th>Player</th>"
+        "<th>Opponent</th></tr></thead><tbody><tr><td>Goals</td><td>3</td>"
+        "<td>Bearden, Kennedy</td><td>Ferris State (9/5/2024)</td></tr></tbody></table>"
+    )
+    soccer = Soccer(2024)
+    soccer._pages = {
+        "stats": SOCCER_STATS_PAGE + highs_table,
+        "schedule": SOCCER_SCHEDULE_PAGE,
+    }
+
+    (high,) = soccer.get_season_highs_for_date(datetime.date(2024, 9, 6))
+    assert (high["Player"], high["Value"]) == ("Bearden, Kennedy", 3)
+    assert soccer.season_high_idxs == [len(parsing.split_tables(SOCCER_STATS_PAGE))]
@@ -0,0 +1,100 @@
+import sys
+import os
+import pytest
+
+sys.path.append(os.path.abspath(".."))
+
+from LouiesBurner.templates import (
+    BASEBALL,
+    TEMPLATES,
+    TWEET_LIMIT,
+    TemplateSet,
+    TweetTooLong,
+    get_templates,
+    tweet_length,
+)
+from LouiesBurner.sports.baseball import Baseball
+from LouiesBurner.sports.soccer import Soccer
+
+
+def make_high(stat="Hits", value=4, player="John Doe", opponent="Team A (3/15/2024)"):
+    return {"Player": player, "Value": value, "Statistic": stat, "Opponent": opponent}
+
+
+def test_tweet_length_weights_emoji_and_wide_characters():
+    """Test that tweet_length counts like X: emoji and CJK twice, Latin once"""
+    assert tweet_length("Hello #AnchorUp") == 15
+    assert tweet_length("⚓") == 2
+    # the variation selector belongs to the emoji
+    assert tweet_length("⚡️") == 2
+    assert tweet_length("日本") == 4
+    assert tweet_length("é") == 1
+
+
+def test_registry_falls_back_to_default():
+    """Test that unknown sports get the default templates"""
+    assert get_templates("baseball") is BASEBALL
+    assert get_templates("womens-soccer") is TEMPLATES["default"]
+
+
+def test_render_matches_str_format():
+    """Test that a precompiled template renders like str.format"""
+    templates = TemplateSet(
+        single=["{player} {verb} {value} {stat_type} vs {opponent} {{x}} {hashtags}"],
+        multi=["{player}: {achievements} vs {opponent}"],
+        fallback="{player}",
+        fallback_multi="{player}",
+        verbs={"hits": "racked up"},
+    )
+    assert templates.render([make_high()]) == (
+        "John Doe racked up 4 hits vs Team A {x} #AnchorUp"
+    )
+    assert templates.render([make_high(), make_high("RBIs", 6)]) == (
+        "John Doe: 4 hits and 6 rbis vs Team A"
+    )
+
+
+def test_render_uses_fallback_when_templates_are_too_long():
+    """Test that an over-long tweet is replaced by the compact fallback"""
+    high = make_high(player="X" * 215)
+    tweet = BASEBALL.render([high])
+    assert tweet_length(tweet) <= TWEET_LIMIT
+    assert tweet.startswith("X" * 215 + ": season high 4 hits")
+    assert "#GLVCbsb" in tweet
+
+    with pytest.raises(TweetTooLong):
+        BASEBALL.render([make_high(player="X" * 300)])
+
+
+def test_render_all_splits_groups_that_do_not_fit():
+    """Test that a player's highs are split over tweets rather than dropped"""
+    stats = [f"Some Very Long Statistic Name {n}" for n in range(12)]
+    group = [make_high(stat, 10 + n) for n, stat in enumerate(stats)]
+    groups, tweets = BASEBALL.render_all([group])
+
+    assert len(tweets) > 1
+    assert len(groups) == len(tweets)
+    assert [h for g in groups for h in g] == group
+    assert all(tweet_length(t) <= TWEET_LIMIT for t in tweets)
+
+
+def test_compose_all_groups_by_player():
+    """Test that compose_all renders one tweet per player, sorted by player"""
+    highs = [
+        make_high("Hits", 4, player="Zed Smith"),
+        make_high("Hits", 3, player="Al Jones"),
+        make_high("RBIs", 5, player="Zed Smith"),
+    ]
+    groups, tweets = Baseball(2024).compose_all(highs)
+
+    assert [g[0]["Player"] for g in groups] == ["Al Jones", "Zed Smith"]
+    assert len(groups[1]) == 2
+    assert "Al Jones" in tweets[0] and "Zed Smith" in tweets[1]
+    assert "Team A" in tweets[0] and "(3/15/2024)" not in tweets[0]
+
+
+def test_soccer_uses_default_templates():
+    """Test that sports without templates of their own use the defaults"""
+    tweet = Soccer(2024).create_tweet_text([make_high("Goals", 3)])
+    assert "3 goals" in tweet
+    assert "#AnchorUp" in tweet
@@ -0,0 +1,87 @@
+import sys
+import os
+import io
+import json
+import datetime
+from collections import deque
+import pytest
+import pandas as pd
+
+sys.path.append(os.path.abspath(".."))
+
+import main
+from LouiesBurner import timing
+from LouiesBurner.sports.baseball import Baseball
+
+
+@pytest.fixture(autouse=True)
+def fresh_timings():
+    timing.reset_timings()
+    yield
+    timing.configure(None)
+
+
+def test_stage_writes_json_lines_even_on_error():
+    """Test that every stage is written as one JSON line with its counts"""
+    sink = io.StringIO()
+    timing.configure(sink)
+
+    with timing.stage("parse", sport="baseball") as record:
+        record["rows"] = 3
+    with pytest.raises(ValueError):
+        with timing.stage("fetch", sport="baseball"):
+            raise ValueError("boom")
+
+    lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [(r["stage"], r.get("rows"), r.get("error")) for r in lines] == [
+        ("parse", 3, None),
+        ("fetch", None, "ValueError"),
+    ]
+    assert all(r["seconds"] >= 0 and r["sport"] == "baseball" for r in lines)
+    assert timing.get_timings() == lines
+
+
+def test_pipeline_stages_are_recorded():
+    """Test that extraction, grouping and composition report their counts"""
+    baseball = Baseball(2024)
+    baseball._szn_high_df = pd.DataFrame(
+        {
+            "Statistic": ["HITS", "RBIS"],
+            "High": [4, 6],
+            "Player": ["John Doe", "John Doe"],
+            "Opponent": ["Team A (3/15/2024)", "Team A (3/15/2024)"],
+        }
+    )
+    highs = baseball.get_season_highs_for_date(datetime.date(2024, 3, 16))
+    main.compose_tweets(baseball, highs)
+
+    records = {r["stage"]: r for r in timing.get_timings()}
+    assert records["extract"]["highs"] == 2
+    assert records["group"]["groups"] == 1
+    assert records["compose"]["tweets"] == 1
+
+
+def test_records_are_bounded_and_sink_files_closed(tmp_path, monkeypatch):
+    """Test that only the latest stages are kept and a replaced sink file is closed"""
+    monkeypatch.setattr(timing, "_records", deque(maxlen=2))
+    path = tmp_path / "timings.jsonl"
+    timing.configure(str(path))
+    first = timing._sink
+
+    for name in ("fetch", "parse", "post"):
+        with timing.stage(name):
+            pass
+    timing.configure(str(tmp_path / "other.jsonl"))
+
+    assert [r["stage"] for r in timing.get_timings()] == ["parse", "post"]
+    assert first.closed
+    assert len(path.read_text().splitlines()) == 3
+
+
+def test_fetch_stage_counts_bytes_not_characters(monkeypatch):
+    """Test that the fetch record holds the encoded size of the page"""
+    monkeypatch.setattr(Baseball, "_fetch_stats_html", lambda self: "Hernández")
+    Baseball(2024)._fetch_stats_html_timed()
+
+    (record,) = [r for r in timing.get_timings() if r["stage"] == "fetch"]
+    assert record["bytes"] == 10
@@ -1,11 +1,26 @@
 import sys
 import os
+import gc
+import weakref
 import pytest
 from bs4 import BeautifulSoup
 
 sys.path.append(os.path.abspath(".."))
 
 from LouiesBurner.utils import ROOT_URL, VALID_SPORTS, VALID_PAGES
+from LouiesBurner.scraping import (
+    STATS_STRAINER,
+    get_all_player_stats,
+    get_game_data_by_date,
+    get_game_data_for_season,
+    get_game_log,
+    get_offensive_stats_by_date,
+    get_offensive_stats_for_season,
+    get_player_index,
+    get_player_names,
+    get_player_stats_by_name,
+    parse_soup,
+)
 
 
 def test_valid_sports():
@@ -28,3 +43,131 @@ def test_root_url_formatting():
     """Test that ROOT_URL formats correctly with a sport"""
     formatted_url = ROOT_URL.format(sport="baseball")
     assert formatted_url == "https://gvsulakers.com/sports/baseball"
+
+
+STATS_PAGE = """
+<section id="game-results"><table>
+<thead><tr><th>Date</th><th>Opponent</th><th>W/L</th><th>Score</th></tr></thead>
+<tbody>
+<tr><td>09/05/2024</td><td><a href="#">Ferris State</a></td><td>W</td>
+<td data-label="Score">2-1</td><td data-label="Attend">512</td>
+<td data-label="Goals Scored [Assist]"><span>Bearden, Kennedy (1) [Smith]</span><span>Doe, Jane (1)</span></td>
+<td data-label="Overall">(1-0-0, 0-0-0)</td><td data-label="Conference">0-0-0</td></tr>
+<tr><td>09/07/2024</td><td><a href="#">Wayne State</a></td><td>L</td>
+<td data-label="Score">0-1</td><td data-label="Attend">300</td>
+<td data-label="Goals Scored [Assist]"></td>
+<td data-label="Overall">(1-1-0, 0-1-0)</td><td data-label="Conference">0-1-0</td></tr>
+</tbody></table></section>
+<section id="game-game-our-offensive"><table>
+<tbody>
+<tr><td>09/05/2024</td><td>vsFerris State</td><td data-label="Score">2-1</td>
+<td data-label="G">2</td><td data-label="A">1</td><td data-label="PTS">5</td>
+<td data-label="SH">14</td><td data-label="Shot%">0.143</td><td data-label="SOG">7</td>
+<td data-label="SOG%">.500</td><td data-label="YC-RC">1-0</td><td data-label="GW">1</td>
+<td data-label="PK-ATT">0-0</td><td>90:00</td></tr>
+</tbody></table></section>
+"""
+
+
+def test_game_data_by_date():
+    """Test game results lookup by date"""
+    soup = BeautifulSoup(STATS_PAGE, "html.parser")
+    game = get_game_data_by_date(soup, "09/05/2024")
+    assert game["Opponent"] == "Ferris State"
+    assert game["Outcome"] == "W"
+    assert game["Attendance"] == "512"
+    assert game["Goal Scorers"] == ["Bearden, Kennedy", "Doe, Jane"]
+    assert game["Overall Record"] == "1-0-0"
+    assert get_game_data_by_date(soup, "01/01/2024") == {}
+
+
+def test_offensive_stats_by_date():
+    """Test offensive game stats lookup by date"""
+    soup = BeautifulSoup(STATS_PAGE, "html.parser")
+    stats = get_offensive_stats_by_date(soup, "09/05/2024")
+    assert stats["Opponent"] == "Ferris State"
+    assert stats["Shot%"] == 14.3
+    assert (stats["YC"], stats["RC"]) == ("1", "0")
+    assert stats["Minutes"] == "90:00"
+    assert get_offensive_stats_by_date(soup, "01/01/2024") == "No data found for this date."
+
+
+def test_game_log_is_parsed_once_per_soup():
+    """Test that every query on a soup shares one indexed GameLog"""
+    soup = BeautifulSoup(STATS_PAGE, "html.parser")
+    game_log = get_game_log(soup, "game-results")
+    assert game_log is get_game_log(soup, "game-results")
+    assert game_log.dates == ["09/05/2024", "09/07/2024"]
+    assert game_log.columns["Attend"] == 4
+
+    season = get_game_data_for_season(soup)
+    assert list(season) == game_log.dates
+    assert season["09/07/2024"] == get_game_data_by_date(soup, "09/07/2024")
+    assert list(get_offensive_stats_for_season(soup)) == ["09/05/2024"]
+
+
+def test_game_log_holds_text_not_the_soup():
+    """Test that indexed rows are plain text, so the soup can be freed"""
+    soup = BeautifulSoup(STATS_PAGE, "html.parser")
+    game_log = get_game_log(soup, "game-results")
+    (row,) = game_log.rows["09/05/2024"]
+    assert game_log.text(row, "Attend") == row.texts[4]
+    assert all(isinstance(text, str) for text in row.texts)
+
+    soup_ref = weakref.ref(soup)
+    del soup
+    gc.collect()
+    assert soup_ref() is None
+    assert get_game_data_by_date(BeautifulSoup(STATS_PAGE, "html.parser"), "09/05/2024")
+
+
+def test_strained_lxml_soup_matches_full_parse():
+    """Test that restricting the tree to the scraped sections changes nothing"""
+    full = BeautifulSoup("<html><body><nav>menu</nav>" + STATS_PAGE, "html.parser")
+    strained = parse_soup("<html><body><nav>menu</nav>" + STATS_PAGE, STATS_STRAINER)
+
+    assert strained.find("nav") is None
+    assert get_game_data_for_season(strained) == get_game_data_for_season(full)
+    assert get_offensive_stats_for_season(strained) == get_offensive_stats_for_season(full)
+
+
+def _player_row(name, goals):
+    cells = {
+        "GP": 10, "GS": 9, "MIN": 800, "G": goals, "A": 2, "PTS": 2 * goals + 2,
+        "SH": 20, "SH%": "0.250", "SOG": 12, "SOG%": "0.600", "YC-RC": "1-0",
+        "GW": 1, "PG-PA": "0-0",
+    }  # fmt: skip
+    tds = "".join(f'<td data-label="{k}">{v}</td>' for k, v in cells.items())
+    return f'<tr><td><a href="#">{name}</a></td>{tds}</tr>'
+
+
+PLAYERS_PAGE = (
+    '<section id="individual-overall-offensive"><table><tbody>'
+    + _player_row("Bearden, Kennedy", 5)
+    + _player_row("Núñez, Sofía", 3)
+    + "<tr><td>Total</td></tr>"
+    + "</tbody></table></section>"
+)
+
+
+def test_all_player_stats_parsed_once():
+    """Test the bulk player stats index"""
+    soup = BeautifulSoup(PLAYERS_PAGE, "html.parser")
+    assert get_player_index(soup) is get_player_index(soup)
+
+    all_stats = get_all_player_stats(soup)
+    assert list(all_stats) == ["Bearden, Kennedy", "Núñez, Sofía"]
+    assert all_stats["Bearden, Kennedy"]["G"] == 5
+    assert all_stats["Bearden, Kennedy"]["SH%"] == 25.0
+    assert get_player_names(soup) == list(all_stats)
+
+
+def test_player_stats_by_name_matching():
+    """Test exact, normalized and partial player name lookups"""
+    soup = BeautifulSoup(PLAYERS_PAGE, "html.parser")
+    exact = get_player_stats_by_name(soup, "Bearden, Kennedy")
+    assert exact["Bearden, Kennedy"]["G"] == 5
+    assert get_player_stats_by_name(soup, "kennedy bearden")["kennedy bearden"]["G"] == 5
+    assert get_player_stats_by_name(soup, "Sofia Nunez")["Sofia Nunez"]["G"] == 3
+    assert get_player_stats_by_name(soup, "Bearden")["Bearden"]["G"] == 5
+    assert get_player_stats_by_name(soup, "Nobody, Here") == {}